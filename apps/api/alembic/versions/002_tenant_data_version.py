@@ -0,0 +1,30 @@
+"""tenant data version for HTTP caching
+
+Revision ID: 002
+Revises: 001
+Create Date: 2025-10-20 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'tenants',
+        sa.Column('data_version', sa.BigInteger(), nullable=False, server_default='0'),
+    )
+    op.add_column('tenants', sa.Column('data_changed_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('tenants', 'data_changed_at')
+    op.drop_column('tenants', 'data_version')
@@ -0,0 +1,171 @@
+"""partition items and runs by month
+
+Revision ID: 003
+Revises: 002
+Create Date: 2025-10-22 09:00:00.000000
+
+Converts ``items`` (by ``discovered_at``) and ``runs`` (by ``started_at``) to
+monthly range partitioned tables, with a default partition as a safety net.
+
+Postgres requires unique constraints on a partitioned table to include the
+partition key, so ``uix_site_canonical (site_id, canonical_url)`` can't stay
+on ``items``. It moves to the new ``item_keys`` table, which ingestion
+inserts into first (ON CONFLICT DO NOTHING) so the per-site dedup guarantee
+is unchanged and survives dropping old item partitions.
+
+Rewrites both tables; run during a maintenance window on large databases.
+"""
+from datetime import date, datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTHS_AHEAD = 3
+
+
+def _add_months(value: date, months: int) -> date:
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _create_month_partitions(table: str, column: str) -> None:
+    """Create monthly partitions covering existing legacy rows through MONTHS_AHEAD."""
+    oldest = op.get_bind().execute(sa.text(f"SELECT min({column}) FROM {table}_legacy")).scalar()
+    today = datetime.utcnow()
+    month = date((oldest or today).year, (oldest or today).month, 1)
+    last = _add_months(date(today.year, today.month, 1), MONTHS_AHEAD)
+
+    while month <= last:
+        end = _add_months(month, 1)
+        op.execute(
+            f"CREATE TABLE {table}_p{month:%Y_%m} PARTITION OF {table} "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{end.isoformat()}')"
+        )
+        month = end
+
+    op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+
+
+def upgrade() -> None:
+    # Runs
+    op.execute("ALTER TABLE runs RENAME TO runs_legacy")
+    op.execute("ALTER INDEX runs_pkey RENAME TO runs_legacy_pkey")
+    op.execute("""
+        CREATE TABLE runs (
+            id UUID NOT NULL,
+            site_id UUID NOT NULL REFERENCES sites (id),
+            status runstatus NOT NULL,
+            method VARCHAR,
+            pages_scanned INTEGER,
+            duration_ms INTEGER,
+            diagnostics_json JSON,
+            started_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT (now() AT TIME ZONE 'utc'),
+            finished_at TIMESTAMP WITHOUT TIME ZONE,
+            PRIMARY KEY (id, started_at)
+        ) PARTITION BY RANGE (started_at)
+    """)
+    _create_month_partitions('runs', 'started_at')
+    op.execute("""
+        INSERT INTO runs
+        SELECT id, site_id, status, method, pages_scanned, duration_ms, diagnostics_json,
+               COALESCE(started_at, now() AT TIME ZONE 'utc'), finished_at
+        FROM runs_legacy
+    """)
+    op.execute("DROP TABLE runs_legacy")
+    op.create_index('ix_runs_site_started', 'runs', ['site_id', 'started_at'])
+
+    # Items
+    op.execute("ALTER TABLE items RENAME TO items_legacy")
+    op.execute("ALTER TABLE items_legacy DROP CONSTRAINT uix_site_canonical")
+    op.execute("ALTER INDEX items_pkey RENAME TO items_legacy_pkey")
+    op.execute("""
+        CREATE TABLE items (
+            id UUID NOT NULL,
+            site_id UUID NOT NULL REFERENCES sites (id),
+            url VARCHAR NOT NULL,
+            canonical_url VARCHAR,
+            title VARCHAR,
+            published_at TIMESTAMP WITHOUT TIME ZONE,
+            discovered_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT (now() AT TIME ZONE 'utc'),
+            source VARCHAR,
+            meta_json JSON,
+            PRIMARY KEY (id, discovered_at)
+        ) PARTITION BY RANGE (discovered_at)
+    """)
+    _create_month_partitions('items', 'discovered_at')
+    op.execute("""
+        INSERT INTO items
+        SELECT id, site_id, url, canonical_url, title, published_at,
+               COALESCE(discovered_at, now() AT TIME ZONE 'utc'), source, meta_json
+        FROM items_legacy
+    """)
+    op.execute("DROP TABLE items_legacy")
+    op.create_index('ix_items_site_discovered', 'items', ['site_id', 'discovered_at'])
+
+    # Dedup keys
+    op.create_table(
+        'item_keys',
+        sa.Column('site_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('canonical_url', sa.String(), nullable=False),
+        sa.Column('item_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('discovered_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['site_id'], ['sites.id'], ),
+        sa.PrimaryKeyConstraint('site_id', 'canonical_url', name='uix_site_canonical')
+    )
+    op.execute("""
+        INSERT INTO item_keys (site_id, canonical_url, item_id, discovered_at)
+        SELECT site_id, canonical_url, id, discovered_at FROM items
+        WHERE canonical_url IS NOT NULL
+        ON CONFLICT DO NOTHING
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('item_keys')
+
+    op.execute("ALTER TABLE items RENAME TO items_partitioned")
+    op.execute("ALTER INDEX items_pkey RENAME TO items_partitioned_pkey")
+    op.create_table(
+        'items',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('site_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('url', sa.String(), nullable=False),
+        sa.Column('canonical_url', sa.String(), nullable=True),
+        sa.Column('title', sa.String(), nullable=True),
+        sa.Column('published_at', sa.DateTime(), nullable=True),
+        sa.Column('discovered_at', sa.DateTime(), nullable=True),
+        sa.Column('source', sa.String(), nullable=True),
+        sa.Column('meta_json', postgresql.JSON(astext_type=sa.Text()), nullable=True),
+        sa.ForeignKeyConstraint(['site_id'], ['sites.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('site_id', 'canonical_url', name='uix_site_canonical')
+    )
+    op.execute("INSERT INTO items SELECT * FROM items_partitioned")
+    op.execute("DROP TABLE items_partitioned")
+
+    op.execute("ALTER TABLE runs RENAME TO runs_partitioned")
+    op.execute("ALTER INDEX runs_pkey RENAME TO runs_partitioned_pkey")
+    op.create_table(
+        'runs',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('site_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('status', postgresql.ENUM('running', 'success', 'error', name='runstatus', create_type=False), nullable=False),
+        sa.Column('method', sa.String(), nullable=True),
+        sa.Column('pages_scanned', sa.Integer(), nullable=True),
+        sa.Column('duration_ms', sa.Integer(), nullable=True),
+        sa.Column('diagnostics_json', postgresql.JSON(astext_type=sa.Text()), nullable=True),
+        sa.Column('started_at', sa.DateTime(), nullable=True),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['site_id'], ['sites.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.execute("INSERT INTO runs SELECT * FROM runs_partitioned")
+    op.execute("DROP TABLE runs_partitioned")
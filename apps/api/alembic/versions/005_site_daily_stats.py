@@ -0,0 +1,39 @@
+"""site daily stats rollup
+
+Revision ID: 005
+Revises: 004
+Create Date: 2025-10-27 09:00:00.000000
+
+Populate from history afterwards with ``python -m app.jobs.rollups``.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'site_daily_stats',
+        sa.Column('site_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('items_new', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('runs_total', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('runs_success', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('runs_error', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('duration_ms_total', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('pages_scanned', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.ForeignKeyConstraint(['site_id'], ['sites.id'], ),
+        sa.PrimaryKeyConstraint('site_id', 'day')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('site_daily_stats')
@@ -0,0 +1,32 @@
+"""tenant keywords and item keyword matches
+
+Revision ID: 006
+Revises: 005
+Create Date: 2025-10-29 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('tenants', sa.Column('keywords', postgresql.ARRAY(sa.Text()), nullable=True))
+    op.add_column('items', sa.Column('matched_keywords', postgresql.ARRAY(sa.Text()), nullable=True))
+    op.create_index(
+        'ix_items_matched_keywords', 'items', ['matched_keywords'], postgresql_using='gin'
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_items_matched_keywords', table_name='items')
+    op.drop_column('items', 'matched_keywords')
+    op.drop_column('tenants', 'keywords')
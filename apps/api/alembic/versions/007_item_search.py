@@ -0,0 +1,46 @@
+"""full-text search over items
+
+Revision ID: 007
+Revises: 006
+Create Date: 2025-10-31 09:00:00.000000
+
+Adds a stored generated ``search_vector`` column (title, URL words, metadata)
+and a GIN index. Adding a stored column rewrites every ``items`` partition;
+run during a maintenance window on large databases.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Mirrors app.models.ITEM_SEARCH_DOCUMENT at the time of this revision
+SEARCH_DOCUMENT = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', regexp_replace(url, '[^[:alnum:]]+', ' ', 'g')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(CAST(meta_json AS text), '')), 'C')"
+)
+
+
+def upgrade() -> None:
+    op.add_column(
+        'items',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_DOCUMENT, persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index('ix_items_search', 'items', ['search_vector'], postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_items_search', table_name='items')
+    op.drop_column('items', 'search_vector')
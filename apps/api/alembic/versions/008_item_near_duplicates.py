@@ -0,0 +1,38 @@
+"""item near-duplicate detection
+
+Revision ID: 008
+Revises: 007
+Create Date: 2025-11-03 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '008'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('items', sa.Column('minhash', postgresql.ARRAY(sa.BigInteger()), nullable=True))
+    op.add_column('items', sa.Column('duplicate_of', postgresql.UUID(as_uuid=True), nullable=True))
+    op.create_table(
+        'item_minhash_bands',
+        sa.Column('tenant_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('band_key', sa.BigInteger(), nullable=False),
+        sa.Column('item_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('discovered_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['tenant_id'], ['tenants.id'], ),
+        sa.PrimaryKeyConstraint('tenant_id', 'band_key', 'item_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('item_minhash_bands')
+    op.drop_column('items', 'duplicate_of')
+    op.drop_column('items', 'minhash')
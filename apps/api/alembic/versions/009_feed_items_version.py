@@ -0,0 +1,27 @@
+"""items_version counters for cached feeds
+
+Revision ID: 009
+Revises: 008
+Create Date: 2025-11-05 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '009'
+down_revision: Union[str, None] = '008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('tenants', sa.Column('items_version', sa.BigInteger(), server_default='0', nullable=False))
+    op.add_column('sites', sa.Column('items_version', sa.BigInteger(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('sites', 'items_version')
+    op.drop_column('tenants', 'items_version')
@@ -0,0 +1,27 @@
+"""scheduled next run per site
+
+Revision ID: 011
+Revises: 010
+Create Date: 2025-11-10 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '011'
+down_revision: Union[str, None] = '010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('sites', sa.Column('next_run_at', sa.DateTime(), nullable=True))
+    op.create_index(op.f('ix_sites_next_run_at'), 'sites', ['next_run_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_sites_next_run_at'), table_name='sites')
+    op.drop_column('sites', 'next_run_at')
@@ -0,0 +1,33 @@
+"""adaptive polling intervals
+
+Revision ID: 012
+Revises: 011
+Create Date: 2025-11-12 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '012'
+down_revision: Union[str, None] = '011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('tenants', sa.Column('min_interval_minutes', sa.Integer(), server_default='15', nullable=False))
+    op.add_column('tenants', sa.Column('max_interval_minutes', sa.Integer(), server_default='1440', nullable=False))
+    op.add_column('sites', sa.Column('adaptive', sa.Boolean(), server_default=sa.false(), nullable=False))
+    op.add_column('sites', sa.Column('item_rate', sa.Float(), nullable=True))
+    op.add_column('sites', sa.Column('adaptive_interval_minutes', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('sites', 'adaptive_interval_minutes')
+    op.drop_column('sites', 'item_rate')
+    op.drop_column('sites', 'adaptive')
+    op.drop_column('tenants', 'max_interval_minutes')
+    op.drop_column('tenants', 'min_interval_minutes')
@@ -0,0 +1,30 @@
+"""per-host run spacing
+
+Revision ID: 013
+Revises: 012
+Create Date: 2025-11-14 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '013'
+down_revision: Union[str, None] = '012'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'host_politeness',
+        sa.Column('host', sa.String(), nullable=False),
+        sa.Column('next_start_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('host')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('host_politeness')
@@ -0,0 +1,28 @@
+"""per-site run lease
+
+Revision ID: 015
+Revises: 014
+Create Date: 2025-11-18 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '015'
+down_revision: Union[str, None] = '014'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('sites', sa.Column('lease_run_id', postgresql.UUID(as_uuid=True), nullable=True))
+    op.add_column('sites', sa.Column('lease_expires_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('sites', 'lease_expires_at')
+    op.drop_column('sites', 'lease_run_id')
@@ -0,0 +1,27 @@
+"""feed token version per tenant
+
+Revision ID: 019
+Revises: 018
+Create Date: 2025-11-24 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '019'
+down_revision: Union[str, None] = '018'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('tenants', sa.Column('feed_token_version', sa.Integer(), server_default='0', nullable=False))
+    op.drop_column('users', 'feed_token_version')
+
+
+def downgrade() -> None:
+    op.add_column('users', sa.Column('feed_token_version', sa.Integer(), server_default='0', nullable=False))
+    op.drop_column('tenants', 'feed_token_version')
@@ -1,14 +1,16 @@
 """FastAPI dependencies."""
 
-from typing import Optional
+from typing import Any, Optional
 from uuid import UUID
 
 from fastapi import Cookie, Depends, HTTPException, Header, status
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import InstrumentedAttribute, Session, make_transient_to_detached
 
 from app.database import get_db
 from app.models import Role, User, UserTenant
-from app.utils.auth import decode_jwt_token
+from app.utils.auth import decode_jwt_claims
+from app.utils.serialization import ITEM_COLUMNS, RUN_COLUMNS, select_columns
+from app.utils.token_cache import UserSnapshot, token_cache
 
 
 def get_current_user(
@@ -16,7 +18,11 @@ def get_current_user(
     authorization: Optional[str] = Header(None),
     db: Session = Depends(get_db),
 ) -> User:
-    """Get current authenticated user."""
+    """Get current authenticated user.
+
+    Verified tokens are served from ``token_cache`` without the JWT check
+    or the user lookup.
+    """
     token = None
 
     # Try cookie first
@@ -33,15 +39,19 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user_id = decode_jwt_token(token)
-    if not user_id:
+    snapshot = token_cache.get(token)
+    if snapshot is not None:
+        return _attach(db, snapshot)
+
+    claims = decode_jwt_claims(token)
+    if not claims:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.query(User).filter(User.id == claims["sub"]).first()
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -49,9 +59,37 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    if claims.get("ver", 0) != user.token_version:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    token_cache.put(
+        token,
+        UserSnapshot(user.id, user.email, user.name, user.created_at, user.token_version),
+        claims.get("exp"),
+    )
     return user
 
 
+def _attach(db: Session, snapshot: UserSnapshot) -> User:
+    """The user as a persistent instance in ``db``, without a SELECT.
+
+    Relationships such as ``user_tenants`` still load on access.
+    """
+    user = User(
+        id=snapshot.id,
+        email=snapshot.email,
+        name=snapshot.name,
+        created_at=snapshot.created_at,
+        token_version=snapshot.token_version,
+    )
+    make_transient_to_detached(user)
+    return db.merge(user, load=False)
+
+
 def require_super_admin(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -143,3 +181,24 @@ def require_tenant_admin(
 
     return user
 
+
+def _field_selection(
+    columns: dict[str, InstrumentedAttribute[Any]], fields: Optional[str]
+) -> dict[str, InstrumentedAttribute[Any]]:
+    try:
+        return select_columns(columns, fields)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+
+
+def item_fields(fields: Optional[str] = None) -> dict[str, InstrumentedAttribute[Any]]:
+    """Item columns selected by the ``fields`` query parameter."""
+    return _field_selection(ITEM_COLUMNS, fields)
+
+
+def run_fields(fields: Optional[str] = None) -> dict[str, InstrumentedAttribute[Any]]:
+    """Run columns selected by the ``fields`` query parameter."""
+    return _field_selection(RUN_COLUMNS, fields)
@@ -0,0 +1 @@
+"""Maintenance jobs, runnable as ``python -m app.jobs.<name>``."""
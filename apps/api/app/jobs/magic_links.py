@@ -0,0 +1,35 @@
+"""Magic link sweep job.
+
+Deletes expired magic link tokens (``app.services.magic_links``). Expired
+tokens are already refused, so this only keeps the table small; schedule
+hourly.
+
+    python -m app.jobs.magic_links
+"""
+
+import argparse
+from datetime import datetime
+from typing import Optional
+
+from app.database import SessionLocal
+from app.services.magic_links import magic_link_store
+
+
+def run(now: Optional[datetime] = None) -> int:
+    """Delete expired tokens; returns how many."""
+    db = SessionLocal()
+    try:
+        return magic_link_store.sweep(db, now or datetime.utcnow())
+    finally:
+        db.close()
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Delete expired magic link tokens.")
+    parser.parse_args(argv)
+
+    print(f"✓ Deleted {run()} expired magic link token(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Partition maintenance job.
+
+Creates upcoming monthly partitions for ``items`` and ``runs`` and, when a
+retention window is given, drops whole months older than it. Schedule daily
+(e.g. a Railway cron service running ``python -m app.jobs.partitions``).
+
+    python -m app.jobs.partitions --months-ahead 3 --items-retention-months 24 --dry-run
+"""
+
+import argparse
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import delete
+
+from app.database import engine
+from app.models import ChangeLogEntry, ItemMinhashBand
+from app.services.changes import ITEM
+from app.services.partitions import add_months, drop_partitions_before, ensure_partitions, month_start
+
+
+def run(
+    months_ahead: int = 3,
+    items_retention_months: Optional[int] = None,
+    runs_retention_months: Optional[int] = None,
+    dry_run: bool = False,
+) -> dict[str, list[str]]:
+    """Run partition maintenance and return what was created/dropped."""
+    this_month = month_start(datetime.utcnow())
+    report: dict[str, list[str]] = {"created": [], "dropped": []}
+
+    with engine.begin() as conn:
+        if not dry_run:
+            report["created"] = ensure_partitions(conn, months_ahead=months_ahead)
+
+        # item_keys rows are kept so dropped items are never re-ingested as new
+        for table, months in (("items", items_retention_months), ("runs", runs_retention_months)):
+            if months is None:
+                continue
+            cutoff = add_months(this_month, -months)
+            report["dropped"] += drop_partitions_before(conn, table, cutoff, dry_run=dry_run)
+            if table == "items" and not dry_run:
+                # Near-duplicate bands and change log entries of dropped items
+                conn.execute(delete(ItemMinhashBand).where(ItemMinhashBand.discovered_at < cutoff))
+                conn.execute(
+                    delete(ChangeLogEntry).where(
+                        ChangeLogEntry.kind == ITEM, ChangeLogEntry.entity_time < cutoff
+                    )
+                )
+
+    return report
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Maintain items/runs monthly partitions.")
+    parser.add_argument("--months-ahead", type=int, default=3)
+    parser.add_argument("--items-retention-months", type=int, default=None)
+    parser.add_argument("--runs-retention-months", type=int, default=None)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args(argv)
+
+    report = run(
+        months_ahead=args.months_ahead,
+        items_retention_months=args.items_retention_months,
+        runs_retention_months=args.runs_retention_months,
+        dry_run=args.dry_run,
+    )
+
+    prefix = "Would drop" if args.dry_run else "Dropped"
+    print(f"✓ Created {len(report['created'])} partition(s): {', '.join(report['created']) or '-'}")
+    print(f"✓ {prefix} {len(report['dropped'])} partition(s): {', '.join(report['dropped']) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Run retention job.
+
+Applies the per-plan retention policies in ``app.services.retention``.
+Schedule daily, after the partitions job.
+
+    python -m app.jobs.retention --dry-run
+    python -m app.jobs.retention --tenant-id <uuid> --batch-size 200 --pause 0.5
+"""
+
+import argparse
+from typing import Optional
+from uuid import UUID
+
+from app.database import engine
+from app.services.retention import RetentionEngine, RetentionReport
+
+
+def run(
+    tenant_id: Optional[UUID] = None,
+    batch_size: int = 500,
+    pause_seconds: float = 0.1,
+    dry_run: bool = False,
+) -> RetentionReport:
+    """Run one retention pass."""
+    retention = RetentionEngine(
+        engine,
+        batch_size=batch_size,
+        pause_seconds=pause_seconds,
+        dry_run=dry_run,
+    )
+    return retention.run(tenant_id=tenant_id)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Prune old runs and diagnostics per plan.")
+    parser.add_argument("--tenant-id", type=UUID, default=None)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--pause", type=float, default=0.1, help="Seconds between batches")
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args(argv)
+
+    report = run(
+        tenant_id=args.tenant_id,
+        batch_size=args.batch_size,
+        pause_seconds=args.pause,
+        dry_run=args.dry_run,
+    )
+
+    prefix = "Would prune" if report.dry_run else "Pruned"
+    print(f"✓ Checked {report.sites} site(s)")
+    print(f"✓ {prefix} {report.runs_pruned} run(s), cleared diagnostics on {report.diagnostics_cleared}")
+    print(f"✓ {'Would reclaim' if report.dry_run else 'Reclaimed'} ~{report.bytes_reclaimed / 1024 / 1024:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
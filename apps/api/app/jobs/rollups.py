@@ -0,0 +1,52 @@
+"""Daily rollup backfill job.
+
+Rebuilds ``site_daily_stats`` from run and item history, one chunk of days
+per transaction. Safe to re-run: each chunk replaces its days.
+
+    python -m app.jobs.rollups --since 2025-01-01
+    python -m app.jobs.rollups --days 90 --site-id <uuid>
+"""
+
+import argparse
+from datetime import date, datetime, timedelta
+from typing import Optional
+from uuid import UUID
+
+from app.database import engine
+from app.services.rollups import backfill
+
+
+def run(
+    since: date,
+    until: Optional[date] = None,
+    site_id: Optional[UUID] = None,
+    chunk_days: int = 7,
+) -> int:
+    """Backfill days in ``[since, until)`` (default: up to today); returns rows written."""
+    until = until or datetime.utcnow().date()
+    written = 0
+    start = since
+    while start < until:
+        end = min(start + timedelta(days=chunk_days), until)
+        with engine.begin() as conn:
+            written += backfill(conn, start, end, site_id=site_id)
+        start = end
+    return written
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Backfill site_daily_stats from history.")
+    parser.add_argument("--since", type=date.fromisoformat, default=None)
+    parser.add_argument("--until", type=date.fromisoformat, default=None, help="Exclusive")
+    parser.add_argument("--days", type=int, default=90, help="Used when --since is not given")
+    parser.add_argument("--site-id", type=UUID, default=None)
+    parser.add_argument("--chunk-days", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    since = args.since or datetime.utcnow().date() - timedelta(days=args.days)
+    written = run(since, until=args.until, site_id=args.site_id, chunk_days=args.chunk_days)
+    print(f"✓ Wrote {written} site-day row(s) from {since}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Run scheduler job.
+
+Dispatches due sites (``sites.next_run_at``) with per-tenant fair queuing
+weighted by plan (``app.services.scheduler``). Run one instance as a
+long-lived service; extra instances wait on an advisory lock, so the
+concurrency cap stays global. Each concurrent run needs two pooled
+connections; the job refuses a ``--max-concurrency`` the pool
+(``DATABASE_POOL_SIZE`` + ``DATABASE_MAX_OVERFLOW``) can't serve.
+
+    python -m app.jobs.scheduler --loop --interval 60 --max-concurrency 8
+    python -m app.jobs.scheduler --dry-run
+"""
+
+import argparse
+import time
+from typing import Optional
+
+from sqlalchemy import text
+
+from app.config import settings
+from app.database import engine
+from app.services.politeness import host_limiter
+from app.services.scheduler import (
+    SCHEDULER_LOCK_KEY,
+    Dispatcher,
+    DispatchReport,
+    connections_needed,
+)
+
+
+def run(
+    max_concurrency: int = 8,
+    max_runs: Optional[int] = None,
+    dry_run: bool = False,
+) -> Optional[DispatchReport]:
+    """Run one dispatch pass; returns None if another scheduler holds the lock."""
+    with engine.connect() as conn:
+        locked = conn.execute(
+            text("SELECT pg_try_advisory_lock(:key)"), {"key": SCHEDULER_LOCK_KEY}
+        ).scalar()
+        # The lock is session-level; don't sit idle in transaction for the pass
+        conn.commit()
+        if not locked:
+            return None
+        try:
+            dispatcher = Dispatcher(max_concurrency=max_concurrency, limiter=host_limiter)
+            return dispatcher.run_once(max_runs=max_runs, dry_run=dry_run)
+        finally:
+            conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": SCHEDULER_LOCK_KEY})
+            conn.commit()
+
+
+def _print_report(report: Optional[DispatchReport]) -> None:
+    if report is None:
+        print("• Another scheduler is running; skipped")
+        return
+    prefix = "Would dispatch" if report.dry_run else "Dispatched"
+    print(f"✓ {prefix} {report.dispatched} run(s) across {len(report.per_tenant)} tenant(s)")
+    if not report.dry_run:
+        print(
+            f"✓ {report.succeeded} succeeded, {report.failed} failed, "
+            f"{report.deferred} deferred (busy host), {report.skipped} skipped (already running)"
+        )
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Dispatch due runs fairly across tenants.")
+    parser.add_argument("--max-concurrency", type=int, default=8)
+    parser.add_argument("--max-runs", type=int, default=None, help="Cap on runs per pass")
+    parser.add_argument("--loop", action="store_true", help="Keep dispatching every --interval")
+    parser.add_argument("--interval", type=float, default=60.0, help="Seconds between passes")
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args(argv)
+    pool = settings.database_pool_size + settings.database_max_overflow
+    if connections_needed(args.max_concurrency) > pool:
+        parser.error(
+            f"--max-concurrency {args.max_concurrency} needs "
+            f"{connections_needed(args.max_concurrency)} database connections, the pool "
+            f"allows {pool}; raise DATABASE_MAX_OVERFLOW or lower --max-concurrency"
+        )
+
+    while True:
+        started = time.monotonic()
+        _print_report(run(args.max_concurrency, args.max_runs, args.dry_run))
+        if not args.loop:
+            break
+        time.sleep(max(0.0, args.interval - (time.monotonic() - started)))
+
+
+if __name__ == "__main__":
+    main()
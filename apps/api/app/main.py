@@ -1,18 +1,60 @@
 """Main FastAPI application."""
 
-import os
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+import time
+
+# Cold-start timings are measured from here, before the heavy imports
+_STARTED = time.perf_counter()
+
+import os  # noqa: E402
+from collections.abc import AsyncIterator  # noqa: E402
+from contextlib import asynccontextmanager  # noqa: E402
+from typing import Optional  # noqa: E402
+
+from fastapi import FastAPI, Response, status  # noqa: E402
+from fastapi.middleware.cors import CORSMiddleware  # noqa: E402
+
+from app.routers import (  # noqa: E402
+    api_keys,
+    auth,
+    changes,
+    dashboard,
+    feeds,
+    invites,
+    search,
+    seed_endpoint,
+    sites,
+    stream,
+    tenants,
+    webhooks,
+)
+from app.database import engine  # noqa: E402
+from app.services.health import health_monitor  # noqa: E402
+from app.services.warmup import FirstResponseTimer, start_prewarm  # noqa: E402
+from app.services.worker_client import close_shared_worker_client  # noqa: E402
+from sqlalchemy import text  # noqa: E402
+
+startup_timings: dict[str, Optional[float]] = {
+    "import_ms": round((time.perf_counter() - _STARTED) * 1000, 1)
+}
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Pre-warm and start health checks in the background; stop them on shutdown."""
+    start_prewarm(startup_timings)
+    health_monitor.start()
+    yield
+    health_monitor.stop()
+    close_shared_worker_client()
 
-from app.routers import api_keys, auth, dashboard, invites, seed_endpoint, sites, tenants, webhooks
-from app.database import engine
-from sqlalchemy import text
 
 app = FastAPI(
     title="SiteWatcher API",
     description="Multi-tenant SaaS for detecting new posts on websites",
     version="0.1.1-test",
+    lifespan=lifespan,
 )
+app.state.startup_timings = startup_timings
 
 # CORS origins - supports multiple origins via comma-separated env var
 # Example: CORS_ORIGINS=http://localhost:3000,https://myapp.vercel.app,https://example.com
@@ -30,6 +72,7 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(FirstResponseTimer, started=_STARTED, timings=startup_timings)
 
 # Include routers
 app.include_router(auth.router)
@@ -39,23 +82,34 @@ app.include_router(sites.router)
 app.include_router(webhooks.router)
 app.include_router(api_keys.router)
 app.include_router(dashboard.router)
+app.include_router(search.router)
+app.include_router(feeds.router)
+app.include_router(stream.router)
+app.include_router(changes.router)
 app.include_router(seed_endpoint.router)
 
 
+@app.get("/livez")
+def liveness() -> dict[str, str]:
+    """Liveness probe: the process is serving requests. No I/O."""
+    return {"status": "ok"}
+
+
+@app.get("/readyz")
+def readiness(response: Response) -> dict:
+    """Readiness probe from the cached background health check; 503 when not ready."""
+    snapshot = health_monitor.snapshot()
+    if not snapshot.ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return snapshot.to_dict()
+
+
 @app.get("/healthz")
 def health_check() -> dict[str, str]:
-    """Health check endpoint."""
-    # Test database connection
-    try:
-        with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
-        db_status = "connected"
-    except Exception:
-        db_status = "disconnected"
-
+    """Health check endpoint (database state from the cached health check)."""
     return {
         "status": "ok",
-        "database": db_status,
+        "database": health_monitor.snapshot().database,
     }
 
 
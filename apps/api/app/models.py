@@ -8,18 +8,24 @@ from uuid import uuid4
 from sqlalchemy import (
     ARRAY,
     JSON,
+    BigInteger,
     Boolean,
     Column,
+    Computed,
+    Date,
     DateTime,
     Enum,
+    Float,
     ForeignKey,
+    Index,
     Integer,
+    PrimaryKeyConstraint,
     String,
     Text,
-    UniqueConstraint,
 )
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import ARRAY as PG_ARRAY
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
+from sqlalchemy.orm import deferred, relationship
 
 from app.database import Base
 
@@ -48,8 +54,22 @@ class Tenant(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     name = Column(String, nullable=False)
     plan = Column(String, default="free")
+    keywords = Column(ARRAY(Text))  # matched on every site, with each site's own keywords
+    # Bounds for sites on adaptive intervals
+    min_interval_minutes = Column(Integer, nullable=False, default=15, server_default="15")
+    max_interval_minutes = Column(Integer, nullable=False, default=1440, server_default="1440")
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    # Bumped whenever tenant-visible data changes; drives ETag/Last-Modified
+    data_version = Column(BigInteger, nullable=False, default=0, server_default="0")
+    data_changed_at = Column(DateTime)
+    # Signed into the tenant's feed tokens; bumping it revokes its feed URLs
+    feed_token_version = Column(Integer, nullable=False, default=0, server_default="0")
+    # Bumped only when new items are ingested; keys the cached tenant feed
+    items_version = Column(BigInteger, nullable=False, default=0, server_default="0")
+    # Last sequence number handed out to this tenant's change log
+    change_seq = Column(BigInteger, nullable=False, default=0, server_default="0")
+
     # Relationships
     sites = relationship("Site", back_populates="tenant", cascade="all, delete-orphan")
     webhooks = relationship("Webhook", back_populates="tenant", cascade="all, delete-orphan")
@@ -66,6 +86,8 @@ class User(Base):
     email = Column(String, unique=True, nullable=False, index=True)
     name = Column(String)
     created_at = Column(DateTime, default=datetime.utcnow)
+    # Carried as the JWT "ver" claim; bumping it revokes the user's tokens
+    token_version = Column(Integer, nullable=False, default=0, server_default="0")
 
     # Relationships
     user_tenants = relationship("UserTenant", back_populates="user", cascade="all, delete-orphan")
@@ -97,19 +119,40 @@ class Site(Base):
     keywords = Column(ARRAY(Text))
     enabled = Column(Boolean, default=True)
     interval_minutes = Column(Integer, default=60)
+    # Adaptive sites are scheduled from their learned posting rate instead
+    # of interval_minutes (app.services.adaptive)
+    adaptive = Column(Boolean, nullable=False, default=False, server_default="false")
+    item_rate = Column(Float)  # EWMA of new items per hour
+    adaptive_interval_minutes = Column(Integer)
     last_run_at = Column(DateTime)
+    # When the scheduler should run the site next; NULL means due now
+    next_run_at = Column(DateTime, index=True)
     created_at = Column(DateTime, default=datetime.utcnow)
+    # Bumped only when new items are ingested; keys the cached site feed
+    items_version = Column(BigInteger, nullable=False, default=0, server_default="0")
+    # Run in progress, so overlapping triggers return it instead of starting
+    # another; a lease past expiry (crashed process) can be taken over
+    lease_run_id = Column(UUID(as_uuid=True))
+    lease_expires_at = Column(DateTime)
 
     # Relationships
     tenant = relationship("Tenant", back_populates="sites")
     runs = relationship("Run", back_populates="site", cascade="all, delete-orphan")
     items = relationship("Item", back_populates="site", cascade="all, delete-orphan")
+    item_keys = relationship("ItemKey", cascade="all, delete-orphan")
+    run_daily_summaries = relationship("RunDailySummary", cascade="all, delete-orphan")
+    daily_stats = relationship("SiteDailyStats", cascade="all, delete-orphan")
 
 
 class Run(Base):
-    """Run model."""
+    """Run model.
+
+    Partitioned by month on ``started_at`` in Postgres (migration 003), so the
+    primary key there is ``(id, started_at)``.
+    """
 
     __tablename__ = "runs"
+    __table_args__ = (Index("ix_runs_site_started", "site_id", "started_at"),)
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     site_id = Column(UUID(as_uuid=True), ForeignKey("sites.id"), nullable=False)
@@ -117,19 +160,37 @@ class Run(Base):
     method = Column(String)  # 'profile' or 'discover'
     pages_scanned = Column(Integer, default=0)
     duration_ms = Column(Integer)
-    diagnostics_json = Column(JSON)
-    started_at = Column(DateTime, default=datetime.utcnow)
+    diagnostics_json = deferred(Column(JSON))  # loaded on access only
+    started_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     finished_at = Column(DateTime)
 
     # Relationships
     site = relationship("Site", back_populates="runs")
 
 
+# Full-text document for an item: title, URL words and metadata, weighted in
+# that order. Kept in sync by Postgres as a stored generated column.
+ITEM_SEARCH_DOCUMENT = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', regexp_replace(url, '[^[:alnum:]]+', ' ', 'g')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(CAST(meta_json AS text), '')), 'C')"
+)
+
+
 class Item(Base):
-    """Item model."""
+    """Item model.
+
+    Partitioned by month on ``discovered_at`` in Postgres (migration 003), so
+    the primary key there is ``(id, discovered_at)`` and per-site URL dedup
+    lives in ``ItemKey``.
+    """
 
     __tablename__ = "items"
-    __table_args__ = (UniqueConstraint("site_id", "canonical_url", name="uix_site_canonical"),)
+    __table_args__ = (
+        Index("ix_items_site_discovered", "site_id", "discovered_at"),
+        Index("ix_items_matched_keywords", "matched_keywords", postgresql_using="gin"),
+        Index("ix_items_search", "search_vector", postgresql_using="gin"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     site_id = Column(UUID(as_uuid=True), ForeignKey("sites.id"), nullable=False)
@@ -137,14 +198,140 @@ class Item(Base):
     canonical_url = Column(String)
     title = Column(String)
     published_at = Column(DateTime)
-    discovered_at = Column(DateTime, default=datetime.utcnow)
+    discovered_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     source = Column(String)  # 'feed', 'html', 'sitemap'
-    meta_json = Column(JSON)
+    meta_json = deferred(Column(JSON))  # loaded on access only
+    # site/tenant keywords found at ingestion; the Postgres ARRAY type provides
+    # the @> (contains) operator the GIN index serves
+    matched_keywords = Column(PG_ARRAY(Text))
+    search_vector = deferred(Column(TSVECTOR, Computed(ITEM_SEARCH_DOCUMENT, persisted=True)))
+    minhash = deferred(Column(ARRAY(BigInteger)))  # near-duplicate signature
+    duplicate_of = Column(UUID(as_uuid=True))  # earliest near-duplicate in the tenant
 
     # Relationships
     site = relationship("Site", back_populates="items")
 
 
+class ItemKey(Base):
+    """Per-site canonical URL dedup key for items.
+
+    Ingestion inserts the key first and only inserts the item if the key was
+    new, which keeps the (site_id, canonical_url) guarantee on a partitioned
+    items table and after old item partitions are dropped.
+    """
+
+    __tablename__ = "item_keys"
+    __table_args__ = (
+        PrimaryKeyConstraint("site_id", "canonical_url", name="uix_site_canonical"),
+    )
+
+    site_id = Column(UUID(as_uuid=True), ForeignKey("sites.id"), nullable=False)
+    canonical_url = Column(String, nullable=False)
+    item_id = Column(UUID(as_uuid=True), nullable=False)
+    discovered_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+
+class ItemMinhashBand(Base):
+    """LSH band index over item MinHash signatures, per tenant.
+
+    One row per band of each item's signature; items sharing a band key with
+    a new item are its near-duplicate candidates (``app.services.near_duplicates``).
+    """
+
+    __tablename__ = "item_minhash_bands"
+
+    tenant_id = Column(UUID(as_uuid=True), ForeignKey("tenants.id"), primary_key=True)
+    band_key = Column(BigInteger, primary_key=True)
+    item_id = Column(UUID(as_uuid=True), primary_key=True)
+    discovered_at = Column(DateTime, nullable=False)
+
+
+class ChangeLogEntry(Base):
+    """Per-tenant ordered log of item inserts and run completions.
+
+    ``seq`` is monotonic per tenant and allocated under the tenant row lock,
+    so entries become visible in ``seq`` order (``GET /v1/changes``).
+    ``entity_time`` is the entity's partition key (``items.discovered_at`` or
+    ``runs.started_at``) for pruned lookups.
+    """
+
+    __tablename__ = "change_log"
+
+    tenant_id = Column(UUID(as_uuid=True), ForeignKey("tenants.id"), primary_key=True)
+    seq = Column(BigInteger, primary_key=True)
+    kind = Column(String, nullable=False)  # 'item' or 'run'
+    site_id = Column(UUID(as_uuid=True), nullable=False)
+    entity_id = Column(UUID(as_uuid=True), nullable=False)
+    entity_time = Column(DateTime, nullable=False)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+
+class HostPoliteness(Base):
+    """Earliest start time for the next run against a registrable domain.
+
+    Reserved atomically by ``app.services.politeness`` to space runs
+    against one host across processes.
+    """
+
+    __tablename__ = "host_politeness"
+
+    host = Column(String, primary_key=True)
+    next_start_at = Column(DateTime, nullable=False)
+
+
+class DiscoveryCacheEntry(Base):
+    """Recent Worker response shared by runs with the same discovery key.
+
+    Written by ``app.services.discovery``; one row per key, overwritten on
+    each fetch.
+    """
+
+    __tablename__ = "discovery_cache"
+
+    key = Column(String, primary_key=True)
+    response = Column(JSON, nullable=False)
+    expires_at = Column(DateTime, nullable=False)
+
+
+class RunDailySummary(Base):
+    """Daily per-site aggregate of runs removed by retention.
+
+    Pruned runs are folded in here before deletion, so run counts survive
+    retention.
+    """
+
+    __tablename__ = "run_daily_summaries"
+
+    site_id = Column(UUID(as_uuid=True), ForeignKey("sites.id"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    runs_total = Column(Integer, nullable=False, default=0)
+    runs_success = Column(Integer, nullable=False, default=0)
+    runs_error = Column(Integer, nullable=False, default=0)
+    pages_scanned = Column(BigInteger, nullable=False, default=0)
+    duration_ms_total = Column(BigInteger, nullable=False, default=0)
+    duration_ms_max = Column(Integer)
+
+
+class SiteDailyStats(Base):
+    """Per-site daily rollup of runs and new items.
+
+    Updated incrementally as runs complete (``app.services.rollups``) and
+    rebuilt from history by the ``rollups`` job. Runs count on the day they
+    started, items on the day they were discovered.
+    """
+
+    __tablename__ = "site_daily_stats"
+
+    site_id = Column(UUID(as_uuid=True), ForeignKey("sites.id"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    items_new = Column(Integer, nullable=False, default=0)
+    runs_total = Column(Integer, nullable=False, default=0)
+    runs_success = Column(Integer, nullable=False, default=0)
+    runs_error = Column(Integer, nullable=False, default=0)
+    duration_ms_total = Column(BigInteger, nullable=False, default=0)
+    pages_scanned = Column(BigInteger, nullable=False, default=0)
+
+
 class Webhook(Base):
     """Webhook model."""
 
@@ -195,3 +382,18 @@ class Invite(Base):
     # Relationships
     tenant = relationship("Tenant", back_populates="invites")
 
+
+class MagicLinkToken(Base):
+    """Outstanding magic link, stored by token hash until used or expired.
+
+    Written and consumed by ``app.services.magic_links``; expired rows are
+    removed by ``app.jobs.magic_links``.
+    """
+
+    __tablename__ = "magic_link_tokens"
+
+    token_hash = Column(String, primary_key=True)
+    email = Column(String, nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
@@ -9,6 +9,7 @@ from app.database import get_db
 from app.dependencies import get_current_user
 from app.models import User
 from app.schemas import (
+    LogoutResponse,
     MagicLinkCallback,
     MagicLinkRequest,
     MagicLinkResponse,
@@ -17,13 +18,12 @@ from app.schemas import (
     UserTenantResponse,
 )
 from app.config import settings
-from app.utils.auth import create_jwt_token, create_magic_link_token, hash_token, verify_token
+from app.services.magic_links import magic_link_store
+from app.utils.auth import create_jwt_token, create_magic_link_token
+from app.utils.token_cache import token_cache
 
 router = APIRouter(prefix="/v1/auth", tags=["auth"])
 
-# In-memory store for dev magic links (in production, use Redis or database)
-magic_links: dict[str, str] = {}
-
 
 @router.post("/magic-link", response_model=MagicLinkResponse)
 def request_magic_link(
@@ -31,12 +31,9 @@ def request_magic_link(
     db: Session = Depends(get_db),
 ) -> MagicLinkResponse:
     """Request magic link (dev stub - logs to console)."""
-    # Create token
+    # Create token (stored by hash, single use, expires after MAGIC_LINK_TTL_MINUTES)
     token = create_magic_link_token()
-    token_hash = hash_token(token)
-
-    # Store token with email (in production, store in DB with expiry)
-    magic_links[token] = request.email
+    magic_link_store.put(db, token, request.email, datetime.utcnow())
 
     # In dev, log the link to console
     magic_link = f"http://localhost:3000/auth/callback?token={token}"
@@ -56,8 +53,8 @@ def magic_link_callback(
     db: Session = Depends(get_db),
 ) -> TokenResponse:
     """Exchange magic link token for JWT."""
-    # Verify token exists
-    email = magic_links.get(callback.token)
+    # Verify and use up the token
+    email = magic_link_store.consume(db, callback.token, datetime.utcnow())
     if not email:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -72,11 +69,8 @@ def magic_link_callback(
         db.commit()
         db.refresh(user)
 
-    # Remove used token
-    del magic_links[callback.token]
-
     # Create JWT
-    jwt_token = create_jwt_token(str(user.id))
+    jwt_token = create_jwt_token(str(user.id), version=user.token_version)
 
     # Set httpOnly cookie
     # Use secure=True for production (HTTPS), False for local development
@@ -115,6 +109,23 @@ def magic_link_callback(
     )
 
 
+@router.post("/logout", response_model=LogoutResponse)
+def logout(
+    response: Response,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+) -> LogoutResponse:
+    """Revoke all of the current user's tokens."""
+    db.query(User).filter(User.id == current_user.id).update(
+        {User.token_version: User.token_version + 1}, synchronize_session=False
+    )
+    db.commit()
+    token_cache.invalidate_user(current_user.id)
+
+    response.delete_cookie(key="access_token")
+    return LogoutResponse(success=True)
+
+
 @router.get("/me", response_model=UserResponse)
 def get_me(
     current_user: User = Depends(get_current_user),
@@ -0,0 +1,103 @@
+"""Change feed router."""
+
+from typing import Any
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Request, Response
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.dependencies import get_current_user, require_tenant_access
+from app.models import ChangeLogEntry, Item, Run, User
+from app.schemas import ChangeListResponse
+from app.services.changes import ITEM, RUN
+from app.utils.http_cache import CacheValidator
+from app.utils.serialization import ITEM_COLUMNS, RUN_COLUMNS, FastJSONResponse, rows_to_dicts
+
+router = APIRouter(prefix="/v1/changes", tags=["changes"])
+
+MAX_LIMIT = 1000
+
+
+def _entities(
+    db: Session, columns: dict[str, Any], id_column: Any, time_column: Any, keys: list[tuple]
+) -> dict[UUID, dict[str, Any]]:
+    if not keys:
+        return {}
+    # Matching on (id, partition key) lets Postgres prune partitions
+    rows = db.query(*columns.values()).filter(tuple_(id_column, time_column).in_(keys)).all()
+    return {entity["id"]: entity for entity in rows_to_dicts(rows, list(columns))}
+
+
+@router.get("", response_model=ChangeListResponse)
+def list_changes(
+    tenant_id: UUID,
+    request: Request,
+    since: int = 0,
+    limit: int = 500,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> Response:
+    """Changes for a tenant after sequence number ``since``, oldest first.
+
+    Pass the returned ``next_since`` as ``since`` to continue; ``has_more``
+    says whether another batch is ready now. Sequence numbers are monotonic
+    per tenant and a sync never skips an entry. Entities deleted since
+    (retention) come back as ``null``.
+    """
+    # Verify access
+    _ = require_tenant_access(tenant_id, current_user, db)
+
+    validator = CacheValidator.for_tenants(db, request, [tenant_id])
+    if validator.is_fresh(request):
+        return validator.not_modified()
+
+    limit = max(1, min(limit, MAX_LIMIT))
+    entries = (
+        db.query(ChangeLogEntry)
+        .filter(ChangeLogEntry.tenant_id == tenant_id, ChangeLogEntry.seq > since)
+        .order_by(ChangeLogEntry.seq)
+        .limit(limit + 1)
+        .all()
+    )
+    has_more = len(entries) > limit
+    entries = entries[:limit]
+
+    items = _entities(
+        db,
+        ITEM_COLUMNS,
+        Item.id,
+        Item.discovered_at,
+        [(e.entity_id, e.entity_time) for e in entries if e.kind == ITEM],
+    )
+    runs = _entities(
+        db,
+        RUN_COLUMNS,
+        Run.id,
+        Run.started_at,
+        [(e.entity_id, e.entity_time) for e in entries if e.kind == RUN],
+    )
+
+    changes = [
+        {
+            "seq": entry.seq,
+            "kind": entry.kind,
+            "site_id": entry.site_id,
+            "entity_id": entry.entity_id,
+            "created_at": entry.created_at,
+            "item": items.get(entry.entity_id) if entry.kind == ITEM else None,
+            "run": runs.get(entry.entity_id) if entry.kind == RUN else None,
+        }
+        for entry in entries
+    ]
+
+    return validator.apply(
+        FastJSONResponse(
+            {
+                "changes": changes,
+                "next_since": entries[-1].seq if entries else since,
+                "has_more": has_more,
+            }
+        )
+    )
@@ -1,24 +1,30 @@
 """Dashboard router."""
 
 from datetime import datetime, timedelta
+from typing import Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy import and_, desc, func
 from sqlalchemy.orm import Session
 
 from app.database import get_db
-from app.dependencies import get_current_user, require_tenant_access
-from app.models import Item, Run, RunStatus, Site, Tenant, User, UserTenant
+from app.dependencies import get_current_user, item_fields, require_tenant_access, run_fields
+from app.models import Item, Run, RunDailySummary, RunStatus, Site, Tenant, User, UserTenant
 from app.schemas import (
+    DailyStatsPoint,
+    DailyStatsResponse,
     DashboardStatsResponse,
     ItemListResponse,
-    ItemResponse,
     RunListResponse,
-    RunResponse,
+    SchedulingStatsResponse,
     TeamListResponse,
     TeamMemberResponse,
 )
+from app.services.adaptive import adaptive_savings
+from app.services.rollups import MAX_SERIES_DAYS, daily_series
+from app.utils.http_cache import CacheValidator
+from app.utils.serialization import FastJSONResponse, rows_to_dicts
 
 router = APIRouter(prefix="/v1/dashboard", tags=["dashboard"])
 
@@ -26,13 +32,27 @@ router = APIRouter(prefix="/v1/dashboard", tags=["dashboard"])
 @router.get("/stats", response_model=DashboardStatsResponse)
 def get_dashboard_stats(
     tenant_id: UUID,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> DashboardStatsResponse:
+) -> DashboardStatsResponse | Response:
     """Get dashboard statistics for a tenant."""
     # Verify user has access to this tenant
     user, role = require_tenant_access(tenant_id, current_user, db)
 
+    # "Today" / "this week" counters also move with the clock, so cached
+    # copies expire on the hour even without data changes
+    validator = CacheValidator.for_tenants(
+        db,
+        request,
+        [tenant_id],
+        valid_from=datetime.utcnow().replace(minute=0, second=0, microsecond=0),
+    )
+    if validator.is_fresh(request):
+        return validator.not_modified()
+    response.headers.update(validator.headers())
+
     # Get tenant
     tenant = db.query(Tenant).filter(Tenant.id == tenant_id).first()
     if not tenant:
@@ -72,13 +92,19 @@ def get_dashboard_stats(
         .count()
     )
 
-    # Total runs
+    # Total runs, including runs pruned by retention into daily summaries
     total_runs = (
         db.query(Run)
         .join(Site)
         .filter(Site.tenant_id == tenant_id)
         .count()
     )
+    pruned_runs = (
+        db.query(func.coalesce(func.sum(RunDailySummary.runs_total), 0))
+        .join(Site)
+        .filter(Site.tenant_id == tenant_id)
+        .scalar()
+    )
 
     # Successful runs today
     today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
@@ -112,7 +138,7 @@ def get_dashboard_stats(
         active_sites=active_sites,
         total_items=total_items,
         items_this_week=items_this_week,
-        total_runs=total_runs,
+        total_runs=total_runs + pruned_runs,
         successful_runs_today=successful_runs_today,
         failed_runs_today=failed_runs_today,
     )
@@ -156,57 +182,60 @@ def get_team_members(
 @router.get("/recent-items", response_model=ItemListResponse)
 def get_recent_items(
     tenant_id: UUID,
+    request: Request,
     limit: int = 20,
+    collapse: bool = False,
+    columns: dict[str, Any] = Depends(item_fields),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> ItemListResponse:
-    """Get recent items discovered across all sites for a tenant."""
+) -> Response:
+    """Get recent items discovered across all sites for a tenant.
+
+    ``collapse`` hides near-duplicates, keeping the first item of each group.
+    """
     # Verify user has access to this tenant
     user, role = require_tenant_access(tenant_id, current_user, db)
 
+    validator = CacheValidator.for_tenants(db, request, [tenant_id])
+    if validator.is_fresh(request):
+        return validator.not_modified()
+
     # Query recent items across all sites for this tenant
-    items = (
-        db.query(Item)
-        .join(Site)
-        .filter(Site.tenant_id == tenant_id)
-        .order_by(desc(Item.discovered_at))
-        .limit(limit)
-        .all()
-    )
+    query = db.query(*columns.values()).join(Site).filter(Site.tenant_id == tenant_id)
+    if collapse:
+        query = query.filter(Item.duplicate_of.is_(None))
+    rows = query.order_by(desc(Item.discovered_at)).limit(limit).all()
 
-    return ItemListResponse(
-        items=[
-            ItemResponse(
-                id=item.id,
-                site_id=item.site_id,
-                url=item.url,
-                canonical_url=item.canonical_url,
-                title=item.title,
-                published_at=item.published_at,
-                discovered_at=item.discovered_at,
-                source=item.source,
-                meta_json=item.meta_json,
-            )
-            for item in items
-        ],
-        next_cursor=None,  # Simple list, no pagination cursor for dashboard
+    return validator.apply(
+        FastJSONResponse(
+            {
+                "items": rows_to_dicts(rows, list(columns)),
+                "next_cursor": None,  # Simple list, no pagination cursor for dashboard
+            }
+        )
     )
 
 
 @router.get("/recent-runs", response_model=RunListResponse)
 def get_recent_runs(
     tenant_id: UUID,
+    request: Request,
     limit: int = 10,
+    columns: dict[str, Any] = Depends(run_fields),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> RunListResponse:
+) -> Response:
     """Get recent runs across all sites for a tenant."""
     # Verify user has access to this tenant
     user, role = require_tenant_access(tenant_id, current_user, db)
 
+    validator = CacheValidator.for_tenants(db, request, [tenant_id])
+    if validator.is_fresh(request):
+        return validator.not_modified()
+
     # Query recent runs across all sites for this tenant
-    runs = (
-        db.query(Run)
+    rows = (
+        db.query(*columns.values())
         .join(Site)
         .filter(Site.tenant_id == tenant_id)
         .order_by(desc(Run.started_at))
@@ -214,21 +243,74 @@ def get_recent_runs(
         .all()
     )
 
-    return RunListResponse(
-        runs=[
-            RunResponse(
-                id=run.id,
-                site_id=run.site_id,
-                status=run.status.value,
-                method=run.method,
-                pages_scanned=run.pages_scanned,
-                duration_ms=run.duration_ms,
-                diagnostics_json=run.diagnostics_json,
-                started_at=run.started_at,
-                finished_at=run.finished_at,
-            )
-            for run in runs
-        ],
-        total=len(runs),
+    return validator.apply(
+        FastJSONResponse(
+            {
+                "runs": rows_to_dicts(rows, list(columns)),
+                "total": len(rows),
+            }
+        )
     )
 
+
+@router.get("/timeseries", response_model=DailyStatsResponse)
+def get_timeseries(
+    tenant_id: UUID,
+    request: Request,
+    response: Response,
+    days: int = 30,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> DailyStatsResponse | Response:
+    """Daily items and run metrics across all sites for a tenant."""
+    if not 1 <= days <= MAX_SERIES_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"days must be between 1 and {MAX_SERIES_DAYS}",
+        )
+
+    # Verify user has access to this tenant
+    user, role = require_tenant_access(tenant_id, current_user, db)
+
+    today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    validator = CacheValidator.for_tenants(db, request, [tenant_id], valid_from=today_start)
+    if validator.is_fresh(request):
+        return validator.not_modified()
+    response.headers.update(validator.headers())
+
+    site_ids = [row[0] for row in db.query(Site.id).filter(Site.tenant_id == tenant_id).all()]
+    end = today_start.date()
+    start = end - timedelta(days=days - 1)
+    points = daily_series(db, site_ids, start, end)
+
+    return DailyStatsResponse(
+        start=start,
+        end=end,
+        points=[DailyStatsPoint.model_validate(point) for point in points],
+    )
+
+
+@router.get("/scheduling", response_model=SchedulingStatsResponse)
+def get_scheduling_stats(
+    tenant_id: UUID,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> SchedulingStatsResponse | Response:
+    """Worker calls saved per day by a tenant's adaptive sites."""
+    # Verify user has access to this tenant
+    user, role = require_tenant_access(tenant_id, current_user, db)
+
+    validator = CacheValidator.for_tenants(db, request, [tenant_id])
+    if validator.is_fresh(request):
+        return validator.not_modified()
+    response.headers.update(validator.headers())
+
+    savings = adaptive_savings(db, tenant_id)
+    return SchedulingStatsResponse(
+        adaptive_sites=savings.adaptive_sites,
+        fixed_runs_per_day=round(savings.fixed_runs_per_day, 1),
+        adaptive_runs_per_day=round(savings.adaptive_runs_per_day, 1),
+        runs_saved_per_day=round(savings.runs_saved_per_day, 1),
+    )
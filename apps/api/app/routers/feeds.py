@@ -0,0 +1,246 @@
+"""Feeds router.
+
+Feed URLs carry a signed token (``?token=``) instead of a session, so feed
+readers can poll them. Tokens are issued per user and carry the tenant, an
+expiry and the tenant's ``feed_token_version``; a feed request checks them
+against the resource's tenant row it reads anyway, without touching the
+users or memberships tables. Rotating the tenant's tokens (after removing a
+member, say) revokes every feed URL issued for it; others lapse after
+``FEED_TOKEN_TTL_DAYS``.
+"""
+
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy import desc
+from sqlalchemy.orm import Query, Session
+
+from app.config import settings
+from app.database import get_db
+from app.dependencies import get_current_user, require_tenant_access, require_tenant_admin
+from app.models import Item, Site, Tenant, User
+from app.schemas import FeedLinksResponse, FeedTokenRotateResponse
+from app.services.feeds import (
+    ATOM_MEDIA_TYPE,
+    FEED_SIZE,
+    RSS_MEDIA_TYPE,
+    feed_cache,
+    feed_etag,
+    feed_url,
+    render_atom,
+    render_rss,
+)
+from app.utils.auth import FeedToken, create_feed_token, verify_feed_token
+from app.utils.http_cache import CACHE_CONTROL, etag_matches
+from app.utils.serialization import rows_to_dicts
+
+router = APIRouter(prefix="/v1", tags=["feeds"])
+
+FEED_COLUMNS = {
+    "id": Item.id,
+    "url": Item.url,
+    "title": Item.title,
+    "published_at": Item.published_at,
+    "discovered_at": Item.discovered_at,
+    "matched_keywords": Item.matched_keywords,
+}
+
+
+def _invalid_token() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Invalid feed token",
+    )
+
+
+def _feed_claims(token: str, scope: str, resource_id: UUID) -> FeedToken:
+    """Claims of a feed token signed for this resource and not expired."""
+    claims = verify_feed_token(token, scope, str(resource_id))
+    if claims is None:
+        raise _invalid_token()
+    return claims
+
+
+def _check_tenant(claims: FeedToken, tenant_id: UUID, feed_token_version: int) -> None:
+    """Reject tokens for another tenant or revoked by a rotation."""
+    if claims.tenant_id != tenant_id or claims.version != feed_token_version:
+        raise _invalid_token()
+
+
+def _latest_items(query: Query) -> list[dict[str, Any]]:
+    rows = query.order_by(desc(Item.discovered_at), desc(Item.id)).limit(FEED_SIZE).all()
+    return rows_to_dicts(rows, list(FEED_COLUMNS))
+
+
+def _feed_response(
+    request: Request,
+    scope: str,
+    resource_id: UUID,
+    fmt: str,
+    version: int,
+    render: Callable[[], bytes],
+) -> Response:
+    etag = feed_etag(scope, resource_id, fmt, version)
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None and etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    body = feed_cache.get((scope, resource_id, fmt), version, render)
+    media_type = RSS_MEDIA_TYPE if fmt == "rss" else ATOM_MEDIA_TYPE
+    return Response(content=body, media_type=media_type, headers=headers)
+
+
+def _site_feed(request: Request, site_id: UUID, token: str, fmt: str, db: Session) -> Response:
+    claims = _feed_claims(token, "site", site_id)
+    site = (
+        db.query(Site.url, Site.items_version, Site.tenant_id, Tenant.feed_token_version)
+        .join(Tenant, Tenant.id == Site.tenant_id)
+        .filter(Site.id == site_id)
+        .first()
+    )
+    if not site:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Site not found",
+        )
+    _check_tenant(claims, site.tenant_id, site.feed_token_version)
+
+    def render() -> bytes:
+        items = _latest_items(db.query(*FEED_COLUMNS.values()).filter(Item.site_id == site_id))
+        if fmt == "rss":
+            return render_rss(site.url, site.url, items)
+        return render_atom(site_id, site.url, site.url, items)
+
+    return _feed_response(request, "site", site_id, fmt, site.items_version, render)
+
+
+def _tenant_feed(request: Request, tenant_id: UUID, token: str, fmt: str, db: Session) -> Response:
+    claims = _feed_claims(token, "tenant", tenant_id)
+    tenant = (
+        db.query(Tenant.name, Tenant.items_version, Tenant.feed_token_version)
+        .filter(Tenant.id == tenant_id)
+        .first()
+    )
+    if not tenant:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Tenant not found",
+        )
+    _check_tenant(claims, tenant_id, tenant.feed_token_version)
+
+    def render() -> bytes:
+        items = _latest_items(
+            db.query(*FEED_COLUMNS.values()).join(Site).filter(Site.tenant_id == tenant_id)
+        )
+        link = settings.magic_link_base_url
+        if fmt == "rss":
+            return render_rss(tenant.name, link, items)
+        return render_atom(tenant_id, tenant.name, link, items)
+
+    return _feed_response(request, "tenant", tenant_id, fmt, tenant.items_version, render)
+
+
+def _feed_links(
+    request: Request, scope: str, resource_id: UUID, tenant_id: UUID, user: User, db: Session
+) -> FeedLinksResponse:
+    version = db.query(Tenant.feed_token_version).filter(Tenant.id == tenant_id).scalar()
+    # Tokens carry whole seconds
+    expires_at = (datetime.utcnow() + timedelta(days=settings.feed_token_ttl_days)).replace(
+        microsecond=0
+    )
+    token = create_feed_token(scope, str(resource_id), user.id, tenant_id, version, expires_at)
+    base = str(request.base_url)
+    return FeedLinksResponse(
+        token=token,
+        rss_url=feed_url(scope, resource_id, "rss", token, base),
+        atom_url=feed_url(scope, resource_id, "atom", token, base),
+        expires_at=expires_at,
+    )
+
+
+@router.get("/sites/{site_id}/feed-links", response_model=FeedLinksResponse)
+def get_site_feed_links(
+    site_id: UUID,
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> FeedLinksResponse:
+    """Signed RSS and Atom URLs for a site's items."""
+    site = db.query(Site).filter(Site.id == site_id).first()
+    if not site:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Site not found",
+        )
+
+    # Verify access
+    _ = require_tenant_access(site.tenant_id, current_user, db)
+
+    return _feed_links(request, "site", site_id, site.tenant_id, current_user, db)
+
+
+@router.get("/tenants/{tenant_id}/feed-links", response_model=FeedLinksResponse)
+def get_tenant_feed_links(
+    tenant_id: UUID,
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> FeedLinksResponse:
+    """Signed RSS and Atom URLs for all of a tenant's items (tenant admins)."""
+    # Verify access
+    _ = require_tenant_admin(tenant_id, current_user, db)
+
+    return _feed_links(request, "tenant", tenant_id, tenant_id, current_user, db)
+
+
+@router.post("/tenants/{tenant_id}/feed-links/rotate", response_model=FeedTokenRotateResponse)
+def rotate_feed_tokens(
+    tenant_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> FeedTokenRotateResponse:
+    """Revoke every feed URL issued for a tenant (tenant admins); feed-links then returns new ones."""
+    # Verify access
+    _ = require_tenant_admin(tenant_id, current_user, db)
+
+    db.query(Tenant).filter(Tenant.id == tenant_id).update(
+        {Tenant.feed_token_version: Tenant.feed_token_version + 1}, synchronize_session=False
+    )
+    db.commit()
+    return FeedTokenRotateResponse(success=True)
+
+
+@router.get("/sites/{site_id}/feed.xml")
+def get_site_rss(
+    site_id: UUID, token: str, request: Request, db: Session = Depends(get_db)
+) -> Response:
+    """RSS feed of a site's latest items."""
+    return _site_feed(request, site_id, token, "rss", db)
+
+
+@router.get("/sites/{site_id}/feed.atom")
+def get_site_atom(
+    site_id: UUID, token: str, request: Request, db: Session = Depends(get_db)
+) -> Response:
+    """Atom feed of a site's latest items."""
+    return _site_feed(request, site_id, token, "atom", db)
+
+
+@router.get("/tenants/{tenant_id}/feed.xml")
+def get_tenant_rss(
+    tenant_id: UUID, token: str, request: Request, db: Session = Depends(get_db)
+) -> Response:
+    """RSS feed of the latest items across a tenant's sites."""
+    return _tenant_feed(request, tenant_id, token, "rss", db)
+
+
+@router.get("/tenants/{tenant_id}/feed.atom")
+def get_tenant_atom(
+    tenant_id: UUID, token: str, request: Request, db: Session = Depends(get_db)
+) -> Response:
+    """Atom feed of the latest items across a tenant's sites."""
+    return _tenant_feed(request, tenant_id, token, "atom", db)
@@ -0,0 +1,147 @@
+"""Search router."""
+
+import base64
+from datetime import datetime
+from typing import Any, Optional
+from uuid import UUID
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy import REAL, cast, desc, func, tuple_
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.dependencies import get_current_user, require_tenant_access
+from app.models import Item, Site, User
+from app.schemas import SearchResponse
+from app.utils.http_cache import CacheValidator
+from app.utils.serialization import ITEM_COLUMNS, FastJSONResponse, rows_to_dicts
+
+router = APIRouter(prefix="/v1/search", tags=["search"])
+
+SEARCH_CONFIG = "english"
+MAX_LIMIT = 100
+HEADLINE_OPTIONS = "MaxFragments=2, MaxWords=18, MinWords=6, StartSel=<mark>, StopSel=</mark>"
+
+
+def _encode_cursor(rank: float, discovered_at: datetime, item_id: UUID) -> str:
+    return base64.urlsafe_b64encode(orjson.dumps([rank, discovered_at, item_id])).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[float, datetime, UUID]:
+    try:
+        rank, discovered_at, item_id = orjson.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return float(rank), datetime.fromisoformat(discovered_at), UUID(item_id)
+    except (ValueError, TypeError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        ) from e
+
+
+@router.get("", response_model=SearchResponse)
+def search_items(
+    q: str,
+    request: Request,
+    tenant_id: Optional[UUID] = None,
+    site_id: Optional[UUID] = None,
+    cursor: Optional[str] = None,
+    limit: int = 20,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> Response:
+    """Full-text search over a tenant's (or one site's) items.
+
+    ``q`` uses web search syntax (``"exact phrase"``, ``or``, ``-exclude``).
+    Results are ordered by relevance, then recency, with keyset pagination
+    via ``next_cursor``. Each result carries its ``rank`` and a highlighted
+    ``snippet``.
+    """
+    if not q.strip():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Query must not be empty",
+        )
+    limit = max(1, min(limit, MAX_LIMIT))
+
+    if site_id is not None:
+        site = db.query(Site).filter(Site.id == site_id).first()
+        if not site:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Site not found",
+            )
+        if tenant_id is not None and site.tenant_id != tenant_id:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Site does not belong to this tenant",
+            )
+        tenant_id = site.tenant_id
+    elif tenant_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="tenant_id or site_id is required",
+        )
+
+    # Verify access
+    _ = require_tenant_access(tenant_id, current_user, db)
+
+    validator = CacheValidator.for_tenants(db, request, [tenant_id])
+    if validator.is_fresh(request):
+        return validator.not_modified()
+
+    query = func.websearch_to_tsquery(SEARCH_CONFIG, q)
+    rank = func.ts_rank_cd(Item.search_vector, query)
+
+    # Rank and paginate on the GIN index matches first; headlines are only
+    # computed for the page that is returned
+    matches = db.query(*ITEM_COLUMNS.values(), rank.label("rank")).filter(
+        Item.search_vector.op("@@")(query)
+    )
+    if site_id is not None:
+        matches = matches.filter(Item.site_id == site_id)
+    else:
+        matches = matches.join(Site, Site.id == Item.site_id).filter(Site.tenant_id == tenant_id)
+
+    if cursor:
+        after_rank, after_discovered_at, after_id = _decode_cursor(cursor)
+        # float4 like ts_rank_cd, so the cursor compares equal to its own row
+        matches = matches.filter(
+            tuple_(rank, Item.discovered_at, Item.id)
+            < tuple_(cast(after_rank, REAL), after_discovered_at, after_id)
+        )
+
+    page = (
+        matches.order_by(desc("rank"), desc(Item.discovered_at), desc(Item.id))
+        .limit(limit + 1)
+        .subquery()
+    )
+    snippet = func.ts_headline(
+        SEARCH_CONFIG,
+        func.coalesce(page.c.title, func.regexp_replace(page.c.url, "[^[:alnum:]]+", " ", "g")),
+        query,
+        HEADLINE_OPTIONS,
+    )
+    rows = (
+        db.query(*(page.c[name] for name in ITEM_COLUMNS), page.c.rank, snippet)
+        .order_by(desc(page.c.rank), desc(page.c.discovered_at), desc(page.c.id))
+        .all()
+    )
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    results: list[dict[str, Any]] = rows_to_dicts(rows, [*ITEM_COLUMNS, "rank", "snippet"])
+    next_cursor = None
+    if has_more and results:
+        last = results[-1]
+        next_cursor = _encode_cursor(last["rank"], last["discovered_at"], last["id"])
+
+    return validator.apply(
+        FastJSONResponse(
+            {
+                "results": results,
+                "next_cursor": next_cursor,
+            }
+        )
+    )
@@ -69,6 +69,10 @@ def clear_runs_endpoint() -> dict:
         
         # Delete all runs
         conn.execute(text("DELETE FROM runs"))
+        # Invalidate cached dashboard reads (ETags) for every tenant
+        conn.execute(text(
+            "UPDATE tenants SET data_version = data_version + 1, data_changed_at = NOW()"
+        ))
         conn.commit()
         
         # Count runs after
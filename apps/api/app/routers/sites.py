@@ -1,39 +1,72 @@
 """Sites router."""
 
-from datetime import datetime
-from typing import Optional
+import io
+from collections.abc import Iterator
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from tempfile import SpooledTemporaryFile
+from typing import IO, Any, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import desc
-from sqlalchemy.dialects.postgresql import insert
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Connection, Engine, desc
 from sqlalchemy.orm import Session
-
-from app.database import get_db
-from app.dependencies import get_current_user, require_tenant_access, require_tenant_admin
-from app.models import Item, Role, Run, RunStatus, Site, User
+from starlette.concurrency import run_in_threadpool
+
+from app.database import SessionLocal, get_db
+from app.dependencies import (
+    get_current_user,
+    item_fields,
+    require_tenant_access,
+    require_tenant_admin,
+    run_fields,
+)
+from app.models import Item, Role, Run, Site, User
 from app.schemas import (
+    DailyStatsPoint,
+    DailyStatsResponse,
     ItemListResponse,
-    ItemResponse,
     RunListResponse,
-    RunResponse,
     RunTriggerResponse,
     SiteCreate,
+    SiteImportResponse,
     SiteListResponse,
     SiteResponse,
 )
-from app.services.worker_client import WorkerClient, WorkerClientError, get_worker_client
+from app.services import site_import
+from app.services.politeness import host_limiter
+from app.services.rollups import MAX_SERIES_DAYS, daily_series
+from app.services.runs import RunInProgress, execute_run
+from app.services.worker_client import WorkerClient, WorkerClientError
+from app.utils.http_cache import CacheValidator, bump_tenant_version
+from app.utils.serialization import (
+    ITEM_COLUMNS,
+    SITE_COLUMNS,
+    FastJSONResponse,
+    iter_ndjson,
+    rows_to_dicts,
+)
 
 router = APIRouter(prefix="/v1/sites", tags=["sites"])
 
+# How long a manual run waits for a busy host before returning 429
+TRIGGER_HOST_WAIT_SECONDS = 10.0
 
-@router.post("", response_model=SiteResponse)
-def create_site(
-    site: SiteCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-) -> SiteResponse:
-    """Create a new site."""
+# Bulk import uploads: size limit, and how much is buffered in memory before spooling to disk
+MAX_IMPORT_BYTES = 64 * 2**20
+IMPORT_SPOOL_BYTES = 4 * 2**20
+IMPORT_CONTENT_TYPES = {
+    "text/csv": "csv",
+    "application/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+}
+
+
+def _site_admin_tenant(current_user: User) -> UUID:
+    """The tenant new sites go into: the user's first, which they must administer."""
     # Get user's first tenant (or require tenant_id in request in production)
     user_tenant = current_user.user_tenants[0] if current_user.user_tenants else None
     if not user_tenant:
@@ -48,16 +81,29 @@ def create_site(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin access required to create sites",
         )
+    return user_tenant.tenant_id
+
+
+@router.post("", response_model=SiteResponse)
+def create_site(
+    site: SiteCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> SiteResponse:
+    """Create a new site."""
+    tenant_id = _site_admin_tenant(current_user)
 
     new_site = Site(
-        tenant_id=user_tenant.tenant_id,
+        tenant_id=tenant_id,
         url=site.url,
         profile_key=site.profile_key,
         interval_minutes=site.interval_minutes,
         keywords=site.keywords,
+        adaptive=site.adaptive,
         created_at=datetime.utcnow(),
     )
     db.add(new_site)
+    bump_tenant_version(db, tenant_id)
     db.commit()
     db.refresh(new_site)
 
@@ -69,53 +115,120 @@ def create_site(
         keywords=new_site.keywords,
         enabled=new_site.enabled,
         interval_minutes=new_site.interval_minutes,
+        adaptive=new_site.adaptive,
+        adaptive_interval_minutes=new_site.adaptive_interval_minutes,
         last_run_at=new_site.last_run_at,
+        next_run_at=new_site.next_run_at,
         created_at=new_site.created_at,
     )
 
 
+@router.post("/import", response_model=SiteImportResponse)
+async def import_sites(
+    request: Request,
+    format: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> SiteImportResponse:
+    """Create sites in bulk from a CSV or NDJSON request body.
+
+    The format comes from ``?format=csv|ndjson`` or the Content-Type
+    (``text/csv``, ``application/x-ndjson``). Invalid and duplicate rows are
+    skipped and reported by line; the rest are imported in one transaction.
+    """
+    fmt = format or IMPORT_CONTENT_TYPES.get(
+        request.headers.get("content-type", "").split(";")[0].strip().lower()
+    )
+    if fmt not in site_import.FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Send text/csv or application/x-ndjson, or pass ?format=csv|ndjson",
+        )
+    tenant_id = await run_in_threadpool(_site_admin_tenant, current_user)
+
+    # Spool the upload (to disk past IMPORT_SPOOL_BYTES) so it is parsed
+    # from a file rather than held in memory
+    with SpooledTemporaryFile(max_size=IMPORT_SPOOL_BYTES) as upload:
+        size = 0
+        async for chunk in request.stream():
+            size += len(chunk)
+            if size > MAX_IMPORT_BYTES:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail=f"Import files are limited to {MAX_IMPORT_BYTES // 2**20} MiB",
+                )
+            upload.write(chunk)
+        upload.seek(0)
+
+        report = await run_in_threadpool(_import_upload, db, tenant_id, upload, fmt)
+
+    return SiteImportResponse(**asdict(report))
+
+
+def _import_upload(
+    db: Session, tenant_id: UUID, upload: IO[bytes], fmt: str
+) -> site_import.ImportReport:
+    stream = io.TextIOWrapper(upload, encoding="utf-8-sig", newline="")
+    try:
+        report = site_import.import_sites(db, tenant_id, stream, fmt)
+    except site_import.ImportFileError as e:
+        db.rollback()
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+    finally:
+        stream.detach()
+
+    if report.imported:
+        bump_tenant_version(db, tenant_id)
+    db.commit()
+    return report
+
+
 @router.get("", response_model=SiteListResponse)
 def list_sites(
+    request: Request,
     page: int = 1,
     limit: int = 20,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> SiteListResponse:
+) -> Response:
     """List sites for user's tenant."""
     # Get user's tenants
     tenant_ids = [ut.tenant_id for ut in current_user.user_tenants]
 
+    validator = CacheValidator.for_tenants(db, request, tenant_ids)
+    if validator.is_fresh(request):
+        return validator.not_modified()
+
     # Query sites
     query = db.query(Site).filter(Site.tenant_id.in_(tenant_ids))
     total = query.count()
 
-    sites = query.order_by(desc(Site.created_at)).offset((page - 1) * limit).limit(limit).all()
-
-    return SiteListResponse(
-        sites=[
-            SiteResponse(
-                id=s.id,
-                tenant_id=s.tenant_id,
-                url=s.url,
-                profile_key=s.profile_key,
-                keywords=s.keywords,
-                enabled=s.enabled,
-                interval_minutes=s.interval_minutes,
-                last_run_at=s.last_run_at,
-                created_at=s.created_at,
-            )
-            for s in sites
-        ],
-        total=total,
+    rows = (
+        query.with_entities(*SITE_COLUMNS.values())
+        .order_by(desc(Site.created_at))
+        .offset((page - 1) * limit)
+        .limit(limit)
+        .all()
+    )
+
+    return validator.apply(
+        FastJSONResponse(
+            {
+                "sites": rows_to_dicts(rows, list(SITE_COLUMNS)),
+                "total": total,
+            }
+        )
     )
 
 
 @router.get("/{site_id}", response_model=SiteResponse)
 def get_site(
     site_id: UUID,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> SiteResponse:
+) -> SiteResponse | Response:
     """Get site details."""
     site = db.query(Site).filter(Site.id == site_id).first()
     if not site:
@@ -127,6 +240,11 @@ def get_site(
     # Verify access
     _ = require_tenant_access(site.tenant_id, current_user, db)
 
+    validator = CacheValidator.for_tenants(db, request, [site.tenant_id])
+    if validator.is_fresh(request):
+        return validator.not_modified()
+    response.headers.update(validator.headers())
+
     return SiteResponse(
         id=site.id,
         tenant_id=site.tenant_id,
@@ -135,7 +253,10 @@ def get_site(
         keywords=site.keywords,
         enabled=site.enabled,
         interval_minutes=site.interval_minutes,
+        adaptive=site.adaptive,
+        adaptive_interval_minutes=site.adaptive_interval_minutes,
         last_run_at=site.last_run_at,
+        next_run_at=site.next_run_at,
         created_at=site.created_at,
     )
 
@@ -146,7 +267,11 @@ def trigger_run(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ) -> RunTriggerResponse:
-    """Trigger a discovery run."""
+    """Trigger a discovery run.
+
+    If the site already has a run in progress, that run is returned with
+    status ``running`` instead of starting another.
+    """
     site = db.query(Site).filter(Site.id == site_id).first()
     if not site:
         raise HTTPException(
@@ -162,104 +287,66 @@ def trigger_run(
             detail="Admin access required to trigger runs",
         )
 
-    # Create run record
-    run = Run(
-        site_id=site.id,
-        status=RunStatus.RUNNING,
-        method="profile" if site.profile_key else "discover",
-        started_at=datetime.utcnow(),
-    )
-    db.add(run)
+    # Free the request's connection: the run uses the slot's connection only
+    site_url = site.url
     db.commit()
-    db.refresh(run)
 
-    # Call Worker
-    start_time = datetime.utcnow()
-    try:
-        with get_worker_client() as worker:
-            if site.profile_key == "rcmp_fsj":
-                response = worker.rcmp_fsj()
-            else:
-                response = worker.discover(site.url)
-
-        end_time = datetime.utcnow()
-        duration_ms = int((end_time - start_time).total_seconds() * 1000)
-
-        # Process results and create items
-        new_items_count = 0
-        if response.links:
-            for link in response.links:
-                # Insert item; ignore if (site_id, canonical_url) already exists
-                stmt = (
-                    insert(Item)
-                    .values(
-                        site_id=site.id,
-                        url=link,
-                        canonical_url=link,
-                        source=response.source,
-                        discovered_at=datetime.utcnow(),
-                    )
-                    .on_conflict_do_nothing(index_elements=[Item.site_id, Item.canonical_url])
+    with db.get_bind().connect() as conn:
+        with host_limiter.slot(conn, site_url, wait=TRIGGER_HOST_WAIT_SECONDS) as acquired:
+            if not acquired:
+                raise HTTPException(
+                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                    detail="Too many runs in progress for this host, try again shortly",
+                    headers={"Retry-After": "30"},
                 )
-                result = db.execute(stmt)
-                # rowcount is 1 if inserted, 0 if skipped due to conflict
-                if getattr(result, "rowcount", 0) == 1:
-                    new_items_count += 1
-
-        # Update run
-        run.status = RunStatus.SUCCESS
-        run.pages_scanned = response.count
-        run.duration_ms = duration_ms
-        run.diagnostics_json = response.diagnostics
-        run.finished_at = end_time
-
-        # Update site
-        site.last_run_at = end_time
-
-        db.commit()
-
-        # TODO: Trigger notifications (implement in next iteration)
-
-        return RunTriggerResponse(
-            run_id=run.id,
-            status="success",
-        )
-
-    except WorkerClientError as e:
-        end_time = datetime.utcnow()
-        duration_ms = int((end_time - start_time).total_seconds() * 1000)
-
-        # Update run as error
-        run.status = RunStatus.ERROR
-        run.duration_ms = duration_ms
-        run.diagnostics_json = {
-            "error": str(e),
-            "status_code": e.status_code,
-        }
-        run.finished_at = end_time
-
-        db.commit()
-
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "message": "Worker error",
-                "error": str(e),
-                "status_code": e.status_code,
-                "worker_response": e.response,
-            },
-        )
+            with SessionLocal(bind=conn) as run_db:
+                run_site = run_db.get(Site, site_id)
+                if run_site is None:
+                    # Deleted since the request's transaction ended
+                    raise HTTPException(
+                        status_code=status.HTTP_404_NOT_FOUND,
+                        detail="Site not found",
+                    )
+                try:
+                    run_id = execute_run(run_db, run_site).id
+                except RunInProgress as e:
+                    # Overlapping trigger (another request, replica or the scheduler)
+                    return RunTriggerResponse(run_id=e.run_id, status="running")
+                except WorkerClientError as e:
+                    raise HTTPException(
+                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                        detail={
+                            "message": "Worker error",
+                            "error": str(e),
+                            "status_code": e.status_code,
+                            "worker_response": e.response,
+                        },
+                    ) from e
+
+    return RunTriggerResponse(
+        run_id=run_id,
+        status="success",
+    )
 
 
 @router.get("/{site_id}/items", response_model=ItemListResponse)
 def list_items(
     site_id: UUID,
+    request: Request,
     cursor: Optional[str] = None,
     limit: int = 20,
+    keyword: Optional[str] = None,
+    collapse: bool = False,
+    columns: dict[str, Any] = Depends(item_fields),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> ItemListResponse:
-    """List items for a site (cursor pagination)."""
+) -> Response:
+    """List items for a site (cursor pagination).
+
+    ``fields`` (comma-separated) limits the columns returned; ``id`` is
+    always included. ``keyword`` keeps only items that matched that keyword.
+    ``collapse`` hides near-duplicates, keeping the first item of each group.
+    """
     site = db.query(Site).filter(Site.id == site_id).first()
     if not site:
         raise HTTPException(
@@ -270,50 +357,103 @@ def list_items(
     # Verify access
     _ = require_tenant_access(site.tenant_id, current_user, db)
 
+    validator = CacheValidator.for_tenants(db, request, [site.tenant_id])
+    if validator.is_fresh(request):
+        return validator.not_modified()
+
     # Query items
-    query = db.query(Item).filter(Item.site_id == site_id)
+    query = db.query(*columns.values()).filter(Item.site_id == site_id)
+
+    if keyword:
+        query = query.filter(Item.matched_keywords.contains([keyword]))
+
+    if collapse:
+        query = query.filter(Item.duplicate_of.is_(None))
 
     if cursor:
         # Cursor is the last item ID
         query = query.filter(Item.id < UUID(cursor))
 
-    items = query.order_by(desc(Item.discovered_at)).limit(limit + 1).all()
+    rows = query.order_by(desc(Item.discovered_at)).limit(limit + 1).all()
 
     # Check if there are more items
-    has_more = len(items) > limit
+    has_more = len(rows) > limit
     if has_more:
-        items = items[:limit]
-
-    next_cursor = str(items[-1].id) if items and has_more else None
-
-    return ItemListResponse(
-        items=[
-            ItemResponse(
-                id=item.id,
-                site_id=item.site_id,
-                url=item.url,
-                canonical_url=item.canonical_url,
-                title=item.title,
-                published_at=item.published_at,
-                discovered_at=item.discovered_at,
-                source=item.source,
-                meta_json=item.meta_json,
-            )
-            for item in items
-        ],
-        next_cursor=next_cursor,
+        rows = rows[:limit]
+
+    items = rows_to_dicts(rows, list(columns))
+    next_cursor = str(items[-1]["id"]) if items and has_more else None
+
+    return validator.apply(
+        FastJSONResponse(
+            {
+                "items": items,
+                "next_cursor": next_cursor,
+            }
+        )
+    )
+
+
+@router.get("/{site_id}/items/export")
+def export_items(
+    site_id: UUID,
+    columns: dict[str, Any] = Depends(item_fields),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> StreamingResponse:
+    """Export all items for a site as newline-delimited JSON."""
+    site = db.query(Site).filter(Site.id == site_id).first()
+    if not site:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Site not found",
+        )
+
+    # Verify access
+    _ = require_tenant_access(site.tenant_id, current_user, db)
+
+    return StreamingResponse(
+        _iter_items_export(db.get_bind(), site_id, columns),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="items-{site_id}.ndjson"'},
     )
 
 
+def _iter_items_export(
+    bind: Engine | Connection,
+    site_id: UUID,
+    columns: dict[str, Any] = ITEM_COLUMNS,
+) -> Iterator[bytes]:
+    """Stream a site's items as NDJSON.
+
+    Uses its own session so the export doesn't depend on the request session
+    still being open while the response body streams.
+    """
+    with Session(bind=bind) as export_db:
+        rows = (
+            export_db.query(*columns.values())
+            .filter(Item.site_id == site_id)
+            .order_by(desc(Item.discovered_at))
+            .yield_per(1000)
+        )
+        yield from iter_ndjson(rows, list(columns))
+
+
 @router.get("/{site_id}/runs", response_model=RunListResponse)
 def list_runs(
     site_id: UUID,
+    request: Request,
     page: int = 1,
     limit: int = 10,
+    columns: dict[str, Any] = Depends(run_fields),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> RunListResponse:
-    """List runs for a site."""
+) -> Response:
+    """List runs for a site.
+
+    ``fields`` (comma-separated) limits the columns returned, e.g.
+    ``fields=status,started_at`` skips ``diagnostics_json``.
+    """
     site = db.query(Site).filter(Site.id == site_id).first()
     if not site:
         raise HTTPException(
@@ -324,27 +464,70 @@ def list_runs(
     # Verify access
     _ = require_tenant_access(site.tenant_id, current_user, db)
 
+    validator = CacheValidator.for_tenants(db, request, [site.tenant_id])
+    if validator.is_fresh(request):
+        return validator.not_modified()
+
     # Query runs
     query = db.query(Run).filter(Run.site_id == site_id)
     total = query.count()
 
-    runs = query.order_by(desc(Run.started_at)).offset((page - 1) * limit).limit(limit).all()
-
-    return RunListResponse(
-        runs=[
-            RunResponse(
-                id=run.id,
-                site_id=run.site_id,
-                status=run.status.value,
-                method=run.method,
-                pages_scanned=run.pages_scanned,
-                duration_ms=run.duration_ms,
-                diagnostics_json=run.diagnostics_json,
-                started_at=run.started_at,
-                finished_at=run.finished_at,
-            )
-            for run in runs
-        ],
-        total=total,
+    rows = (
+        query.with_entities(*columns.values())
+        .order_by(desc(Run.started_at))
+        .offset((page - 1) * limit)
+        .limit(limit)
+        .all()
+    )
+
+    return validator.apply(
+        FastJSONResponse(
+            {
+                "runs": rows_to_dicts(rows, list(columns)),
+                "total": total,
+            }
+        )
     )
 
+
+@router.get("/{site_id}/stats/daily", response_model=DailyStatsResponse)
+def get_site_daily_stats(
+    site_id: UUID,
+    request: Request,
+    response: Response,
+    days: int = 30,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> DailyStatsResponse | Response:
+    """Daily items and run metrics for a site over the last ``days`` days."""
+    if not 1 <= days <= MAX_SERIES_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"days must be between 1 and {MAX_SERIES_DAYS}",
+        )
+
+    site = db.query(Site).filter(Site.id == site_id).first()
+    if not site:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Site not found",
+        )
+
+    # Verify access
+    _ = require_tenant_access(site.tenant_id, current_user, db)
+
+    today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    validator = CacheValidator.for_tenants(db, request, [site.tenant_id], valid_from=today_start)
+    if validator.is_fresh(request):
+        return validator.not_modified()
+    response.headers.update(validator.headers())
+
+    end = today_start.date()
+    start = end - timedelta(days=days - 1)
+    points = daily_series(db, [site.id], start, end)
+
+    return DailyStatsResponse(
+        start=start,
+        end=end,
+        points=[DailyStatsPoint.model_validate(point) for point in points],
+    )
@@ -0,0 +1,73 @@
+"""Server-Sent Events router."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+from uuid import UUID
+
+import orjson
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.database import get_db
+from app.dependencies import get_current_user, require_tenant_access
+from app.models import User
+from app.services.events import broker
+
+router = APIRouter(prefix="/v1/stream", tags=["stream"])
+
+HEARTBEAT_SECONDS = 15.0
+RETRY_MS = 5000
+
+
+def format_event(event: dict[str, Any]) -> bytes:
+    """One SSE message: the event type and its JSON payload."""
+    event_type: str = event["type"]
+    return b"event: " + event_type.encode() + b"\ndata: " + orjson.dumps(event) + b"\n\n"
+
+
+async def _event_stream(
+    request: Request, queue: asyncio.Queue[dict[str, Any]]
+) -> AsyncIterator[bytes]:
+    try:
+        yield f"retry: {RETRY_MS}\n\n".encode()
+        while True:
+            try:
+                event = await asyncio.wait_for(queue.get(), timeout=HEARTBEAT_SECONDS)
+            except TimeoutError:
+                if await request.is_disconnected():
+                    break
+                # Comment line keeps proxies from closing an idle connection
+                yield b": keepalive\n\n"
+                continue
+            yield format_event(event)
+    finally:
+        broker.unsubscribe(queue)
+
+
+@router.get("")
+async def stream_events(
+    tenant_id: UUID,
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> StreamingResponse:
+    """Stream a tenant's new items and run status changes (``text/event-stream``).
+
+    Events are ``run`` and ``items``; each ``data`` line is a JSON object
+    ``{type, tenant_id, data}``. Events published while a client is
+    disconnected are not replayed; clients should refetch lists on reconnect.
+    """
+    # Verify access
+    _ = await run_in_threadpool(require_tenant_access, tenant_id, current_user, db)
+    # Return the pooled connection now rather than holding it for the stream
+    db.close()
+
+    queue = broker.subscribe([tenant_id])
+    return StreamingResponse(
+        _event_stream(request, queue),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -23,6 +23,9 @@ def create_tenant(
     new_tenant = Tenant(
         name=tenant.name,
         plan=tenant.plan,
+        keywords=tenant.keywords,
+        min_interval_minutes=tenant.min_interval_minutes,
+        max_interval_minutes=tenant.max_interval_minutes,
         created_at=datetime.utcnow(),
     )
     db.add(new_tenant)
@@ -33,6 +36,9 @@ def create_tenant(
         id=new_tenant.id,
         name=new_tenant.name,
         plan=new_tenant.plan,
+        keywords=new_tenant.keywords,
+        min_interval_minutes=new_tenant.min_interval_minutes,
+        max_interval_minutes=new_tenant.max_interval_minutes,
         created_at=new_tenant.created_at,
     )
 
@@ -51,6 +57,9 @@ def list_tenants(
                 id=t.id,
                 name=t.name,
                 plan=t.plan,
+                keywords=t.keywords,
+                min_interval_minutes=t.min_interval_minutes,
+                max_interval_minutes=t.max_interval_minutes,
                 created_at=t.created_at,
             )
             for t in tenants
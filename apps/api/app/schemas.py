@@ -1,6 +1,6 @@
 """Pydantic schemas for request/response validation."""
 
-from datetime import datetime
+from datetime import date, datetime
 from typing import Any, Optional
 from uuid import UUID
 
@@ -35,6 +35,12 @@ class TokenResponse(BaseModel):
     user: "UserResponse"
 
 
+class LogoutResponse(BaseModel):
+    """Logout response."""
+
+    success: bool
+
+
 # User schemas
 class UserBase(BaseModel):
     """User base schema."""
@@ -77,6 +83,9 @@ class TenantBase(BaseModel):
 
     name: str
     plan: str = "free"
+    keywords: Optional[list[str]] = None
+    min_interval_minutes: int = Field(15, ge=1)
+    max_interval_minutes: int = Field(1440, ge=1)
 
 
 class TenantCreate(TenantBase):
@@ -146,6 +155,7 @@ class SiteBase(BaseModel):
     profile_key: Optional[str] = None
     interval_minutes: int = 60
     keywords: Optional[list[str]] = None
+    adaptive: bool = False
 
 
 class SiteCreate(SiteBase):
@@ -162,6 +172,7 @@ class SiteUpdate(BaseModel):
     interval_minutes: Optional[int] = None
     keywords: Optional[list[str]] = None
     enabled: Optional[bool] = None
+    adaptive: Optional[bool] = None
 
 
 class SiteResponse(SiteBase):
@@ -170,7 +181,9 @@ class SiteResponse(SiteBase):
     id: UUID
     tenant_id: UUID
     enabled: bool
+    adaptive_interval_minutes: Optional[int] = None
     last_run_at: Optional[datetime] = None
+    next_run_at: Optional[datetime] = None
     created_at: datetime
 
     class Config:
@@ -184,6 +197,25 @@ class SiteListResponse(BaseModel):
     total: int
 
 
+class SiteImportError(BaseModel):
+    """A row a bulk import skipped."""
+
+    line: int
+    url: Optional[str] = None
+    error: str
+
+
+class SiteImportResponse(BaseModel):
+    """Bulk site import report."""
+
+    rows: int
+    imported: int
+    duplicates: int
+    invalid: int
+    errors: list[SiteImportError]
+    errors_truncated: bool = False
+
+
 # Run schemas
 class RunResponse(BaseModel):
     """Run response schema."""
@@ -229,6 +261,8 @@ class ItemResponse(BaseModel):
     discovered_at: datetime
     source: Optional[str] = None
     meta_json: Optional[dict[str, Any]] = None
+    matched_keywords: Optional[list[str]] = None
+    duplicate_of: Optional[UUID] = None
 
     class Config:
         from_attributes = True
@@ -241,6 +275,58 @@ class ItemListResponse(BaseModel):
     next_cursor: Optional[str] = None
 
 
+# Search schemas
+class SearchResult(ItemResponse):
+    """Search hit: an item with its relevance and highlighted snippet."""
+
+    rank: float
+    snippet: Optional[str] = None
+
+
+class SearchResponse(BaseModel):
+    """Search response."""
+
+    results: list[SearchResult]
+    next_cursor: Optional[str] = None
+
+
+# Change feed schemas
+class ChangeResponse(BaseModel):
+    """One change log entry, with the entity as it is now (None if deleted)."""
+
+    seq: int
+    kind: str
+    site_id: UUID
+    entity_id: UUID
+    created_at: datetime
+    item: Optional[ItemResponse] = None
+    run: Optional[RunResponse] = None
+
+
+class ChangeListResponse(BaseModel):
+    """Ordered batch of changes."""
+
+    changes: list[ChangeResponse]
+    next_since: int
+    has_more: bool
+
+
+# Feed schemas
+class FeedLinksResponse(BaseModel):
+    """Signed feed URLs for a site or tenant."""
+
+    token: str
+    rss_url: str
+    atom_url: str
+    expires_at: datetime
+
+
+class FeedTokenRotateResponse(BaseModel):
+    """Feed token rotation response."""
+
+    success: bool
+
+
 # Webhook schemas
 class WebhookBase(BaseModel):
     """Webhook base schema."""
@@ -319,6 +405,39 @@ class DashboardStatsResponse(BaseModel):
         from_attributes = True
 
 
+class DailyStatsPoint(BaseModel):
+    """One day of a time series."""
+
+    day: date
+    items_new: int
+    runs_total: int
+    runs_success: int
+    runs_error: int
+    success_rate: Optional[float] = None
+    avg_duration_ms: Optional[int] = None
+    pages_scanned: int
+
+    class Config:
+        from_attributes = True
+
+
+class DailyStatsResponse(BaseModel):
+    """Daily time series response."""
+
+    start: date
+    end: date
+    points: list[DailyStatsPoint]
+
+
+class SchedulingStatsResponse(BaseModel):
+    """Worker calls per day for adaptive sites, fixed vs learned intervals."""
+
+    adaptive_sites: int
+    fixed_runs_per_day: float
+    adaptive_runs_per_day: float
+    runs_saved_per_day: float
+
+
 class TeamMemberResponse(BaseModel):
     """Team member response."""
 
@@ -0,0 +1,132 @@
+"""Adaptive polling intervals learned from item arrivals.
+
+New items on a site are treated as a Poisson process with rate ``λ`` (items
+per hour). Each run observes ``new_items / hours since the previous run``.
+That observation is folded into an exponentially weighted moving average
+with a ``HALF_LIFE_HOURS`` half-life, so a burst raises the rate quickly
+and a quiet week lets it decay. The rate is seeded from the site's last
+``HISTORY_DAYS`` of ``discovered_at`` history.
+
+The next interval ``T`` balances Worker calls (``1/T`` per hour) against
+detection delay (items arrive at ``λ`` and wait ``T/2`` on average), with
+one item-hour of delay costing ``DELAY_COST`` calls. Minimizing
+``1/T + DELAY_COST·λ·T/2`` gives ``T = sqrt(2 / (DELAY_COST·λ))``, clamped
+to the tenant's min/max bounds: a site posting hourly is polled every 30
+minutes, a daily one every ~2.5 hours and a monthly one every ~13 hours.
+"""
+
+import math
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models import Item, Site
+
+HALF_LIFE_HOURS = 72.0
+DELAY_COST = 8.0
+HISTORY_DAYS = 14
+# Floor on the observation window, so back-to-back manual runs don't
+# produce an absurd rate
+MIN_ELAPSED_HOURS = 0.25
+
+MINUTES_PER_DAY = 24 * 60
+
+
+def update_rate(previous: Optional[float], new_items: int, elapsed_hours: float) -> float:
+    """Fold one run's observation into the EWMA rate (items per hour)."""
+    elapsed_hours = max(elapsed_hours, MIN_ELAPSED_HOURS)
+    observed = new_items / elapsed_hours
+    if previous is None:
+        return observed
+    # Longer gaps carry more evidence, so they move the average further
+    alpha = 1 - 0.5 ** (elapsed_hours / HALF_LIFE_HOURS)
+    return previous + alpha * (observed - previous)
+
+
+def interval_for_rate(rate: Optional[float], min_minutes: int, max_minutes: int) -> int:
+    """Cost-minimizing interval in minutes for a posting rate, within bounds."""
+    if not rate or rate <= 0:
+        return max_minutes
+    minutes = math.sqrt(2 / (DELAY_COST * rate)) * 60
+    return int(min(max(minutes, min_minutes), max_minutes))
+
+
+def history_rate(db: Session, site_id: UUID, now: datetime) -> Optional[float]:
+    """Poisson rate estimate (items per hour) from the last ``HISTORY_DAYS``.
+
+    Items from the site's first discovery are its backlog, not arrivals, so
+    the window starts after it. None if there is no history yet.
+    """
+    first_seen = db.query(func.min(Item.discovered_at)).filter(Item.site_id == site_id).scalar()
+    if first_seen is None:
+        return None
+    since = max(now - timedelta(days=HISTORY_DAYS), first_seen)
+    count = (
+        db.query(func.count())
+        .select_from(Item)
+        .filter(Item.site_id == site_id, Item.discovered_at > since)
+        .scalar()
+    )
+    hours = (now - since).total_seconds() / 3600
+    if hours < MIN_ELAPSED_HOURS:
+        return None
+    return count / hours
+
+
+def learn_interval(
+    db: Session, site: Site, finished_at: datetime, new_items: Optional[int]
+) -> int:
+    """Update the site's learned rate after a run and return its next interval.
+
+    ``new_items`` is None for failed runs, which keep the current rate. Until
+    a rate is known, ``interval_minutes`` (within bounds) is used. Call
+    before ``site.last_run_at`` is moved to this run.
+    """
+    tenant = site.tenant
+    if new_items is not None and site.last_run_at is not None:
+        if site.item_rate is None:
+            site.item_rate = history_rate(db, site.id, finished_at)
+        else:
+            elapsed_hours = (finished_at - site.last_run_at).total_seconds() / 3600
+            site.item_rate = update_rate(site.item_rate, new_items, elapsed_hours)
+
+    if site.item_rate is None:
+        minutes = min(
+            max(site.interval_minutes or 60, tenant.min_interval_minutes),
+            tenant.max_interval_minutes,
+        )
+    else:
+        minutes = interval_for_rate(
+            site.item_rate, tenant.min_interval_minutes, tenant.max_interval_minutes
+        )
+    site.adaptive_interval_minutes = minutes
+    return minutes
+
+
+@dataclass
+class AdaptiveSavings:
+    adaptive_sites: int
+    fixed_runs_per_day: float
+    adaptive_runs_per_day: float
+
+    @property
+    def runs_saved_per_day(self) -> float:
+        return self.fixed_runs_per_day - self.adaptive_runs_per_day
+
+
+def adaptive_savings(db: Session, tenant_id: UUID) -> AdaptiveSavings:
+    """Worker calls per day for a tenant's adaptive sites, fixed vs learned intervals."""
+    rows = (
+        db.query(Site.interval_minutes, Site.adaptive_interval_minutes)
+        .filter(Site.tenant_id == tenant_id, Site.adaptive.is_(True), Site.enabled.isnot(False))
+        .all()
+    )
+    fixed = sum(MINUTES_PER_DAY / (interval or 60) for interval, _ in rows)
+    learned = sum(
+        MINUTES_PER_DAY / (adaptive_interval or interval or 60) for interval, adaptive_interval in rows
+    )
+    return AdaptiveSavings(len(rows), fixed, learned)
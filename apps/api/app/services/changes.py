@@ -0,0 +1,61 @@
+"""Per-tenant change log for incremental sync (``GET /v1/changes``).
+
+Item inserts and run completions are appended with a per-tenant ``seq``.
+Sequence numbers are allocated by incrementing ``tenants.change_seq``, which
+holds the tenant row lock until commit: a later writer cannot commit lower
+numbers after a reader has seen higher ones, so ``seq > since`` never skips
+entries. Writers already update the tenant row (``bump_tenant_version``) in
+the same transaction, so this adds no new contention.
+"""
+
+from collections.abc import Sequence
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import insert, update
+from sqlalchemy.orm import Session
+
+from app.models import ChangeLogEntry, Tenant
+
+ITEM = "item"
+RUN = "run"
+
+
+def record_changes(
+    db: Session,
+    tenant_id: UUID,
+    site_id: UUID,
+    changes: Sequence[tuple[str, UUID, datetime]],
+) -> int:
+    """Append ``(kind, entity_id, entity_time)`` changes in order.
+
+    Returns the last sequence number assigned. Runs in the caller's
+    transaction; the caller commits.
+    """
+    if not changes:
+        return db.query(Tenant.change_seq).filter(Tenant.id == tenant_id).scalar()
+
+    last_seq = db.execute(
+        update(Tenant)
+        .where(Tenant.id == tenant_id)
+        .values(change_seq=Tenant.change_seq + len(changes))
+        .returning(Tenant.change_seq)
+    ).scalar_one()
+    first_seq = last_seq - len(changes) + 1
+    now = datetime.utcnow()
+    db.execute(
+        insert(ChangeLogEntry),
+        [
+            {
+                "tenant_id": tenant_id,
+                "seq": first_seq + offset,
+                "kind": kind,
+                "site_id": site_id,
+                "entity_id": entity_id,
+                "entity_time": entity_time,
+                "created_at": now,
+            }
+            for offset, (kind, entity_id, entity_time) in enumerate(changes)
+        ],
+    )
+    return last_seq
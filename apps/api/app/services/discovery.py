@@ -0,0 +1,199 @@
+"""Coalesced Worker discovery calls.
+
+Sites in different tenants often monitor the same URL, and every
+``rcmp_fsj`` site gets the same profile data. Worker calls are keyed by
+``discovery_key`` (the profile, or the normalized URL for ``/discover``)
+and shared:
+
+- within a process, concurrent callers with one key wait on a single call
+  (single flight);
+- across processes, the caller holding the key's advisory lock makes the
+  call and stores the response in ``discovery_cache`` for ``ttl`` seconds;
+  callers polling for the lock, and runs shortly after, read that response.
+  A caller that can't get the lock within ``lock_wait`` seconds makes its
+  own call, so a stuck holder never blocks the others.
+
+Only successful responses with at most ``SHARE_MAX_LINKS`` links are
+cached and shared, so a Worker error is retried by the next run and a huge
+sitemap is never held in memory or in the cache. Each site still gets its
+own Run and item inserts.
+"""
+
+import hashlib
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Generic, Optional, TypeVar, cast
+
+from sqlalchemy import Connection, Engine, text
+
+from app.config import settings
+from app.models import Site
+from app.services.worker_client import WorkerResponse
+from app.utils.urls import normalize_url
+
+T = TypeVar("T")
+
+SHARE_MAX_LINKS = 5000
+
+POLL_SECONDS = 0.2
+
+_TRY_LOCK = text("SELECT pg_try_advisory_lock(:key)")
+_UNLOCK = text("SELECT pg_advisory_unlock(:key)")
+
+_GET = text("""
+    SELECT response FROM discovery_cache
+    WHERE key = :key AND expires_at > timezone('utc', now())
+""")
+
+_PUT = text("""
+    INSERT INTO discovery_cache (key, response, expires_at)
+    VALUES (:key, CAST(:response AS json), timezone('utc', now()) + make_interval(secs => :ttl))
+    ON CONFLICT (key) DO UPDATE
+    SET response = EXCLUDED.response, expires_at = EXCLUDED.expires_at
+""")
+
+
+def discovery_key(site: Site) -> str:
+    """Key of the Worker call a site's run makes; equal keys get equal responses."""
+    if site.profile_key:
+        return f"profile:{site.profile_key}"
+    return f"discover:{normalize_url(site.url)}"
+
+
+def _lock_key(key: str) -> int:
+    digest = hashlib.blake2b(f"discovery:{key}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+@dataclass
+class _Flight(Generic[T]):
+    done: threading.Event = field(default_factory=threading.Event)
+    result: Optional[T] = None
+    error: Optional[BaseException] = None
+
+
+class SingleFlight(Generic[T]):
+    """Runs one call per key at a time; concurrent callers share its outcome."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._flights: dict[str, _Flight[T]] = {}
+
+    def do(self, key: str, call: Callable[[], T]) -> tuple[T, bool]:
+        """Result of ``call`` and whether it came from another caller's flight.
+
+        Followers re-raise the leader's exception.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            # Set by the leader before done, since it did not fail
+            return cast(T, flight.result), True
+
+        try:
+            result = flight.result = call()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return result, False
+
+
+class DiscoveryCoalescer:
+    """Shares Worker discovery responses between runs with the same key."""
+
+    def __init__(self, ttl: float = 60.0, lock_wait: float = 30.0):
+        self.ttl = ttl
+        self.lock_wait = lock_wait
+        # (response, cached, shareable) per flight
+        self.flights: SingleFlight[tuple[WorkerResponse, bool, bool]] = SingleFlight()
+
+    def fetch(
+        self, bind: Engine, key: str, call: Callable[[], tuple[WorkerResponse, bool]]
+    ) -> tuple[WorkerResponse, bool]:
+        """Response for ``key`` and whether it was shared rather than fetched by this caller.
+
+        ``call`` makes the Worker request and returns the response and
+        whether it may be shared; it runs at most once per key across
+        processes while a response is cached. Callers waiting on a response
+        that may not be shared (too large), or for longer than
+        ``lock_wait`` seconds on another process's call, make their own
+        call. With ``ttl <= 0`` only in-process coalescing applies.
+        """
+        while True:
+            (response, cached, shareable), joined = self.flights.do(
+                key, lambda: self._fetch(bind, key, call)
+            )
+            if not joined:
+                return response, cached
+            if shareable:
+                return response, True
+
+    def _fetch(
+        self, bind: Engine, key: str, call: Callable[[], tuple[WorkerResponse, bool]]
+    ) -> tuple[WorkerResponse, bool, bool]:
+        if self.ttl <= 0:
+            response, shareable = call()
+            return response, False, shareable
+
+        with bind.connect() as conn:
+            cached = self._get(conn, key)
+            if cached is not None:
+                return cached, True, True
+
+            lock = _lock_key(key)
+            deadline = time.monotonic() + self.lock_wait
+            while not self._try_lock(conn, lock):
+                if time.monotonic() >= deadline:
+                    # The holder is slow or stuck; don't wait on it any longer
+                    response, shareable = call()
+                    return response, False, shareable
+                time.sleep(POLL_SECONDS)
+                # The holder may have stored its response already
+                cached = self._get(conn, key)
+                if cached is not None:
+                    return cached, True, True
+            try:
+                # Another process may have fetched it while we waited
+                cached = self._get(conn, key)
+                if cached is not None:
+                    return cached, True, True
+                response, shareable = call()
+                if shareable:
+                    conn.execute(
+                        _PUT, {"key": key, "response": response.model_dump_json(), "ttl": self.ttl}
+                    )
+                    # Waiters read the cache as soon as they get the lock
+                    conn.commit()
+                return response, False, shareable
+            finally:
+                conn.rollback()
+                conn.execute(_UNLOCK, {"key": lock})
+                conn.commit()
+
+    def _try_lock(self, conn: Connection, lock: int) -> bool:
+        locked = bool(conn.execute(_TRY_LOCK, {"key": lock}).scalar())
+        conn.commit()
+        return locked
+
+    def _get(self, conn: Connection, key: str) -> Optional[WorkerResponse]:
+        response = conn.execute(_GET, {"key": key}).scalar()
+        conn.commit()
+        return WorkerResponse.model_validate(response) if response is not None else None
+
+
+discovery = DiscoveryCoalescer(
+    ttl=settings.discovery_cache_ttl_seconds, lock_wait=settings.discovery_lock_wait_seconds
+)
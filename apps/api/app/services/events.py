@@ -0,0 +1,192 @@
+"""Real-time events over Postgres LISTEN/NOTIFY.
+
+Writers publish with ``pg_notify`` inside their transaction, so an event is
+delivered only if (and when) the change commits. Each API process holds one
+LISTEN connection (``EventBroker``), started on the first subscription, and
+fans notifications out to per-client asyncio queues by tenant. Open
+dashboards therefore cost one database connection per process, not one
+polling query per client.
+
+Events are JSON objects ``{"type", "tenant_id", "data"}``:
+
+- ``run``: a run started or finished (``data`` is the run's status fields)
+- ``items``: a run inserted new items (``data.items`` may be truncated to
+  fit the NOTIFY payload limit; ``data.count`` is always the full count)
+"""
+
+import asyncio
+import logging
+import select
+import threading
+from collections import defaultdict
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any, Optional
+from uuid import UUID
+
+import orjson
+import psycopg2
+import psycopg2.extensions
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.database import engine
+from app.models import Item, Run
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "site_events"
+# Postgres rejects payloads of 8000 bytes or more
+MAX_PAYLOAD_BYTES = 7500
+QUEUE_SIZE = 100
+
+_NOTIFY = text("SELECT pg_notify(:channel, :payload)")
+
+
+def _encode(event_type: str, tenant_id: UUID, data: dict[str, Any]) -> bytes:
+    return orjson.dumps({"type": event_type, "tenant_id": tenant_id, "data": data})
+
+
+def publish(db: Session, event_type: str, tenant_id: UUID, data: dict[str, Any]) -> None:
+    """Queue an event for delivery when the caller's transaction commits."""
+    db.execute(
+        _NOTIFY, {"channel": CHANNEL, "payload": _encode(event_type, tenant_id, data).decode()}
+    )
+
+
+def publish_run(db: Session, tenant_id: UUID, run: Run, items_new: Optional[int] = None) -> None:
+    """Publish a run status change."""
+    data = {
+        "id": run.id,
+        "site_id": run.site_id,
+        "status": run.status.value,
+        "started_at": run.started_at,
+        "finished_at": run.finished_at,
+        "duration_ms": run.duration_ms,
+    }
+    if items_new is not None:
+        data["items_new"] = items_new
+    publish(db, "run", tenant_id, data)
+
+
+def publish_items(
+    db: Session,
+    tenant_id: UUID,
+    run: Run,
+    item_ids: Sequence[UUID],
+    discovered_at: datetime,
+) -> None:
+    """Publish one event for a run's batch of new items."""
+    if not item_ids:
+        return
+    rows = (
+        db.query(Item.id, Item.url, Item.title, Item.discovered_at, Item.duplicate_of)
+        .filter(Item.id.in_(item_ids), Item.discovered_at == discovered_at)
+        .order_by(Item.url)
+        .all()
+    )
+    data: dict[str, Any] = {
+        "site_id": run.site_id,
+        "run_id": run.id,
+        "count": len(item_ids),
+        "items": [],
+        "truncated": False,
+    }
+    budget = MAX_PAYLOAD_BYTES - len(_encode("items", tenant_id, data))
+    for row in rows:
+        item = dict(row._mapping)
+        size = len(orjson.dumps(item)) + 1
+        if size > budget:
+            data["truncated"] = True
+            break
+        data["items"].append(item)
+        budget -= size
+    publish(db, "items", tenant_id, data)
+
+
+class EventBroker:
+    """One LISTEN connection fanned out to many asyncio subscribers."""
+
+    def __init__(self, dsn: str, channel: str = CHANNEL, reconnect_seconds: float = 5.0):
+        self.dsn = dsn
+        self.channel = channel
+        self.reconnect_seconds = reconnect_seconds
+        self._subscribers: dict[str, set[asyncio.Queue[dict[str, Any]]]] = defaultdict(set)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    def subscribe(self, tenant_ids: Sequence[UUID]) -> asyncio.Queue[dict[str, Any]]:
+        """Queue receiving the tenants' events; call from the event loop."""
+        self._ensure_started(asyncio.get_running_loop())
+        queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=QUEUE_SIZE)
+        for tenant_id in tenant_ids:
+            self._subscribers[str(tenant_id)].add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue[dict[str, Any]]) -> None:
+        for tenant_id in list(self._subscribers):
+            self._subscribers[tenant_id].discard(queue)
+            if not self._subscribers[tenant_id]:
+                del self._subscribers[tenant_id]
+
+    def subscriber_count(self) -> int:
+        return len({id(queue) for queues in self._subscribers.values() for queue in queues})
+
+    def _ensure_started(self, loop: asyncio.AbstractEventLoop) -> None:
+        with self._lock:
+            self._loop = loop
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._listen, name="event-broker", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.reconnect_seconds)
+
+    def dispatch(self, payload: str) -> None:
+        """Deliver one notification payload to its tenant's subscribers."""
+        try:
+            event = orjson.loads(payload)
+            tenant_id = event["tenant_id"]
+        except (orjson.JSONDecodeError, KeyError, TypeError):
+            logger.warning("Ignoring malformed event payload")
+            return
+        for queue in list(self._subscribers.get(tenant_id, ())):
+            if queue.full():
+                # Slow client: drop its oldest event rather than block others
+                queue.get_nowait()
+            queue.put_nowait(event)
+
+    def _listen(self) -> None:
+        while not self._stop.is_set():
+            try:
+                conn = psycopg2.connect(self.dsn)
+            except psycopg2.Error:
+                logger.exception("Event listener could not connect; retrying")
+                self._stop.wait(self.reconnect_seconds)
+                continue
+            try:
+                conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+                with conn.cursor() as cursor:
+                    cursor.execute(f'LISTEN "{self.channel}"')
+                while not self._stop.is_set():
+                    if select.select([conn], [], [], 1.0) == ([], [], []):
+                        continue
+                    conn.poll()
+                    while conn.notifies:
+                        notify = conn.notifies.pop(0)
+                        if self._loop is not None:
+                            self._loop.call_soon_threadsafe(self.dispatch, notify.payload)
+            except (psycopg2.Error, OSError):
+                logger.exception("Event listener connection lost; reconnecting")
+                self._stop.wait(self.reconnect_seconds)
+            finally:
+                conn.close()
+
+
+broker = EventBroker(engine.url.set(drivername="postgresql").render_as_string(hide_password=False))
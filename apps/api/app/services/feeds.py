@@ -0,0 +1,154 @@
+"""RSS and Atom feeds of recently discovered items.
+
+Feeds are rendered from the latest ``FEED_SIZE`` items of a site or tenant.
+Sites and tenants carry an ``items_version`` counter that ingestion bumps
+only when it inserts new items, so rendered bytes are cached under that
+version and reused across polls until new items arrive. Run bookkeeping,
+which bumps ``data_version`` on every run, does not invalidate feeds.
+"""
+
+import threading
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from collections.abc import Hashable, Sequence
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import Any, Callable, Optional
+from uuid import UUID
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.models import Site, Tenant
+
+FEED_SIZE = 50
+
+RSS_MEDIA_TYPE = "application/rss+xml"
+ATOM_MEDIA_TYPE = "application/atom+xml"
+
+_ATOM_NS = "http://www.w3.org/2005/Atom"
+ET.register_namespace("", _ATOM_NS)
+
+
+def bump_items_version(db: Session, site_id: UUID, tenant_id: UUID) -> None:
+    """Invalidate cached feeds for a site and its tenant (call before the commit)."""
+    db.execute(update(Site).where(Site.id == site_id).values(items_version=Site.items_version + 1))
+    db.execute(
+        update(Tenant).where(Tenant.id == tenant_id).values(items_version=Tenant.items_version + 1)
+    )
+
+
+def _rfc822(value: datetime) -> str:
+    return format_datetime(value.replace(tzinfo=timezone.utc), usegmt=True)
+
+
+def _rfc3339(value: datetime) -> str:
+    return value.replace(tzinfo=None, microsecond=0).isoformat() + "Z"
+
+
+def _item_title(item: dict[str, Any]) -> str:
+    return item["title"] or item["url"]
+
+
+def _item_date(item: dict[str, Any]) -> datetime:
+    return item["published_at"] or item["discovered_at"]
+
+
+def render_rss(title: str, link: str, items: Sequence[dict[str, Any]]) -> bytes:
+    """RSS 2.0 document for ``items`` (newest first)."""
+    rss = ET.Element("rss", version="2.0")
+    channel = ET.SubElement(rss, "channel")
+    ET.SubElement(channel, "title").text = title
+    ET.SubElement(channel, "link").text = link
+    ET.SubElement(channel, "description").text = f"New posts on {title}"
+    if items:
+        ET.SubElement(channel, "lastBuildDate").text = _rfc822(items[0]["discovered_at"])
+
+    for item in items:
+        entry = ET.SubElement(channel, "item")
+        ET.SubElement(entry, "title").text = _item_title(item)
+        ET.SubElement(entry, "link").text = item["url"]
+        ET.SubElement(entry, "guid", isPermaLink="false").text = str(item["id"])
+        ET.SubElement(entry, "pubDate").text = _rfc822(_item_date(item))
+        for keyword in item["matched_keywords"] or ():
+            ET.SubElement(entry, "category").text = keyword
+
+    return ET.tostring(rss, encoding="utf-8", xml_declaration=True)
+
+
+def render_atom(
+    feed_id: UUID, title: str, link: str, items: Sequence[dict[str, Any]]
+) -> bytes:
+    """Atom 1.0 document for ``items`` (newest first)."""
+
+    def tag(name: str) -> str:
+        return f"{{{_ATOM_NS}}}{name}"
+
+    feed = ET.Element(tag("feed"))
+    ET.SubElement(feed, tag("id")).text = feed_id.urn
+    ET.SubElement(feed, tag("title")).text = title
+    ET.SubElement(feed, tag("link"), href=link)
+    updated = items[0]["discovered_at"] if items else datetime.utcnow()
+    ET.SubElement(feed, tag("updated")).text = _rfc3339(updated)
+
+    for item in items:
+        entry = ET.SubElement(feed, tag("entry"))
+        ET.SubElement(entry, tag("id")).text = item["id"].urn
+        ET.SubElement(entry, tag("title")).text = _item_title(item)
+        ET.SubElement(entry, tag("link"), href=item["url"])
+        ET.SubElement(entry, tag("updated")).text = _rfc3339(item["discovered_at"])
+        ET.SubElement(entry, tag("published")).text = _rfc3339(_item_date(item))
+        for keyword in item["matched_keywords"] or ():
+            ET.SubElement(entry, tag("category"), term=keyword)
+
+    return ET.tostring(feed, encoding="utf-8", xml_declaration=True)
+
+
+class FeedCache:
+    """Bounded LRU of rendered feeds, keyed by resource, format and version."""
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self._entries: OrderedDict[Hashable, tuple[int, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, version: int, render: Callable[[], bytes]) -> bytes:
+        """Cached bytes for ``key`` at ``version``, rendering them on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(key)
+                return entry[1]
+
+        # Render outside the lock; a concurrent duplicate render is harmless
+        body = render()
+        with self._lock:
+            current = self._entries.get(key)
+            if current is None or current[0] <= version:
+                self._entries[key] = (version, body)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return body
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+feed_cache = FeedCache()
+
+
+def feed_etag(scope: str, resource_id: UUID, fmt: str, version: int) -> str:
+    """Strong ETag: the rendered bytes are identical for a given version."""
+    return f'"{scope}-{resource_id}-{fmt}-{version}"'
+
+
+def feed_url(scope: str, resource_id: UUID, fmt: str, token: str, base: Optional[str] = None) -> str:
+    """Path (or absolute URL under ``base``) of a feed, token included."""
+    extension = "xml" if fmt == "rss" else "atom"
+    path = f"/v1/{scope}s/{resource_id}/feed.{extension}?token={token}"
+    return f"{base.rstrip('/')}{path}" if base else path
@@ -0,0 +1,160 @@
+"""Cached health for the liveness and readiness probes.
+
+``/livez`` does no I/O. ``/readyz`` returns the last snapshot taken by
+``HealthMonitor``, which checks the database, the connection pool and the
+Worker circuit every ``HEALTH_CHECK_INTERVAL_SECONDS`` in a daemon thread,
+so probes never take a pool connection or wait on the database.
+
+A replica is ``ready`` when the database answered and the pool is below
+``HEALTH_POOL_SATURATION``. Status is:
+
+- ``ok``: ready, Worker circuit closed;
+- ``degraded``: the pool is saturated (not ready) or the Worker circuit is
+  open (still ready: only runs are affected);
+- ``unavailable``: the database check failed, or no check has finished
+  within three intervals (the monitor is stuck);
+- ``starting``: no check has finished yet.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import asdict, dataclass, field, replace
+from typing import Any, Optional
+
+from sqlalchemy import Engine, text
+
+from app.config import settings
+from app.database import engine
+from app.services.worker_client import CircuitBreaker, worker_circuit
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class HealthSnapshot:
+    """One health check's result."""
+
+    status: str
+    ready: bool
+    database: str
+    pool: dict[str, Any] = field(default_factory=dict)
+    worker_circuit: Optional[str] = None
+    checked_at: Optional[float] = None  # time.time()
+    check_ms: Optional[float] = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+STARTING = HealthSnapshot(status="starting", ready=False, database="unknown")
+
+
+def pool_stats(engine: Engine) -> dict[str, Any]:
+    """Checked-out connections against capacity; empty for pools without a limit."""
+    pool = engine.pool
+    if not hasattr(pool, "checkedout") or not hasattr(pool, "size"):
+        return {}
+    capacity = pool.size() + max(getattr(pool, "_max_overflow", 0), 0)
+    checked_out = pool.checkedout()
+    return {
+        "checked_out": checked_out,
+        "capacity": capacity,
+        "saturation": round(checked_out / capacity, 2) if capacity else 0.0,
+    }
+
+
+class HealthMonitor:
+    """Periodically checks health and keeps the latest snapshot."""
+
+    def __init__(
+        self,
+        engine: Engine,
+        breaker: CircuitBreaker,
+        interval: float = 5.0,
+        max_saturation: float = 1.0,
+    ):
+        self.engine = engine
+        self.breaker = breaker
+        self.interval = interval
+        self.max_saturation = max_saturation
+        self._snapshot = STARTING
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def check(self) -> HealthSnapshot:
+        """Run one check and store its snapshot."""
+        start = time.perf_counter()
+        # Read pool use before the check takes a connection itself
+        pool = pool_stats(self.engine)
+        saturated = pool.get("saturation", 0.0) >= self.max_saturation
+        if saturated and pool["checked_out"] >= pool["capacity"]:
+            # Connecting would wait for the pool timeout; the connections in
+            # use say as much about the database as the last check did
+            database = self._snapshot.database
+        else:
+            database = self._ping()
+
+        circuit = self.breaker.state
+        if database != "connected":
+            status = "unavailable"
+        elif saturated or circuit != CircuitBreaker.CLOSED:
+            status = "degraded"
+        else:
+            status = "ok"
+
+        self._snapshot = HealthSnapshot(
+            status=status,
+            ready=database == "connected" and not saturated,
+            database=database,
+            pool=pool,
+            worker_circuit=circuit,
+            checked_at=time.time(),
+            check_ms=round((time.perf_counter() - start) * 1000, 1),
+        )
+        return self._snapshot
+
+    def _ping(self) -> str:
+        try:
+            with self.engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+            return "connected"
+        except Exception as e:
+            logger.warning("Health check: database unavailable: %s", e)
+            return "disconnected"
+
+    def snapshot(self) -> HealthSnapshot:
+        """Latest snapshot, without I/O; unavailable if checks have stalled."""
+        snapshot = self._snapshot
+        if snapshot.checked_at is not None and time.time() - snapshot.checked_at > 3 * self.interval:
+            return replace(snapshot, status="unavailable", ready=False)
+        return snapshot
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.check()
+            except Exception:
+                logger.exception("Health check failed")
+            self._stop.wait(self.interval)
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="health", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval)
+            self._thread = None
+
+
+health_monitor = HealthMonitor(
+    engine,
+    worker_circuit,
+    interval=settings.health_check_interval_seconds,
+    max_saturation=settings.health_pool_saturation,
+)
@@ -0,0 +1,90 @@
+"""Item ingestion for discovery runs."""
+
+from collections.abc import Iterable
+from datetime import datetime
+from itertools import islice
+from typing import Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy import String, bindparam, text
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Session
+
+from app.services.near_duplicates import NearDuplicateIndex
+from app.utils.keyword_matcher import KeywordMatcher
+
+# Insert dedup keys first; only keys that were new produce an item row. One
+# statement per batch instead of one INSERT per link. Keyword matches travel
+# as unit-separator-joined strings because unnest() flattens nested arrays.
+_INSERT_ITEMS = text("""
+    WITH links AS (
+        SELECT * FROM unnest(
+            CAST(:ids AS uuid[]), CAST(:urls AS varchar[]), CAST(:matches AS varchar[])
+        ) AS link (id, url, matches)
+    ), new_keys AS (
+        INSERT INTO item_keys (site_id, canonical_url, item_id, discovered_at)
+        SELECT :site_id, url, id, :discovered_at FROM links
+        ON CONFLICT (site_id, canonical_url) DO NOTHING
+        RETURNING item_id
+    )
+    INSERT INTO items (id, site_id, url, canonical_url, source, discovered_at, matched_keywords)
+    SELECT links.id, :site_id, links.url, links.url, :source, :discovered_at,
+           string_to_array(NULLIF(links.matches, ''), chr(31))
+    FROM new_keys JOIN links ON links.id = new_keys.item_id
+    RETURNING id, url
+""").bindparams(
+    bindparam("site_id", type_=PG_UUID(as_uuid=True)),
+).columns(id=PG_UUID(as_uuid=True), url=String)
+
+_MATCH_SEPARATOR = "\x1f"
+
+BATCH_SIZE = 1000
+
+
+def insert_items(
+    db: Session,
+    site_id: UUID,
+    links: Iterable[str],
+    source: Optional[str],
+    discovered_at: Optional[datetime] = None,
+    matcher: Optional[KeywordMatcher] = None,
+    near_duplicates: Optional[NearDuplicateIndex] = None,
+) -> list[UUID]:
+    """Insert links as items for a site, skipping URLs the site already has.
+
+    ``links`` is consumed ``BATCH_SIZE`` at a time, so it can be a stream of
+    any length. With a ``matcher``, each link is matched against the site's
+    keywords and the matches are stored in ``matched_keywords``. With
+    ``near_duplicates``, new items are fingerprinted and ``duplicate_of`` is
+    set on those that repeat an item the tenant already has. Returns the ids
+    of the newly inserted items. Runs in the caller's transaction; the
+    caller commits.
+    """
+    discovered_at = discovered_at or datetime.utcnow()
+    links = iter(links)
+
+    new_ids: list[UUID] = []
+    while chunk := list(islice(links, BATCH_SIZE)):
+        # Preserve order, drop duplicates within the batch; repeats across
+        # batches hit the item_keys conflict
+        batch = list(dict.fromkeys(link for link in chunk if link))
+        if not batch:
+            continue
+        result = db.execute(
+            _INSERT_ITEMS,
+            {
+                "site_id": site_id,
+                "ids": [str(uuid4()) for _ in batch],
+                "urls": batch,
+                "matches": [
+                    _MATCH_SEPARATOR.join(matcher.match(url)) if matcher else "" for url in batch
+                ],
+                "source": source,
+                "discovered_at": discovered_at,
+            },
+        )
+        inserted = result.all()
+        new_ids.extend(row.id for row in inserted)
+        if near_duplicates is not None and inserted:
+            near_duplicates.add(db, [(row.id, row.url, None) for row in inserted], discovered_at)
+    return new_ids
@@ -0,0 +1,123 @@
+"""Magic link token storage.
+
+Tokens are kept by hash (``hash_token``) with an expiry, and can be used
+once. The store is chosen by ``MAGIC_LINK_STORE``:
+
+- ``database`` (default): the ``magic_link_tokens`` table, so the callback
+  may land on any API process or replica. ``consume`` is a single
+  ``DELETE ... RETURNING``, so two concurrent callbacks cannot both use a
+  token.
+- ``memory``: a process-local dict, for single-process development without
+  migrations.
+
+Expired rows are never accepted; ``sweep`` deletes them and is run by
+``app.jobs.magic_links`` (the memory store also sweeps as it goes).
+"""
+
+import threading
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import Optional, Protocol
+
+from sqlalchemy import delete
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models import MagicLinkToken
+from app.utils.auth import hash_token
+
+
+class MagicLinkStore(Protocol):
+    def put(self, db: Session, token: str, email: str, now: datetime) -> None:
+        """Store ``token`` for ``email`` until ``now`` plus the store's TTL."""
+        ...
+
+    def consume(self, db: Session, token: str, now: datetime) -> Optional[str]:
+        """Remove ``token`` and return its email, or None if unknown or expired."""
+        ...
+
+    def sweep(self, db: Session, now: datetime) -> int:
+        """Delete expired tokens; returns how many."""
+        ...
+
+
+class DatabaseMagicLinkStore:
+    """Tokens in ``magic_link_tokens``, shared by all API processes."""
+
+    def __init__(self, ttl: timedelta):
+        self.ttl = ttl
+
+    def put(self, db: Session, token: str, email: str, now: datetime) -> None:
+        db.add(
+            MagicLinkToken(
+                token_hash=hash_token(token),
+                email=email,
+                expires_at=now + self.ttl,
+                created_at=now,
+            )
+        )
+        db.commit()
+
+    def consume(self, db: Session, token: str, now: datetime) -> Optional[str]:
+        email = db.execute(
+            delete(MagicLinkToken)
+            .where(MagicLinkToken.token_hash == hash_token(token), MagicLinkToken.expires_at > now)
+            .returning(MagicLinkToken.email)
+        ).scalar_one_or_none()
+        db.commit()
+        return email
+
+    def sweep(self, db: Session, now: datetime) -> int:
+        deleted = db.execute(
+            delete(MagicLinkToken).where(MagicLinkToken.expires_at <= now)
+        ).rowcount
+        db.commit()
+        return deleted
+
+
+class MemoryMagicLinkStore:
+    """Process-local tokens; a callback on another process will not find them."""
+
+    def __init__(self, ttl: timedelta):
+        self.ttl = ttl
+        self._tokens: dict[str, tuple[str, datetime]] = {}
+        self._lock = threading.Lock()
+
+    def put(self, db: Session, token: str, email: str, now: datetime) -> None:
+        self.sweep(db, now)
+        with self._lock:
+            self._tokens[hash_token(token)] = (email, now + self.ttl)
+
+    def consume(self, db: Session, token: str, now: datetime) -> Optional[str]:
+        with self._lock:
+            entry = self._tokens.pop(hash_token(token), None)
+        if entry is None or entry[1] <= now:
+            return None
+        return entry[0]
+
+    def sweep(self, db: Session, now: datetime) -> int:
+        with self._lock:
+            expired = [key for key, (_, expires_at) in self._tokens.items() if expires_at <= now]
+            for key in expired:
+                del self._tokens[key]
+        return len(expired)
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+
+STORES: dict[str, Callable[[timedelta], MagicLinkStore]] = {
+    "database": DatabaseMagicLinkStore,
+    "memory": MemoryMagicLinkStore,
+}
+
+
+def create_store(kind: str, ttl: timedelta) -> MagicLinkStore:
+    if kind not in STORES:
+        raise ValueError(f"Unknown magic link store {kind!r}; expected one of {sorted(STORES)}")
+    return STORES[kind](ttl)
+
+
+magic_link_store = create_store(
+    settings.magic_link_store, timedelta(minutes=settings.magic_link_ttl_minutes)
+)
@@ -0,0 +1,143 @@
+"""Near-duplicate detection for newly ingested items.
+
+The same story often appears under several URLs, on one site or across a
+tenant's sites. Each new item gets a MinHash signature (``app.utils.minhash``)
+and its band keys go into ``item_minhash_bands``. Candidates are the items
+sharing a band key, found with one indexed lookup per batch. A candidate
+whose estimated similarity clears the threshold makes the new item a
+duplicate, and ``duplicate_of`` points at the earliest item of the group.
+"""
+
+from collections import defaultdict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Session
+
+from app.utils.minhash import SIMILARITY_THRESHOLD, band_keys, item_tokens, signature, similarity
+
+_CANDIDATES = text("""
+    SELECT bands.band_key, items.id, items.duplicate_of, items.minhash
+    FROM item_minhash_bands AS bands
+    JOIN items ON items.id = bands.item_id AND items.discovered_at = bands.discovered_at
+    WHERE bands.tenant_id = :tenant_id AND bands.band_key = ANY(CAST(:band_keys AS bigint[]))
+""").bindparams(
+    bindparam("tenant_id", type_=PG_UUID(as_uuid=True)),
+).columns(id=PG_UUID(as_uuid=True), duplicate_of=PG_UUID(as_uuid=True))
+
+# Signatures travel as comma-joined strings because unnest() flattens
+# nested arrays
+_UPDATE_ITEMS = text("""
+    UPDATE items
+    SET minhash = CAST(string_to_array(fingerprint.minhash, ',') AS bigint[]),
+        duplicate_of = fingerprint.duplicate_of
+    FROM unnest(
+        CAST(:ids AS uuid[]), CAST(:minhashes AS varchar[]), CAST(:duplicate_of AS uuid[])
+    ) AS fingerprint (id, minhash, duplicate_of)
+    WHERE items.id = fingerprint.id AND items.discovered_at = :discovered_at
+""")
+
+_INSERT_BANDS = text("""
+    INSERT INTO item_minhash_bands (tenant_id, band_key, item_id, discovered_at)
+    SELECT :tenant_id, band.key, band.item_id, :discovered_at
+    FROM unnest(CAST(:band_keys AS bigint[]), CAST(:item_ids AS uuid[])) AS band (key, item_id)
+    ON CONFLICT DO NOTHING
+""").bindparams(
+    bindparam("tenant_id", type_=PG_UUID(as_uuid=True)),
+)
+
+
+@dataclass
+class _Fingerprinted:
+    item_id: UUID
+    group_id: UUID  # earliest item of its near-duplicate group
+    signature: list[int]
+
+
+def find_duplicate(
+    sig: list[int], keys: list[int], candidates: dict[int, list[_Fingerprinted]]
+) -> Optional[_Fingerprinted]:
+    """Most similar candidate sharing a band key, if similar enough."""
+    best: Optional[_Fingerprinted] = None
+    best_score = SIMILARITY_THRESHOLD
+    for key in keys:
+        for candidate in candidates.get(key, ()):
+            score = similarity(sig, candidate.signature)
+            if score >= best_score and (best is None or score > best_score):
+                best, best_score = candidate, score
+    return best
+
+
+class NearDuplicateIndex:
+    """Flags near-duplicates among a tenant's items as they are ingested."""
+
+    def __init__(self, tenant_id: UUID):
+        self.tenant_id = tenant_id
+
+    def add(
+        self,
+        db: Session,
+        items: Sequence[tuple[UUID, str, Optional[str]]],
+        discovered_at: datetime,
+    ) -> dict[UUID, UUID]:
+        """Fingerprint and index new ``(id, url, title)`` items.
+
+        Items are compared with the tenant's indexed items and with earlier
+        items in ``items``. Returns ``{item_id: duplicate_of}`` for the items
+        found to be near-duplicates. Runs in the caller's transaction.
+        """
+        fingerprints: dict[UUID, tuple[list[int], list[int]]] = {}
+        for item_id, url, title in items:
+            sig = signature(item_tokens(url, title))
+            if sig is not None:
+                fingerprints[item_id] = (sig, band_keys(sig))
+        if not fingerprints:
+            return {}
+
+        candidates: dict[int, list[_Fingerprinted]] = defaultdict(list)
+        rows = db.execute(
+            _CANDIDATES,
+            {
+                "tenant_id": self.tenant_id,
+                "band_keys": sorted({key for _, keys in fingerprints.values() for key in keys}),
+            },
+        )
+        for band_key, item_id, duplicate_of, minhash in rows:
+            if minhash:
+                candidates[band_key].append(_Fingerprinted(item_id, duplicate_of or item_id, minhash))
+
+        duplicates: dict[UUID, UUID] = {}
+        for item_id, (sig, keys) in fingerprints.items():
+            match = find_duplicate(sig, keys, candidates)
+            group_id = match.group_id if match else item_id
+            if match:
+                duplicates[item_id] = group_id
+            entry = _Fingerprinted(item_id, group_id, sig)
+            for key in keys:
+                candidates[key].append(entry)
+
+        ids = list(fingerprints)
+        db.execute(
+            _UPDATE_ITEMS,
+            {
+                "ids": [str(item_id) for item_id in ids],
+                "minhashes": [",".join(map(str, fingerprints[i][0])) for i in ids],
+                "duplicate_of": [str(duplicates[i]) if i in duplicates else None for i in ids],
+                "discovered_at": discovered_at,
+            },
+        )
+        db.execute(
+            _INSERT_BANDS,
+            {
+                "tenant_id": self.tenant_id,
+                "band_keys": [key for i in ids for key in fingerprints[i][1]],
+                "item_ids": [str(i) for i in ids for _ in fingerprints[i][1]],
+                "discovered_at": discovered_at,
+            },
+        )
+        return duplicates
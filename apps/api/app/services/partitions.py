@@ -0,0 +1,156 @@
+"""Monthly range partition management for ``items`` and ``runs``.
+
+Both tables are declaratively partitioned by month on their timestamp column
+(``items.discovered_at``, ``runs.started_at``; see migration 003), with a
+``_default`` partition as a safety net. This module creates partitions ahead
+of time and implements retention as a partition detach + drop instead of a
+bulk DELETE.
+
+Partitions are named ``<table>_pYYYY_MM``.
+"""
+
+import re
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Optional
+
+from sqlalchemy import Connection, text
+
+PARTITIONED_TABLES: dict[str, str] = {
+    "items": "discovered_at",
+    "runs": "started_at",
+}
+
+_PARTITION_NAME = re.compile(r"^(?P<table>\w+)_p(?P<year>\d{4})_(?P<month>\d{2})$")
+
+
+@dataclass(frozen=True)
+class MonthPartition:
+    """One monthly partition of a table."""
+
+    table: str
+    start: date
+
+    @property
+    def end(self) -> date:
+        return add_months(self.start, 1)
+
+    @property
+    def name(self) -> str:
+        return f"{self.table}_p{self.start:%Y_%m}"
+
+    def create_sql(self) -> str:
+        return (
+            f"CREATE TABLE IF NOT EXISTS {self.name} PARTITION OF {self.table} "
+            f"FOR VALUES FROM ('{self.start.isoformat()}') TO ('{self.end.isoformat()}')"
+        )
+
+
+def month_start(value: date | datetime) -> date:
+    """First day of the month containing ``value``."""
+    return date(value.year, value.month, 1)
+
+
+def add_months(value: date, months: int) -> date:
+    """Shift a month-start date by ``months``."""
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def months_between(start: date | datetime, end: date | datetime) -> list[date]:
+    """Month starts from ``start``'s month through ``end``'s month, inclusive."""
+    current, last = month_start(start), month_start(end)
+    months = []
+    while current <= last:
+        months.append(current)
+        current = add_months(current, 1)
+    return months
+
+
+def parse_partition_name(name: str) -> Optional[MonthPartition]:
+    """Inverse of ``MonthPartition.name``; None for non-monthly partitions."""
+    match = _PARTITION_NAME.match(name)
+    if not match or match.group("table") not in PARTITIONED_TABLES:
+        return None
+    return MonthPartition(
+        match.group("table"), date(int(match.group("year")), int(match.group("month")), 1)
+    )
+
+
+def is_partitioned(conn: Connection, table: str) -> bool:
+    """Whether ``table`` is a partitioned table (False on plain test schemas)."""
+    return bool(
+        conn.execute(
+            text(
+                "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table pt "
+                "JOIN pg_class c ON c.oid = pt.partrelid WHERE c.relname = :table)"
+            ),
+            {"table": table},
+        ).scalar()
+    )
+
+
+def list_partitions(conn: Connection, table: str) -> list[MonthPartition]:
+    """Existing monthly partitions of ``table``, oldest first."""
+    rows = conn.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = :table"
+        ),
+        {"table": table},
+    ).fetchall()
+    partitions = [parse_partition_name(row[0]) for row in rows]
+    return sorted((p for p in partitions if p is not None), key=lambda p: p.start)
+
+
+def ensure_partitions(
+    conn: Connection,
+    months_ahead: int = 3,
+    start: Optional[date | datetime] = None,
+) -> list[str]:
+    """Create missing monthly partitions from ``start`` (default: this month)
+    through ``months_ahead`` months from now. Returns the partitions created.
+
+    Run this well ahead of time (the partitions job does it daily): a month
+    whose rows have already landed in ``_default`` can't be attached.
+    """
+    today = datetime.utcnow()
+    first = month_start(start or today)
+    last = add_months(month_start(today), months_ahead)
+
+    created = []
+    for table in PARTITIONED_TABLES:
+        if not is_partitioned(conn, table):
+            continue
+        existing = {p.name for p in list_partitions(conn, table)}
+        for month in months_between(first, last):
+            partition = MonthPartition(table, month)
+            if partition.name not in existing:
+                conn.execute(text(partition.create_sql()))
+                created.append(partition.name)
+    return created
+
+
+def drop_partitions_before(
+    conn: Connection,
+    table: str,
+    cutoff: date | datetime,
+    dry_run: bool = False,
+) -> list[str]:
+    """Detach and drop monthly partitions that end on or before ``cutoff``.
+
+    Whole months only: a partition is dropped once every row in it is older
+    than the cutoff. With ``dry_run`` nothing is dropped.
+    """
+    cutoff_date = cutoff.date() if isinstance(cutoff, datetime) else cutoff
+    dropped = []
+    for partition in list_partitions(conn, table):
+        if partition.end > cutoff_date:
+            continue
+        if not dry_run:
+            conn.execute(text(f"ALTER TABLE {table} DETACH PARTITION {partition.name}"))
+            conn.execute(text(f"DROP TABLE {partition.name}"))
+        dropped.append(partition.name)
+    return dropped
@@ -0,0 +1,107 @@
+"""Per-host politeness for discovery runs.
+
+Runs are grouped by the registrable domain of ``Site.url``, so a news
+network's sections share one budget. Each host gets at most
+``max_concurrency`` runs in flight and at least ``min_spacing`` seconds
+between run starts. Both limits are enforced in Postgres, so they hold
+across every API and scheduler process:
+
+- concurrency: one session-level advisory lock per slot (``host``, ``i``),
+  held on the run's own connection and released automatically if the
+  process dies;
+- spacing: an atomic upsert on ``host_politeness`` reserves the next start
+  time, and the holder sleeps until it.
+
+Runs against other hosts never wait on a busy host.
+"""
+
+import hashlib
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Optional
+
+from sqlalchemy import Connection, text
+
+from app.config import settings
+from app.utils.urls import registrable_domain
+
+POLL_SECONDS = 0.1
+
+_TRY_LOCK = text("SELECT pg_try_advisory_lock(:key)")
+_UNLOCK = text("SELECT pg_advisory_unlock(:key)")
+
+# Returns how long to wait for the reserved start (negative: start now)
+_RESERVE_START = text("""
+    INSERT INTO host_politeness AS hp (host, next_start_at)
+    VALUES (:host, timezone('utc', now()) + make_interval(secs => :spacing))
+    ON CONFLICT (host) DO UPDATE
+    SET next_start_at = greatest(hp.next_start_at, timezone('utc', now()))
+                        + make_interval(secs => :spacing)
+    RETURNING extract(epoch FROM hp.next_start_at - timezone('utc', now())) - :spacing
+""")
+
+
+def slot_key(host: str, slot: int) -> int:
+    """Signed 64-bit advisory lock key for one concurrency slot of a host."""
+    digest = hashlib.blake2b(f"host-slot:{host}:{slot}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+class HostLimiter:
+    """Cross-process per-host concurrency limit and start spacing."""
+
+    def __init__(self, max_concurrency: int = 2, min_spacing: float = 2.0):
+        self.max_concurrency = max_concurrency
+        self.min_spacing = min_spacing
+
+    def _try_acquire(self, conn: Connection, host: str) -> Optional[int]:
+        for slot in range(self.max_concurrency):
+            key = slot_key(host, slot)
+            if conn.execute(_TRY_LOCK, {"key": key}).scalar():
+                return key
+        return None
+
+    @contextmanager
+    def slot(self, conn: Connection, url: str, wait: float = 0.0) -> Iterator[bool]:
+        """Hold a run slot for ``url``'s host; yields False if none freed within ``wait`` seconds.
+
+        Locks are held on ``conn``, which must not be in a transaction; the
+        run's session may be bound to it, but must end its transaction
+        before the block exits. When a slot is acquired, the block starts no
+        earlier than ``min_spacing`` seconds after the host's previous run
+        start.
+        """
+        host = registrable_domain(url)
+        deadline = time.monotonic() + wait
+        key = self._try_acquire(conn, host)
+        while key is None and time.monotonic() < deadline:
+            conn.commit()
+            time.sleep(POLL_SECONDS)
+            key = self._try_acquire(conn, host)
+        conn.commit()
+        if key is None:
+            yield False
+            return
+
+        try:
+            delay = conn.execute(_RESERVE_START, {"host": host, "spacing": self.min_spacing}).scalar()
+            conn.commit()
+            if delay and delay > 0:
+                time.sleep(float(delay))
+            yield True
+        finally:
+            try:
+                conn.execute(_UNLOCK, {"key": key})
+                conn.commit()
+            except Exception:
+                # A session lock would outlive the run on a pooled
+                # connection; dropping the connection releases it
+                conn.invalidate()
+                raise
+
+
+host_limiter = HostLimiter(
+    max_concurrency=settings.host_max_concurrency,
+    min_spacing=settings.host_min_spacing_seconds,
+)
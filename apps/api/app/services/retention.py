@@ -0,0 +1,291 @@
+"""Run retention: prune old runs and their diagnostics per plan.
+
+Each plan keeps a site's most recent ``keep_runs`` runs (and nothing older
+than ``max_age_days``), and clears ``diagnostics_json`` on runs older than
+``diagnostics_days``. Pruned runs are folded into ``run_daily_summaries``
+in the same statement that deletes them, so run counts are preserved.
+
+Work is done per site in small batches, each in its own short transaction
+with a ``lock_timeout``, with a pause between batches so retention never
+holds long locks or saturates the database. Runs started today and runs
+still ``running`` are never pruned.
+
+``bytes_reclaimed`` is the logical size of the pruned rows and cleared
+diagnostics (``pg_column_size``); disk space is returned to Postgres by
+autovacuum, not to the OS.
+"""
+
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import Connection, Engine, bindparam, select, text, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+
+from app.models import Site, Tenant
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """Run retention limits for one plan."""
+
+    keep_runs: int
+    max_age_days: Optional[int] = None
+    diagnostics_days: Optional[int] = None
+
+
+PLAN_POLICIES: dict[str, RetentionPolicy] = {
+    "free": RetentionPolicy(keep_runs=100, max_age_days=30, diagnostics_days=7),
+    "starter": RetentionPolicy(keep_runs=500, max_age_days=90, diagnostics_days=14),
+    "pro": RetentionPolicy(keep_runs=2000, max_age_days=365, diagnostics_days=30),
+    "enterprise": RetentionPolicy(keep_runs=10000, max_age_days=None, diagnostics_days=90),
+}
+
+DEFAULT_PLAN = "free"
+
+
+def policy_for_plan(plan: Optional[str]) -> RetentionPolicy:
+    """Retention policy for a plan; unknown plans get the free policy."""
+    return PLAN_POLICIES.get(plan or DEFAULT_PLAN, PLAN_POLICIES[DEFAULT_PLAN])
+
+
+@dataclass
+class RetentionReport:
+    """What a retention pass did (or, in dry-run mode, would do)."""
+
+    dry_run: bool = False
+    sites: int = 0
+    runs_pruned: int = 0
+    diagnostics_cleared: int = 0
+    bytes_reclaimed: int = 0
+    tenants_changed: set[UUID] = field(default_factory=set)
+
+    def add(self, other: "RetentionReport") -> None:
+        self.sites += other.sites
+        self.runs_pruned += other.runs_pruned
+        self.diagnostics_cleared += other.diagnostics_cleared
+        self.bytes_reclaimed += other.bytes_reclaimed
+        self.tenants_changed |= other.tenants_changed
+
+
+# Runs outside the policy for one site, oldest first. Windowing over the
+# (site_id, started_at) index keeps this to one site's rows.
+_PRUNE_CANDIDATES = """
+    SELECT id, started_at, row_size FROM (
+        SELECT id, started_at, status, pg_column_size(runs.*) AS row_size,
+               row_number() OVER (ORDER BY started_at DESC) AS position
+        FROM runs
+        WHERE site_id = :site_id
+    ) ranked
+    WHERE status <> 'running'
+      AND started_at < :protect_from
+      AND (position > :keep_runs OR started_at < :max_age_cutoff)
+    ORDER BY started_at
+"""
+
+_SELECT_PRUNE_BATCH = text(_PRUNE_CANDIDATES + " LIMIT :batch_size").bindparams(
+    bindparam("site_id", type_=PG_UUID(as_uuid=True)),
+)
+
+_ESTIMATE_PRUNE = text(
+    f"SELECT count(*), coalesce(sum(row_size), 0) FROM ({_PRUNE_CANDIDATES}) candidates"
+).bindparams(
+    bindparam("site_id", type_=PG_UUID(as_uuid=True)),
+)
+
+# Delete a batch and fold it into the daily summaries in one statement.
+# started_at bounds let Postgres prune to the partitions involved.
+_PRUNE_BATCH = text("""
+    WITH pruned AS (
+        DELETE FROM runs
+        WHERE id = ANY(:ids) AND started_at BETWEEN :oldest AND :newest
+        RETURNING site_id, status, pages_scanned, duration_ms, started_at
+    ), summarized AS (
+        INSERT INTO run_daily_summaries AS summary (
+            site_id, day, runs_total, runs_success, runs_error,
+            pages_scanned, duration_ms_total, duration_ms_max
+        )
+        SELECT site_id, CAST(started_at AS date), count(*),
+               count(*) FILTER (WHERE status = 'success'),
+               count(*) FILTER (WHERE status = 'error'),
+               coalesce(sum(pages_scanned), 0), coalesce(sum(duration_ms), 0), max(duration_ms)
+        FROM pruned
+        GROUP BY site_id, CAST(started_at AS date)
+        ON CONFLICT (site_id, day) DO UPDATE SET
+            runs_total = summary.runs_total + EXCLUDED.runs_total,
+            runs_success = summary.runs_success + EXCLUDED.runs_success,
+            runs_error = summary.runs_error + EXCLUDED.runs_error,
+            pages_scanned = summary.pages_scanned + EXCLUDED.pages_scanned,
+            duration_ms_total = summary.duration_ms_total + EXCLUDED.duration_ms_total,
+            duration_ms_max = greatest(summary.duration_ms_max, EXCLUDED.duration_ms_max)
+    )
+    SELECT count(*) FROM pruned
+""").bindparams(
+    bindparam("ids", type_=ARRAY(PG_UUID(as_uuid=True))),
+)
+
+_DIAGNOSTICS_CANDIDATES = """
+    FROM runs
+    WHERE site_id = :site_id
+      AND started_at < :cutoff
+      AND diagnostics_json IS NOT NULL
+"""
+
+# Runs the same pass prunes are deleted before diagnostics are cleared, so
+# the estimate leaves them out rather than counting their bytes twice
+_ESTIMATE_DIAGNOSTICS = text(
+    "SELECT count(*), coalesce(sum(pg_column_size(diagnostics_json)), 0)"
+    + _DIAGNOSTICS_CANDIDATES
+    + f" AND id NOT IN (SELECT id FROM ({_PRUNE_CANDIDATES}) candidates)"
+).bindparams(
+    bindparam("site_id", type_=PG_UUID(as_uuid=True)),
+)
+
+_CLEAR_DIAGNOSTICS_BATCH = text(f"""
+    WITH batch AS (
+        SELECT id, started_at, pg_column_size(diagnostics_json) AS size
+        {_DIAGNOSTICS_CANDIDATES}
+        LIMIT :batch_size
+    ), cleared AS (
+        UPDATE runs SET diagnostics_json = NULL
+        FROM batch
+        WHERE runs.id = batch.id AND runs.started_at = batch.started_at
+        RETURNING batch.size
+    )
+    SELECT count(*), coalesce(sum(size), 0) FROM cleared
+""").bindparams(
+    bindparam("site_id", type_=PG_UUID(as_uuid=True)),
+)
+
+
+class RetentionEngine:
+    """Applies plan retention policies site by site in throttled batches."""
+
+    def __init__(
+        self,
+        engine: Engine,
+        batch_size: int = 500,
+        pause_seconds: float = 0.1,
+        lock_timeout_ms: int = 2000,
+        dry_run: bool = False,
+        policies: Optional[dict[str, RetentionPolicy]] = None,
+    ):
+        self.engine = engine
+        self.batch_size = batch_size
+        self.pause_seconds = pause_seconds
+        self.lock_timeout_ms = lock_timeout_ms
+        self.dry_run = dry_run
+        self.policies = policies or PLAN_POLICIES
+
+    def policy_for(self, plan: Optional[str]) -> RetentionPolicy:
+        return self.policies.get(plan or DEFAULT_PLAN) or policy_for_plan(plan)
+
+    def run(self, tenant_id: Optional[UUID] = None, now: Optional[datetime] = None) -> RetentionReport:
+        """Apply retention to every site (or one tenant's sites)."""
+        now = now or datetime.utcnow()
+        report = RetentionReport(dry_run=self.dry_run)
+
+        query = (
+            select(Site.id, Site.tenant_id, Tenant.plan)
+            .join(Tenant, Tenant.id == Site.tenant_id)
+            .order_by(Site.tenant_id, Site.id)
+        )
+        if tenant_id is not None:
+            query = query.where(Site.tenant_id == tenant_id)
+        with self.engine.connect() as conn:
+            sites = conn.execute(query).fetchall()
+
+        for site_id, site_tenant_id, plan in sites:
+            site_report = self.apply_to_site(site_id, self.policy_for(plan), now)
+            if site_report.runs_pruned or site_report.diagnostics_cleared:
+                site_report.tenants_changed.add(site_tenant_id)
+            report.add(site_report)
+
+        if not self.dry_run and report.tenants_changed:
+            self._bump_versions(report.tenants_changed, now)
+        return report
+
+    def apply_to_site(self, site_id: UUID, policy: RetentionPolicy, now: datetime) -> RetentionReport:
+        """Prune runs and clear diagnostics for one site."""
+        report = RetentionReport(dry_run=self.dry_run, sites=1)
+        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        prune_params = {
+            "site_id": site_id,
+            "protect_from": today,
+            "keep_runs": policy.keep_runs,
+            # A far-past cutoff disables the age limit
+            "max_age_cutoff": (
+                now - timedelta(days=policy.max_age_days) if policy.max_age_days else datetime.min
+            ),
+        }
+        diagnostics_params = (
+            {"site_id": site_id, "cutoff": now - timedelta(days=policy.diagnostics_days)}
+            if policy.diagnostics_days
+            else None
+        )
+
+        if self.dry_run:
+            with self.engine.connect() as conn:
+                count, size = conn.execute(_ESTIMATE_PRUNE, prune_params).one()
+                report.runs_pruned, report.bytes_reclaimed = count, size
+                if diagnostics_params:
+                    count, size = conn.execute(
+                        _ESTIMATE_DIAGNOSTICS, {**prune_params, **diagnostics_params}
+                    ).one()
+                    report.diagnostics_cleared = count
+                    report.bytes_reclaimed += size
+            return report
+
+        while True:
+            with self.engine.begin() as conn:
+                self._set_lock_timeout(conn)
+                batch = conn.execute(
+                    _SELECT_PRUNE_BATCH, {**prune_params, "batch_size": self.batch_size}
+                ).fetchall()
+                if not batch:
+                    break
+                report.runs_pruned += conn.execute(
+                    _PRUNE_BATCH,
+                    {
+                        "ids": [row.id for row in batch],
+                        "oldest": batch[0].started_at,
+                        "newest": batch[-1].started_at,
+                    },
+                ).scalar_one()
+                report.bytes_reclaimed += sum(row.row_size for row in batch)
+            if len(batch) < self.batch_size:
+                break
+            self._pause()
+
+        while diagnostics_params:
+            with self.engine.begin() as conn:
+                self._set_lock_timeout(conn)
+                cleared, size = conn.execute(
+                    _CLEAR_DIAGNOSTICS_BATCH, {**diagnostics_params, "batch_size": self.batch_size}
+                ).one()
+            report.diagnostics_cleared += cleared
+            report.bytes_reclaimed += size
+            if cleared < self.batch_size:
+                break
+            self._pause()
+
+        return report
+
+    def _set_lock_timeout(self, conn: Connection) -> None:
+        conn.execute(text(f"SET LOCAL lock_timeout = {int(self.lock_timeout_ms)}"))
+
+    def _pause(self) -> None:
+        if self.pause_seconds:
+            time.sleep(self.pause_seconds)
+
+    def _bump_versions(self, tenant_ids: set[UUID], now: datetime) -> None:
+        # Pruning changes run lists, so cached dashboard reads must revalidate
+        with self.engine.begin() as conn:
+            conn.execute(
+                update(Tenant)
+                .where(Tenant.id.in_(tenant_ids))
+                .values(data_version=Tenant.data_version + 1, data_changed_at=now)
+            )
@@ -0,0 +1,184 @@
+"""Per-site daily rollups (``site_daily_stats``).
+
+Time-series endpoints read only the rollup, so a 90-day chart is a 90-row
+index range scan instead of a ``GROUP BY`` over raw ``items`` and ``runs``.
+
+Run completion adds to the rollup in the same transaction as the run update
+(``record_run``). ``backfill`` rebuilds days from history: raw ``runs`` and
+``items`` plus ``run_daily_summaries`` for runs already pruned by retention.
+"""
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import Connection, bindparam, func, text
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models import Run, RunStatus, SiteDailyStats
+
+MAX_SERIES_DAYS = 366
+
+COUNTERS = (
+    "items_new",
+    "runs_total",
+    "runs_success",
+    "runs_error",
+    "duration_ms_total",
+    "pages_scanned",
+)
+
+
+def increment(db: Session, site_id: UUID, day: date, **counts: int) -> None:
+    """Add to one site-day's counters (upsert)."""
+    values = {name: counts.get(name, 0) for name in COUNTERS}
+    stmt = insert(SiteDailyStats).values(site_id=site_id, day=day, **values)
+    db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[SiteDailyStats.site_id, SiteDailyStats.day],
+            set_={
+                name: getattr(SiteDailyStats, name) + getattr(stmt.excluded, name)
+                for name in COUNTERS
+            },
+        )
+    )
+
+
+def record_run(db: Session, run: Run, items_new: int = 0) -> None:
+    """Add a finished run (and the items it found) to the rollup.
+
+    Call once per run, before the commit that finishes it. The run counts
+    on the day it started and its items on the day it finished (when they
+    were discovered), matching ``backfill``.
+    """
+    run_day = run.started_at.date()
+    items_day = (run.finished_at or run.started_at).date()
+    counts = {
+        "runs_total": 1,
+        "runs_success": int(run.status == RunStatus.SUCCESS),
+        "runs_error": int(run.status == RunStatus.ERROR),
+        "duration_ms_total": run.duration_ms or 0,
+        "pages_scanned": run.pages_scanned or 0,
+    }
+    if items_new and items_day == run_day:
+        counts["items_new"] = items_new
+    increment(db, run.site_id, run_day, **counts)
+    if items_new and items_day != run_day:
+        increment(db, run.site_id, items_day, items_new=items_new)
+
+
+@dataclass
+class DailyPoint:
+    """Counters for one day of a time series."""
+
+    day: date
+    items_new: int = 0
+    runs_total: int = 0
+    runs_success: int = 0
+    runs_error: int = 0
+    duration_ms_total: int = 0
+    pages_scanned: int = 0
+
+    @property
+    def success_rate(self) -> Optional[float]:
+        return round(self.runs_success / self.runs_total, 4) if self.runs_total else None
+
+    @property
+    def avg_duration_ms(self) -> Optional[int]:
+        return self.duration_ms_total // self.runs_total if self.runs_total else None
+
+
+def daily_series(db: Session, site_ids: list[UUID], start: date, end: date) -> list[DailyPoint]:
+    """Summed daily counters for ``site_ids`` from ``start`` through ``end``.
+
+    Days without activity are included with zero counters so charts get a
+    continuous series.
+    """
+    rows = (
+        db.query(SiteDailyStats.day, *(func.sum(getattr(SiteDailyStats, c)) for c in COUNTERS))
+        .filter(
+            SiteDailyStats.site_id.in_(site_ids),
+            SiteDailyStats.day >= start,
+            SiteDailyStats.day <= end,
+        )
+        .group_by(SiteDailyStats.day)
+        .all()
+        if site_ids
+        else []
+    )
+    by_day = {row[0]: DailyPoint(row[0], *(int(v) for v in row[1:])) for row in rows}
+
+    points = []
+    day = start
+    while day <= end:
+        points.append(by_day.get(day, DailyPoint(day)))
+        day += timedelta(days=1)
+    return points
+
+
+_SITE_FILTER = "(CAST(:site_id AS uuid) IS NULL OR site_id = :site_id)"
+
+_CLEAR_RANGE = text(f"""
+    DELETE FROM site_daily_stats
+    WHERE day >= :start AND day < :end AND {_SITE_FILTER}
+""").bindparams(
+    bindparam("site_id", type_=PG_UUID(as_uuid=True)),
+)
+
+# Recompute a range of days from history
+_BACKFILL = text(f"""
+    WITH parts AS (
+        SELECT site_id, CAST(started_at AS date) AS day,
+               0 AS items_new, count(*) AS runs_total,
+               count(*) FILTER (WHERE status = 'success') AS runs_success,
+               count(*) FILTER (WHERE status = 'error') AS runs_error,
+               coalesce(sum(duration_ms), 0) AS duration_ms_total,
+               coalesce(sum(pages_scanned), 0) AS pages_scanned
+        FROM runs
+        WHERE started_at >= :start AND started_at < :end AND status <> 'running'
+          AND {_SITE_FILTER}
+        GROUP BY 1, 2
+        UNION ALL
+        SELECT site_id, day, 0, runs_total, runs_success, runs_error,
+               duration_ms_total, pages_scanned
+        FROM run_daily_summaries
+        WHERE day >= :start AND day < :end
+          AND {_SITE_FILTER}
+        UNION ALL
+        SELECT site_id, CAST(discovered_at AS date), count(*), 0, 0, 0, 0, 0
+        FROM items
+        WHERE discovered_at >= :start AND discovered_at < :end
+          AND {_SITE_FILTER}
+        GROUP BY 1, 2
+    )
+    INSERT INTO site_daily_stats (
+        site_id, day, items_new, runs_total, runs_success, runs_error,
+        duration_ms_total, pages_scanned
+    )
+    SELECT site_id, day, sum(items_new), sum(runs_total), sum(runs_success),
+           sum(runs_error), sum(duration_ms_total), sum(pages_scanned)
+    FROM parts
+    GROUP BY site_id, day
+""").bindparams(
+    bindparam("site_id", type_=PG_UUID(as_uuid=True)),
+)
+
+
+def backfill(
+    conn: Connection,
+    start: date,
+    end: date,
+    site_id: Optional[UUID] = None,
+) -> int:
+    """Rebuild rollup rows for days in ``[start, end)``; returns rows written.
+
+    Replaces the range, so it is idempotent. Run it in one transaction per
+    chunk of days. Days still receiving runs should be left to
+    ``record_run``; the job's default range stops before today.
+    """
+    params = {"start": start, "end": end, "site_id": site_id}
+    conn.execute(_CLEAR_RANGE, params)
+    return conn.execute(_BACKFILL, params).rowcount
@@ -0,0 +1,282 @@
+"""Discovery run execution, shared by the API and the scheduler."""
+
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import Engine, or_, update
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models import Run, RunStatus, Site
+from app.services.adaptive import learn_interval
+from app.services.changes import ITEM, RUN, record_changes
+from app.services.discovery import SHARE_MAX_LINKS, discovery, discovery_key
+from app.services.events import publish_items, publish_run
+from app.services.feeds import bump_items_version
+from app.services.ingestion import insert_items
+from app.services.near_duplicates import NearDuplicateIndex
+from app.services.rollups import record_run
+from app.services.worker_client import (
+    WorkerClientError,
+    WorkerResponse,
+    WorkerStream,
+    shared_worker_client,
+)
+from app.utils.http_cache import bump_tenant_version
+from app.utils.keyword_matcher import get_matcher
+
+logger = logging.getLogger(__name__)
+
+
+class RunInProgress(Exception):
+    """Another run holds the site's lease."""
+
+    def __init__(self, run_id: UUID):
+        super().__init__(f"Run {run_id} is already in progress")
+        self.run_id = run_id
+
+
+def acquire_lease(db: Session, site: Site, run: Run, now: datetime) -> Optional[UUID]:
+    """Lease the site to ``run`` unless a live lease exists.
+
+    Returns None on success, else the run holding the lease. The row lock
+    taken by the UPDATE serializes concurrent triggers across replicas until
+    the caller commits.
+    """
+    leased = (
+        db.query(Site)
+        .filter(
+            Site.id == site.id,
+            or_(Site.lease_run_id.is_(None), Site.lease_expires_at < now),
+        )
+        .update(
+            {
+                Site.lease_run_id: run.id,
+                Site.lease_expires_at: now + timedelta(seconds=settings.run_lease_seconds),
+            },
+            synchronize_session=False,
+        )
+    )
+    if leased:
+        return None
+    return db.query(Site.lease_run_id).filter(Site.id == site.id).scalar()
+
+
+def renew_lease(bind: Engine, site: Site, run: Run) -> bool:
+    """Extend ``run``'s lease on the site to ``run_lease_seconds`` from now.
+
+    Commits on its own connection, so other processes see the renewal while
+    the run's transaction is still open. Returns False if the run no longer
+    holds the lease.
+    """
+    with bind.begin() as conn:
+        renewed = conn.execute(
+            update(Site)
+            .where(Site.id == site.id, Site.lease_run_id == run.id)
+            .values(
+                lease_expires_at=datetime.utcnow() + timedelta(seconds=settings.run_lease_seconds)
+            )
+        ).rowcount
+    return bool(renewed)
+
+
+def release_lease(db: Session, site: Site, run: Run) -> None:
+    """Release the site's lease if ``run`` still holds it."""
+    db.query(Site).filter(Site.id == site.id, Site.lease_run_id == run.id).update(
+        {Site.lease_run_id: None, Site.lease_expires_at: None}, synchronize_session=False
+    )
+
+
+@contextmanager
+def open_worker_stream(site: Site) -> Iterator[WorkerStream]:
+    """Open the Worker discovery call for a site (profile or generic discover) as a stream."""
+    worker = shared_worker_client()
+    if site.profile_key == "rcmp_fsj":
+        with worker.stream_rcmp_fsj() as stream:
+            yield stream
+    else:
+        with worker.stream_discover(site.url) as stream:
+            yield stream
+
+
+def schedule_next_run(
+    db: Session, site: Site, finished_at: datetime, new_items: Optional[int] = None
+) -> None:
+    """Set when the scheduler should run the site again.
+
+    Adaptive sites use their learned interval (``new_items`` is None after a
+    failed run); others use ``interval_minutes``. Call before
+    ``site.last_run_at`` is moved to this run.
+    """
+    if site.adaptive:
+        minutes = learn_interval(db, site, finished_at, new_items)
+    else:
+        minutes = site.interval_minutes or 60
+    site.next_run_at = finished_at + timedelta(minutes=minutes)
+
+
+def execute_run(db: Session, site: Site) -> Run:
+    """Run discovery for a site and record the outcome.
+
+    The run takes the site's lease (``RunInProgress`` if another run holds
+    it) and is committed as running before the Worker is called, and its
+    outcome (items, counters, change log, events) in a second transaction
+    that also releases the lease. Identical concurrent or recent calls
+    share one Worker response (see ``app.services.discovery``); otherwise
+    the response is streamed and its items inserted in batches as it
+    arrives, renewing the lease every third of ``run_lease_seconds``. On a
+    Worker failure the error is recorded and committed, then the
+    ``WorkerClientError`` is re-raised.
+    """
+    run = Run(
+        site_id=site.id,
+        status=RunStatus.RUNNING,
+        method="profile" if site.profile_key else "discover",
+        started_at=datetime.utcnow(),
+    )
+    db.add(run)
+    db.flush()
+    holder = acquire_lease(db, site, run, run.started_at)
+    if holder is not None:
+        db.rollback()
+        raise RunInProgress(holder)
+    publish_run(db, site.tenant_id, run)
+    bump_tenant_version(db, site.tenant_id)
+    db.commit()
+    db.refresh(run)
+
+    matcher = get_matcher(site.id, [*(site.keywords or []), *(site.tenant.keywords or [])])
+    near_duplicates = NearDuplicateIndex(site.tenant_id)
+    # Set by whichever path ingests the response
+    new_item_ids: list[UUID] = []
+    discovered_at: datetime = run.started_at
+    # The session may be bound to a connection holding the host slot
+    engine = db.get_bind().engine
+
+    def fetch() -> tuple[WorkerResponse, bool]:
+        # Items are inserted in batches as the response streams in; its links
+        # are kept for other runs only while there are few of them
+        nonlocal new_item_ids, discovered_at
+        kept: list[str] = []
+
+        def keep(links: Iterator[str]) -> Iterator[str]:
+            # A long stream outlives the lease; renew it as batches go in
+            renew_at = time.monotonic() + settings.run_lease_seconds / 3
+            for link in links:
+                if len(kept) <= SHARE_MAX_LINKS:
+                    kept.append(link)
+                if time.monotonic() >= renew_at:
+                    try:
+                        renew_lease(engine, site, run)
+                    except Exception as e:
+                        logger.warning("Could not renew lease for site %s: %s", site.id, e)
+                    renew_at = time.monotonic() + settings.run_lease_seconds / 3
+                yield link
+
+        with open_worker_stream(site) as stream:
+            discovered_at = datetime.utcnow()
+            source = stream.read_source()
+            new_item_ids = insert_items(
+                db,
+                site.id,
+                keep(stream.links()),
+                source,
+                discovered_at=discovered_at,
+                matcher=matcher,
+                near_duplicates=near_duplicates,
+            )
+        shareable = len(kept) <= SHARE_MAX_LINKS
+        response = WorkerResponse(
+            source=source,
+            links=kept if shareable else None,
+            feeds=stream.feeds,
+            count=stream.count,
+            diagnostics=stream.diagnostics,
+        )
+        return response, shareable
+
+    # Call Worker
+    start_time = datetime.utcnow()
+    try:
+        response, shared = discovery.fetch(engine, discovery_key(site), fetch)
+    except WorkerClientError as e:
+        # Drop items inserted before a streamed response failed
+        db.rollback()
+        end_time = datetime.utcnow()
+        duration_ms = int((end_time - start_time).total_seconds() * 1000)
+
+        # Update run as error
+        run.status = RunStatus.ERROR
+        run.duration_ms = duration_ms
+        run.diagnostics_json = {
+            "error": str(e),
+            "status_code": e.status_code,
+        }
+        run.finished_at = end_time
+        schedule_next_run(db, site, end_time)
+
+        record_run(db, run)
+        record_changes(db, site.tenant_id, site.id, [(RUN, run.id, run.started_at)])
+        publish_run(db, site.tenant_id, run)
+        release_lease(db, site, run)
+        bump_tenant_version(db, site.tenant_id)
+        db.commit()
+        raise
+
+    end_time = datetime.utcnow()
+    duration_ms = int((end_time - start_time).total_seconds() * 1000)
+
+    if shared:
+        # Process the shared response (dedup on (site_id, canonical_url))
+        discovered_at = end_time
+        new_item_ids = insert_items(
+            db,
+            site.id,
+            response.links or [],
+            response.source,
+            discovered_at=discovered_at,
+            matcher=matcher,
+            near_duplicates=near_duplicates,
+        )
+
+    # Update run
+    run.status = RunStatus.SUCCESS
+    run.pages_scanned = response.count
+    run.duration_ms = duration_ms
+    run.diagnostics_json = (
+        {**(response.diagnostics or {}), "shared_response": True}
+        if shared
+        else response.diagnostics
+    )
+    run.finished_at = end_time
+
+    # Update site
+    schedule_next_run(db, site, end_time, new_items=len(new_item_ids))
+    site.last_run_at = end_time
+
+    record_run(db, run, items_new=len(new_item_ids))
+    if new_item_ids:
+        bump_items_version(db, site.id, site.tenant_id)
+    record_changes(
+        db,
+        site.tenant_id,
+        site.id,
+        [
+            *((ITEM, item_id, discovered_at) for item_id in new_item_ids),
+            (RUN, run.id, run.started_at),
+        ],
+    )
+    publish_items(db, site.tenant_id, run, new_item_ids, discovered_at)
+    publish_run(db, site.tenant_id, run, items_new=len(new_item_ids))
+    release_lease(db, site, run)
+    bump_tenant_version(db, site.tenant_id)
+    db.commit()
+
+    # TODO: Trigger notifications (implement in next iteration)
+
+    return run
@@ -0,0 +1,301 @@
+"""Fair dispatch of scheduled runs across tenants.
+
+Due sites are queued per tenant and drained by deficit round robin: on its
+turn a tenant dispatches up to its plan weight in runs, then the next tenant
+goes. A tenant with 5,000 due sites gets at most ``weight`` runs per round,
+so a tenant with 5 sees its runs start within the first round instead of
+behind the whole backlog. Queues are refilled with newly due sites while
+runs are in flight, so fairness holds for sites that become due during a
+long pass too. A global concurrency cap bounds runs in flight against the
+shared Worker and database, and ``app.services.politeness`` limits runs per
+host.
+"""
+
+import logging
+import time
+from collections import Counter, deque
+from collections.abc import Callable, Hashable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Generic, Optional, TypeVar
+from uuid import UUID
+
+from sqlalchemy import Engine, or_
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal, engine
+from app.models import Run, Site, Tenant
+from app.services.politeness import HostLimiter
+from app.services.runs import RunInProgress, execute_run
+from app.services.worker_client import WorkerClientError
+
+logger = logging.getLogger(__name__)
+
+PLAN_WEIGHTS = {"free": 1, "starter": 2, "pro": 4, "enterprise": 8}
+
+# pg_try_advisory_lock key held by the running scheduler, so only one
+# process dispatches and the concurrency cap is global
+SCHEDULER_LOCK_KEY = 0x5C4ED01E
+
+# Pooled connections a run holds with a limiter: its own (session and host
+# slot) and the discovery lock's. The dispatcher also holds the scheduler
+# lock and briefly one to refill its queues
+CONNECTIONS_PER_RUN = 2
+DISPATCHER_CONNECTIONS = 2
+
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+DEFERRED = "deferred"
+SKIPPED = "skipped"
+
+T = TypeVar("T")
+
+
+def connections_needed(max_concurrency: int) -> int:
+    """Pool size a scheduler process needs to run ``max_concurrency`` runs at once."""
+    return max_concurrency * CONNECTIONS_PER_RUN + DISPATCHER_CONNECTIONS
+
+
+def weight_for_plan(plan: Optional[str], weights: dict[str, int] = PLAN_WEIGHTS) -> int:
+    """Dispatch weight for a plan; unknown plans get the free weight."""
+    return weights.get(plan or "free", weights["free"])
+
+
+class DeficitRoundRobin(Generic[T]):
+    """Per-key FIFO queues drained in weighted round robin (unit cost per item)."""
+
+    def __init__(self) -> None:
+        self._queues: dict[Hashable, deque[T]] = {}
+        self._weights: dict[Hashable, int] = {}
+        self._deficits: dict[Hashable, int] = {}
+        self._active: deque[Hashable] = deque()
+
+    def push(self, key: Hashable, item: T, weight: int = 1) -> None:
+        if weight < 1:
+            raise ValueError("weight must be a positive integer")
+        queue = self._queues.get(key)
+        if queue is None:
+            queue = self._queues[key] = deque()
+            self._deficits[key] = 0
+            self._active.append(key)
+        self._weights[key] = weight
+        queue.append(item)
+
+    def pop(self) -> T:
+        """Next item in fair order; raises IndexError when empty."""
+        if not self._active:
+            raise IndexError("pop from an empty DeficitRoundRobin")
+
+        key = self._active[0]
+        if self._deficits[key] < 1:
+            self._deficits[key] += self._weights[key]
+        self._deficits[key] -= 1
+        queue = self._queues[key]
+        item = queue.popleft()
+
+        if not queue:
+            # Idle keys keep no credit
+            self._active.popleft()
+            del self._queues[key], self._weights[key], self._deficits[key]
+        elif self._deficits[key] < 1:
+            self._active.rotate(-1)
+        return item
+
+    def __len__(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    def drain(self) -> list[T]:
+        return [self.pop() for _ in range(len(self))]
+
+
+@dataclass
+class DueRun:
+    site_id: UUID
+    tenant_id: UUID
+    plan: Optional[str]
+
+
+@dataclass
+class DispatchReport:
+    dispatched: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    deferred: int = 0  # host stayed busy; still due
+    skipped: int = 0  # site already had a run in progress
+    per_tenant: Counter = field(default_factory=Counter)
+    dry_run: bool = False
+
+
+def due_runs(db: Session, now: datetime, limit: Optional[int] = None) -> list[DueRun]:
+    """Enabled sites whose next run is due, most overdue first."""
+    query = (
+        db.query(Site.id, Site.tenant_id, Tenant.plan)
+        .join(Tenant, Tenant.id == Site.tenant_id)
+        .filter(
+            Site.enabled.isnot(False),
+            or_(Site.next_run_at.is_(None), Site.next_run_at <= now),
+        )
+        .order_by(Site.next_run_at.asc().nulls_first(), Site.id)
+    )
+    if limit is not None:
+        query = query.limit(limit)
+    return [DueRun(site_id, tenant_id, plan) for site_id, tenant_id, plan in query]
+
+
+class Dispatcher:
+    """Runs due sites in fair order with at most ``max_concurrency`` in flight.
+
+    With a ``limiter``, a run whose host has no free slot is not waited on:
+    it goes to the back of its tenant's queue (up to ``max_deferrals`` times,
+    then it stays due for the next pass), so runs against other hosts keep
+    going. Each such run opens a connection from ``bind`` and binds its
+    session (``session_factory(bind=conn)``) to it, so the host slot costs no
+    extra connection. A run that can't get a connection within the pool
+    timeout is deferred the same way.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        weights: Optional[dict[str, int]] = None,
+        session_factory: Callable[..., Session] = SessionLocal,
+        execute: Callable[[Session, Site], Run] = execute_run,
+        limiter: Optional[HostLimiter] = None,
+        host_wait: float = 1.0,
+        max_deferrals: int = 20,
+        refill_seconds: float = 10.0,
+        bind: Optional[Engine] = None,
+    ):
+        self.max_concurrency = max_concurrency
+        self.weights = weights or PLAN_WEIGHTS
+        self.session_factory = session_factory
+        self.execute = execute
+        self.limiter = limiter
+        self.host_wait = host_wait
+        self.max_deferrals = max_deferrals
+        self.refill_seconds = refill_seconds
+        self.bind = bind or engine
+
+    def order(self, due: list[DueRun]) -> list[DueRun]:
+        """Dispatch order: each tenant's FIFO, interleaved by plan weight."""
+        queues: DeficitRoundRobin[DueRun] = DeficitRoundRobin()
+        for run in due:
+            queues.push(run.tenant_id, run, weight_for_plan(run.plan, self.weights))
+        return queues.drain()
+
+    def run_once(
+        self,
+        now: Optional[datetime] = None,
+        max_runs: Optional[int] = None,
+        dry_run: bool = False,
+    ) -> DispatchReport:
+        """Dispatch due runs until none are queued or in flight.
+
+        Runs are taken from the fair queues only as slots free up, and due
+        sites are re-read every ``refill_seconds`` while runs are in flight,
+        so a site that becomes due mid-pass joins its tenant's queue and
+        starts within a round instead of after the rest of the pass. Each
+        site runs at most once per pass. ``max_runs`` caps the runs
+        dispatched this pass; the rest stay due.
+        """
+        report = DispatchReport(dry_run=dry_run)
+        queues: DeficitRoundRobin[DueRun] = DeficitRoundRobin()
+        seen: set[UUID] = set()  # queued, running or finished this pass
+
+        def refill(at: datetime) -> None:
+            with self.session_factory() as db:
+                due = due_runs(db, at)
+            for run in due:
+                if max_runs is not None and report.dispatched >= max_runs:
+                    break
+                if run.site_id in seen:
+                    continue
+                seen.add(run.site_id)
+                report.dispatched += 1
+                report.per_tenant[run.tenant_id] += 1
+                queues.push(run.tenant_id, run, weight_for_plan(run.plan, self.weights))
+
+        refill(now or datetime.utcnow())
+        if dry_run:
+            return report
+
+        deferrals: Counter = Counter()
+        last_refill = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as pool:
+            running: dict[Future[str], DueRun] = {}
+            while queues or running:
+                while queues and len(running) < self.max_concurrency:
+                    run = queues.pop()
+                    running[pool.submit(self._run_site, run.site_id)] = run
+
+                done, _ = wait(running, timeout=self.refill_seconds, return_when=FIRST_COMPLETED)
+                for future in done:
+                    run = running.pop(future)
+                    outcome = future.result()
+                    if outcome == DEFERRED and deferrals[run.site_id] < self.max_deferrals:
+                        # Back of its tenant's queue; other hosts go first
+                        deferrals[run.site_id] += 1
+                        queues.push(run.tenant_id, run, weight_for_plan(run.plan, self.weights))
+                    elif outcome == SUCCEEDED:
+                        report.succeeded += 1
+                    elif outcome == FAILED:
+                        report.failed += 1
+                    elif outcome == SKIPPED:
+                        report.skipped += 1
+                    else:
+                        report.deferred += 1
+
+                if time.monotonic() - last_refill >= self.refill_seconds:
+                    refill(datetime.utcnow())
+                    last_refill = time.monotonic()
+        return report
+
+    def _run_site(self, site_id: UUID) -> str:
+        try:
+            if self.limiter is None:
+                with self.session_factory() as db:
+                    site = db.get(Site, site_id)
+                    return self._execute(db, site_id, site)
+
+            # The host slot's locks and the run's transactions share one
+            # connection, so a run holds one pooled connection plus the
+            # discovery lock's (see app.services.discovery)
+            with self.bind.connect() as conn, self.session_factory(bind=conn) as db:
+                site = db.get(Site, site_id)
+                if site is None or site.enabled is False:
+                    return FAILED
+                url = site.url
+                # The slot commits on this connection itself
+                db.commit()
+                with self.limiter.slot(conn, url, wait=self.host_wait) as acquired:
+                    if not acquired:
+                        return DEFERRED
+                    try:
+                        return self._execute(db, site_id, site)
+                    finally:
+                        # Locks are released on this connection; end the run first
+                        db.rollback()
+        except PoolTimeoutError as e:
+            logger.warning("Run for site %s deferred, no database connection: %s", site_id, e)
+            return DEFERRED
+        except Exception:
+            logger.exception("Run for site %s could not start", site_id)
+            return FAILED
+
+    def _execute(self, db: Session, site_id: UUID, site: Optional[Site]) -> str:
+        if site is None or site.enabled is False:
+            return FAILED
+        try:
+            self.execute(db, site)
+        except RunInProgress:
+            return SKIPPED
+        except WorkerClientError as e:
+            logger.warning("Run for site %s failed: %s", site_id, e)
+            return FAILED
+        except Exception:
+            logger.exception("Run for site %s crashed", site_id)
+            db.rollback()
+            return FAILED
+        return SUCCEEDED
@@ -0,0 +1,84 @@
+"""Cold-start pre-warming and time-to-first-response tracking.
+
+On Railway scale-to-zero the first request after a cold start would also
+open the first database connection and set up the Worker client's TLS
+context. ``start_prewarm`` does both in a daemon thread as soon as the app
+starts, so uvicorn accepts requests without waiting on it; a failed step is
+logged and left for the first request to retry.
+
+``FirstResponseTimer`` records how long after import started the first
+response finished, so cold starts can be tracked in the logs.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy import text
+
+from app.database import engine
+from app.services.worker_client import shared_worker_client
+
+logger = logging.getLogger(__name__)
+
+
+def _warm_database() -> None:
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+
+PREWARM_STEPS: dict[str, Callable[[], Any]] = {
+    "database": _warm_database,
+    "worker_client": shared_worker_client,
+}
+
+
+def prewarm(timings: dict[str, Any]) -> None:
+    """Run each pre-warm step, recording its duration (ms) or failure in ``timings``."""
+    for name, step in PREWARM_STEPS.items():
+        start = time.perf_counter()
+        try:
+            step()
+        except Exception as e:
+            logger.warning("Pre-warm of %s failed: %s", name, e)
+            timings[f"prewarm_{name}_ms"] = None
+            continue
+        timings[f"prewarm_{name}_ms"] = round((time.perf_counter() - start) * 1000, 1)
+    logger.info("Pre-warm finished: %s", timings)
+
+
+def start_prewarm(timings: dict[str, Any]) -> threading.Thread:
+    thread = threading.Thread(target=prewarm, args=(timings,), name="prewarm", daemon=True)
+    thread.start()
+    return thread
+
+
+class FirstResponseTimer:
+    """ASGI middleware recording ``first_response_ms`` after ``started`` (a perf_counter)."""
+
+    def __init__(self, app: Any, started: float, timings: dict[str, Any]):
+        self.app = app
+        self.started = started
+        self.timings = timings
+        self.done = False
+
+    async def __call__(self, scope: dict[str, Any], receive: Callable, send: Callable) -> None:
+        if self.done or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_and_time(message: dict[str, Any]) -> None:
+            await send(message)
+            if (
+                not self.done
+                and message["type"] == "http.response.body"
+                and not message.get("more_body", False)
+            ):
+                self.done = True
+                elapsed = round((time.perf_counter() - self.started) * 1000, 1)
+                self.timings["first_response_ms"] = elapsed
+                logger.info("First response %s ms after startup began (%s)", elapsed, scope["path"])
+
+        await self.app(scope, receive, send_and_time)
@@ -1,11 +1,17 @@
 """Cloudflare Worker client for site discovery."""
 
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import AbstractContextManager, ExitStack, contextmanager
+from itertools import islice
 from typing import Any, Optional
 
 import httpx
 from pydantic import BaseModel, Field
 
 from app.config import settings
+from app.utils.json_stream import iter_members
 
 
 class WorkerResponse(BaseModel):
@@ -27,12 +33,134 @@ class WorkerClientError(Exception):
         self.response = response
 
 
+class CircuitBreaker:
+    """Fails Worker calls fast after repeated failures.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    calls are refused for ``reset_seconds``; then one trial call is let
+    through (half-open), which closes the circuit on success or reopens it.
+    Only timeouts, connection errors and 5xx responses count as failures.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_seconds: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self._opened_at < self.reset_seconds:
+            return self.OPEN
+        return self.HALF_OPEN
+
+    def allow(self) -> bool:
+        with self._lock:
+            state = self.state
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._trial_running:
+                self._trial_running = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self._opened_at = None
+            self._trial_running = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self._trial_running or self.failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._trial_running = False
+
+
+def _is_worker_fault(error: WorkerClientError) -> bool:
+    return error.status_code is None or error.status_code >= 500
+
+
+class WorkerStream:
+    """Worker response parsed as it arrives, for responses too large to hold.
+
+    ``read_source()`` parses up to the ``source`` member; ``links()`` then
+    yields links one at a time and can be iterated once. Links sent before
+    ``source`` are held until it arrives, at most ``MAX_HELD_LINKS`` of them;
+    past that the response fails rather than grow without bound. ``feeds``,
+    ``count`` and ``diagnostics`` are set once ``links()`` is exhausted.
+    """
+
+    MAX_HELD_LINKS = 10_000
+
+    def __init__(self, chunks: Iterable[str]):
+        self._members = iter_members(chunks, stream=("links",))
+        self._links = self._iter_links()
+        self._first: list[str] = []
+        self._started = False
+        self.source: Optional[str] = None
+        self.feeds: Optional[list[str]] = None
+        self.count = 0
+        self.diagnostics: Optional[dict[str, Any]] = None
+
+    def read_source(self) -> str:
+        if not self._started:
+            self._started = True
+            self._first = list(islice(self._links, 1))
+        if self.source is None:
+            # _iter_links raises first; this narrows the type
+            raise WorkerClientError("Worker response has no source")
+        return self.source
+
+    def links(self) -> Iterator[str]:
+        self.read_source()
+        yield from self._first
+        yield from self._links
+
+    def _iter_links(self) -> Iterator[str]:
+        held: list[str] = []
+        try:
+            for key, value in self._members:
+                if key == "links":
+                    if self.source is not None:
+                        yield value
+                    elif len(held) < self.MAX_HELD_LINKS:
+                        held.append(value)
+                    else:
+                        raise WorkerClientError(
+                            f"Worker response sent over {self.MAX_HELD_LINKS} links before its source"
+                        )
+                elif key in ("source", "feeds", "count", "diagnostics"):
+                    setattr(self, key, value)
+                    if key == "source" and held:
+                        released, held = held, []
+                        yield from released
+        except httpx.TimeoutException as e:
+            raise WorkerClientError("Worker request timed out") from e
+        except (httpx.HTTPError, ValueError) as e:
+            raise WorkerClientError(f"Worker response could not be read: {str(e)}") from e
+        if self.source is None:
+            raise WorkerClientError("Worker response has no source")
+
+
 class WorkerClient:
     """Cloudflare Worker client."""
 
-    def __init__(self, base_url: str, timeout: int = 30):
+    def __init__(
+        self, base_url: str, timeout: int = 30, breaker: Optional[CircuitBreaker] = None
+    ):
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        self.breaker = breaker
         self.client = httpx.Client(
             timeout=timeout,
             headers={
@@ -61,6 +189,70 @@ class WorkerClient:
             response = self._post("/profiles/rcmp-fsj", body=None, params=params)
             return WorkerResponse(**response)
 
+    def stream_discover(self, url: str) -> AbstractContextManager[WorkerStream]:
+        """Discover new posts, parsing the response as it arrives (context manager)."""
+        return self._stream("/discover", params={"url": url})
+
+    def stream_rcmp_fsj(
+        self, months_back: Optional[int] = None
+    ) -> AbstractContextManager[WorkerStream]:
+        """Get RCMP FSJ posts, parsing the response as it arrives (context manager)."""
+        params = {"monthsBack": months_back} if months_back is not None else {}
+        return self._stream("/profiles/rcmp-fsj", params=params)
+
+    @contextmanager
+    def _stream(self, path: str, params: Optional[dict[str, Any]] = None) -> Iterator[WorkerStream]:
+        """GET ``path`` as a WorkerStream, falling back to POST like the buffered calls.
+
+        Refused without a request while ``breaker`` is open.
+        """
+        if self.breaker is not None and not self.breaker.allow():
+            raise WorkerClientError("Worker circuit open; not calling the Worker")
+        with ExitStack() as stack:
+            try:
+                try:
+                    response = stack.enter_context(self._open_stream("GET", path, params))
+                except WorkerClientError:
+                    response = stack.enter_context(self._open_stream("POST", path, params))
+            except WorkerClientError as e:
+                if self.breaker is not None:
+                    if _is_worker_fault(e):
+                        self.breaker.record_failure()
+                    else:
+                        self.breaker.record_success()
+                raise
+            if self.breaker is not None:
+                self.breaker.record_success()
+            yield WorkerStream(response.iter_text())
+
+    @contextmanager
+    def _open_stream(
+        self, method: str, path: str, params: Optional[dict[str, Any]] = None
+    ) -> Iterator[httpx.Response]:
+        """Send a request and yield the response with its body unread."""
+        url = f"{self.base_url}{path}"
+
+        try:
+            response = self.client.send(
+                self.client.build_request(method, url, params=params), stream=True
+            )
+        except httpx.TimeoutException:
+            raise WorkerClientError("Worker request timed out")
+        except Exception as e:
+            raise WorkerClientError(f"Worker request failed: {str(e)}")
+
+        try:
+            if response.is_error:
+                response.read()
+                raise WorkerClientError(
+                    f"Worker request failed: {response.status_code}",
+                    status_code=response.status_code,
+                    response=response.text,
+                )
+            yield response
+        finally:
+            response.close()
+
     def _post(
         self, 
         path: str, 
@@ -123,7 +315,40 @@ class WorkerClient:
         self.close()
 
 
+# Shared by every client in the process, so all runs see the Worker's state
+worker_circuit = CircuitBreaker(
+    failure_threshold=settings.worker_circuit_failures,
+    reset_seconds=settings.worker_circuit_reset_seconds,
+)
+
+
 def get_worker_client() -> WorkerClient:
     """Get a Worker client instance."""
-    return WorkerClient(settings.worker_base_url)
+    return WorkerClient(settings.worker_base_url, breaker=worker_circuit)
+
+
+_shared_client: Optional[WorkerClient] = None
+_shared_client_lock = threading.Lock()
+
+
+def shared_worker_client() -> WorkerClient:
+    """Process-wide Worker client, created on first use; don't close it.
+
+    Runs share its connection pool, so only the first pays for the TLS
+    setup and handshake.
+    """
+    global _shared_client
+    if _shared_client is None:
+        with _shared_client_lock:
+            if _shared_client is None:
+                _shared_client = get_worker_client()
+    return _shared_client
+
+
+def close_shared_worker_client() -> None:
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is not None:
+            _shared_client.close()
+            _shared_client = None
 
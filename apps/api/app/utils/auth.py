@@ -1,17 +1,19 @@
 """Authentication utilities."""
 
+import base64
+import binascii
 import hashlib
+import hmac
 import secrets
-from datetime import datetime, timedelta
-from typing import Optional
+import struct
+from datetime import UTC, datetime, timedelta
+from typing import Any, NamedTuple, Optional
+from uuid import UUID
 
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 
 from app.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 
 def hash_token(token: str) -> str:
     """Hash a token using SHA256 (for invite/magic link tokens)."""
@@ -39,26 +41,102 @@ def create_api_key() -> str:
     return f"sk_{secrets.token_urlsafe(32)}"
 
 
-def create_jwt_token(user_id: str, expires_delta: Optional[timedelta] = None) -> str:
-    """Create a JWT token."""
+def create_jwt_token(
+    user_id: str, expires_delta: Optional[timedelta] = None, version: int = 0
+) -> str:
+    """Create a JWT token.
+
+    ``version`` is the user's ``token_version``; bumping it revokes the token.
+    """
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
     else:
         expire = datetime.utcnow() + timedelta(minutes=settings.jwt_expire_minutes)
 
-    to_encode = {"sub": str(user_id), "exp": expire}
+    to_encode = {"sub": str(user_id), "exp": expire, "ver": version}
     encoded_jwt = jwt.encode(to_encode, settings.jwt_secret, algorithm=settings.jwt_algorithm)
     return encoded_jwt
 
 
-def decode_jwt_token(token: str) -> Optional[str]:
-    """Decode a JWT token and return user_id."""
+def decode_jwt_claims(token: str) -> Optional[dict[str, Any]]:
+    """Verify a JWT token and return its claims, or None if invalid or without a subject."""
     try:
         payload = jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_algorithm])
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            return None
-        return user_id
     except JWTError:
         return None
+    if payload.get("sub") is None:
+        return None
+    return payload
+
+
+def decode_jwt_token(token: str) -> Optional[str]:
+    """Decode a JWT token and return user_id."""
+    claims = decode_jwt_claims(token)
+    return claims["sub"] if claims else None
+
+
+class FeedToken(NamedTuple):
+    """Verified claims of a feed token."""
+
+    user_id: UUID
+    tenant_id: UUID
+    expires_at: datetime
+    version: int
+
+
+# user id, tenant id, expiry (epoch seconds), tenant feed_token_version
+_FEED_TOKEN_PAYLOAD = struct.Struct(">16s16sII")
+_FEED_MAC_SIZE = 18
 
+
+def _feed_mac(scope: str, resource_id: str, payload: bytes) -> bytes:
+    message = f"feed:{scope}:{resource_id}:".encode() + payload
+    return hmac.new(settings.jwt_secret.encode(), message, hashlib.sha256).digest()[:_FEED_MAC_SIZE]
+
+
+def create_feed_token(
+    scope: str,
+    resource_id: str,
+    user_id: UUID,
+    tenant_id: UUID,
+    version: int,
+    expires_at: Optional[datetime] = None,
+) -> str:
+    """Create a user's feed token for ``scope`` (``site`` or ``tenant``) and a resource id.
+
+    The token carries the user, the tenant, an expiry and the tenant's
+    ``feed_token_version``, followed by an HMAC of those and the resource,
+    so a feed request can be checked without the auth tables. Bumping the
+    tenant's version revokes its tokens. ``expires_at`` defaults to
+    ``feed_token_ttl_days`` from now.
+    """
+    if expires_at is None:
+        expires_at = datetime.utcnow() + timedelta(days=settings.feed_token_ttl_days)
+    expires = int(expires_at.replace(tzinfo=UTC).timestamp())
+    payload = _FEED_TOKEN_PAYLOAD.pack(user_id.bytes, tenant_id.bytes, expires, version)
+    token = base64.urlsafe_b64encode(payload + _feed_mac(scope, resource_id, payload))
+    return token.decode().rstrip("=")
+
+
+def verify_feed_token(
+    token: str, scope: str, resource_id: str, now: Optional[datetime] = None
+) -> Optional[FeedToken]:
+    """The claims of a feed token signed for this resource and not expired, else None.
+
+    The caller checks ``tenant_id`` and ``version`` against the resource's tenant.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token.encode() + b"=" * (-len(token) % 4))
+    except (ValueError, binascii.Error):
+        return None
+    if len(raw) != _FEED_TOKEN_PAYLOAD.size + _FEED_MAC_SIZE:
+        return None
+    payload, mac = raw[: _FEED_TOKEN_PAYLOAD.size], raw[_FEED_TOKEN_PAYLOAD.size :]
+    if not hmac.compare_digest(mac, _feed_mac(scope, resource_id, payload)):
+        return None
+
+    user_id, tenant_id, expires, version = _FEED_TOKEN_PAYLOAD.unpack(payload)
+    expires_at = datetime.fromtimestamp(expires, UTC).replace(tzinfo=None)
+    if expires_at <= (now or datetime.utcnow()):
+        return None
+    return FeedToken(UUID(bytes=user_id), UUID(bytes=tenant_id), expires_at, version)
@@ -0,0 +1,127 @@
+"""HTTP conditional request support (ETag / Last-Modified).
+
+Each tenant carries a ``data_version`` counter that is bumped in the same
+transaction as anything that changes what the dashboard shows: run start and
+completion, item ingestion, and site mutations. Read endpoints derive their
+ETag from that counter (plus the request URL), so a conditional request can
+be answered with 304 after a single primary-key lookup on ``tenants``,
+without touching ``items`` or ``runs``.
+"""
+
+import hashlib
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+from uuid import UUID
+
+from fastapi import Request, Response
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.models import Tenant
+
+CACHE_CONTROL = "private, no-cache"
+
+
+def bump_tenant_version(db: Session, tenant_id: UUID) -> None:
+    """Invalidate cached reads for a tenant (call before the commit)."""
+    db.execute(
+        update(Tenant)
+        .where(Tenant.id == tenant_id)
+        .values(data_version=Tenant.data_version + 1, data_changed_at=datetime.utcnow())
+    )
+
+
+@dataclass
+class CacheValidator:
+    """ETag and Last-Modified for one response."""
+
+    etag: str
+    last_modified: Optional[datetime] = None
+
+    @classmethod
+    def for_tenants(
+        cls,
+        db: Session,
+        request: Request,
+        tenant_ids: Iterable[UUID],
+        valid_from: Optional[datetime] = None,
+    ) -> "CacheValidator":
+        """Build a validator from the tenants' data versions and the request URL.
+
+        ``valid_from`` is for output that also changes with the clock (e.g.
+        "today" counters): the response is treated as modified at that time
+        at the latest, and the ETag changes when it does.
+        """
+        ids = sorted(set(tenant_ids), key=str)
+        rows = (
+            db.query(Tenant.id, Tenant.data_version, Tenant.data_changed_at)
+            .filter(Tenant.id.in_(ids))
+            .order_by(Tenant.id)
+            .all()
+            if ids
+            else []
+        )
+
+        digest = hashlib.sha256()
+        digest.update(request.url.path.encode())
+        digest.update(b"?" + str(request.url.query).encode())
+        for tenant_id, version, _ in rows:
+            digest.update(f"|{tenant_id}:{version}".encode())
+
+        changed = [changed_at for _, _, changed_at in rows if changed_at is not None]
+        if valid_from is not None:
+            digest.update(f"|{valid_from.isoformat()}".encode())
+            changed.append(valid_from)
+
+        return cls(
+            etag=f'W/"{digest.hexdigest()[:32]}"',
+            last_modified=max(changed) if changed else None,
+        )
+
+    def is_fresh(self, request: Request) -> bool:
+        """Whether the client's cached copy is still valid."""
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            # If-None-Match takes precedence over If-Modified-Since (RFC 9110)
+            return etag_matches(if_none_match, self.etag)
+
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since and self.last_modified is not None:
+            try:
+                since = parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+            modified = self.last_modified.replace(tzinfo=timezone.utc, microsecond=0)
+            return modified <= since
+
+        return False
+
+    def headers(self) -> dict[str, str]:
+        headers = {"ETag": self.etag, "Cache-Control": CACHE_CONTROL}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(
+                self.last_modified.replace(tzinfo=timezone.utc), usegmt=True
+            )
+        return headers
+
+    def not_modified(self) -> Response:
+        """Empty 304 response carrying the validators."""
+        return Response(status_code=304, headers=self.headers())
+
+    def apply(self, response: Response) -> Response:
+        """Attach the validators to a full response."""
+        response.headers.update(self.headers())
+        return response
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag."""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(",")
+    )
@@ -0,0 +1,115 @@
+"""Incremental parsing of large JSON objects.
+
+``iter_members`` walks a top-level JSON object as text chunks arrive and
+yields its members one at a time; the arrays named in ``stream`` are
+yielded element by element instead of as one list, so only the current
+chunk and element are held in memory. Values are decoded with the stdlib
+decoder, one value at a time; a value split across chunks is retried only
+after the buffer doubles, so parsing stays linear in its size.
+"""
+
+import json
+import re
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+_NOT_WHITESPACE = re.compile(r"[^ \t\n\r]")
+_decoder = json.JSONDecoder()
+
+
+class _Reader:
+    def __init__(self, chunks: Iterable[str]):
+        self._chunks = iter(chunks)
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, at_least: int = 1) -> bool:
+        """Buffer at least ``at_least`` more characters; False if the input had none left."""
+        parts = [self._buffer[self._pos :]]
+        added = 0
+        for chunk in self._chunks:
+            parts.append(chunk)
+            added += len(chunk)
+            if added >= at_least:
+                break
+        else:
+            self._eof = True
+        self._buffer = "".join(parts)
+        self._pos = 0
+        return added > 0
+
+    def peek(self) -> str:
+        """Next non-whitespace character, without consuming it."""
+        while True:
+            match = _NOT_WHITESPACE.search(self._buffer, self._pos)
+            if match:
+                self._pos = match.start()
+                return self._buffer[self._pos]
+            self._pos = len(self._buffer)
+            if not self._fill():
+                raise ValueError("Unexpected end of JSON")
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} in JSON, found {found!r}")
+        self._pos += 1
+
+    def take(self, chars: str) -> str:
+        """Consume the next character, which must be one of ``chars``."""
+        found = self.peek()
+        if found not in chars:
+            raise ValueError(f"Expected one of {chars!r} in JSON, found {found!r}")
+        self._pos += 1
+        return found
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self._buffer, self._pos)
+                # A number at the end of the buffer may continue in the next chunk
+                if end < len(self._buffer) or self._eof:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            # Decode again only once the buffered text has doubled, so a
+            # value spanning many chunks is decoded O(log n) times, not O(n)
+            self._fill(len(self._buffer) - self._pos)
+
+
+def iter_members(chunks: Iterable[str], stream: Iterable[str] = ()) -> Iterator[tuple[str, Any]]:
+    """Yield ``(key, value)`` for each member of a JSON object read from ``chunks``.
+
+    For keys in ``stream`` whose value is an array, ``(key, element)`` is
+    yielded for each element instead. Raises ValueError on malformed JSON.
+    """
+    stream = frozenset(stream)
+    reader = _Reader(chunks)
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+
+    while True:
+        key = reader.value()
+        if not isinstance(key, str):
+            raise ValueError("Expected a string key in JSON object")
+        reader.expect(":")
+
+        if key in stream and reader.peek() == "[":
+            reader.expect("[")
+            if reader.peek() == "]":
+                reader.expect("]")
+            else:
+                while True:
+                    yield key, reader.value()
+                    if reader.take(",]") == "]":
+                        break
+        else:
+            yield key, reader.value()
+
+        if reader.take(",}") == "}":
+            return
@@ -0,0 +1,142 @@
+"""Multi-keyword matching with an Aho-Corasick automaton.
+
+A site's keywords are compiled once into an automaton that finds every
+keyword in a text in a single pass, however many keywords there are, instead
+of one regex search per keyword. Matching is on whole words after
+normalization (lowercase, runs of non-alphanumerics become one space), so
+``fire`` matches ``/news/house-fire-downtown`` but not ``firefly``.
+
+Compiled matchers are cached per site (``get_matcher``) and rebuilt when the
+keyword list changes.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable
+from typing import Optional
+
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def normalize(text: str) -> str:
+    """Lowercase and collapse non-alphanumerics to single spaces, space-padded."""
+    return f" {_NON_WORD.sub(' ', text.casefold()).strip()} "
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton over a fixed keyword list."""
+
+    def __init__(self, keywords: Iterable[str]):
+        # keyword as configured, keyed by its normalized form
+        self.keywords: dict[str, str] = {}
+        for keyword in keywords:
+            pattern = normalize(keyword)
+            if pattern.strip() and pattern not in self.keywords:
+                self.keywords[pattern] = keyword
+
+        # Trie: goto[state] maps a character to the next state; output[state]
+        # lists keywords ending at that state
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[list[str]] = [[]]
+        for pattern, keyword in self.keywords.items():
+            self._add(pattern, keyword)
+        self._build_failure_links()
+
+    def _add(self, pattern: str, keyword: str) -> None:
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append(keyword)
+
+    def _build_failure_links(self) -> None:
+        # Breadth-first, so a state's failure target is finished before it
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state] = (
+                    self._output[next_state] + self._output[self._fail[next_state]]
+                )
+
+    def __bool__(self) -> bool:
+        return bool(self.keywords)
+
+    def match(self, *texts: Optional[str]) -> list[str]:
+        """Keywords found in any of ``texts``, in configured order, without duplicates."""
+        if not self.keywords:
+            return []
+
+        goto, fail, output = self._goto, self._fail, self._output
+        found: set[str] = set()
+        for text in texts:
+            if not text:
+                continue
+            state = 0
+            for char in normalize(text):
+                while state and char not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(char, 0)
+                if output[state]:
+                    found.update(output[state])
+        return [keyword for keyword in self.keywords.values() if keyword in found]
+
+
+_EMPTY = KeywordMatcher(())
+
+
+class MatcherCache:
+    """Bounded LRU of compiled matchers, rebuilt when keywords change."""
+
+    def __init__(self, max_size: int = 4096):
+        self.max_size = max_size
+        self._entries: OrderedDict[Hashable, tuple[tuple[str, ...], KeywordMatcher]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, keywords: Iterable[str]) -> KeywordMatcher:
+        signature = tuple(keywords)
+        if not signature:
+            return _EMPTY
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == signature:
+                self._entries.move_to_end(key)
+                return entry[1]
+
+        # Compile outside the lock; a concurrent duplicate build is harmless
+        matcher = KeywordMatcher(signature)
+        with self._lock:
+            self._entries[key] = (signature, matcher)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return matcher
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_cache = MatcherCache()
+
+
+def get_matcher(key: Hashable, keywords: Iterable[str]) -> KeywordMatcher:
+    """Cached matcher for ``key`` (e.g. a site id) and its current keywords."""
+    return _cache.get(key, keywords)
@@ -0,0 +1,96 @@
+"""MinHash signatures and LSH band keys for near-duplicate detection.
+
+An item's words (its title when known, else the words of its URL slug) are
+reduced to a ``NUM_PERM``-value MinHash signature. The fraction of equal
+values between two signatures estimates the Jaccard similarity of their word
+sets. Signatures are split into ``BANDS`` bands of ``ROWS`` values, each
+hashed to one band key: items sharing any band key are candidates, so
+lookups are index equality probes rather than comparisons against every
+item. With 4 bands of 4 rows, pairs at Jaccard 0.85 collide ~95% of the time
+and pairs at 0.3 about 3%.
+"""
+
+import hashlib
+import re
+from collections.abc import Iterable, Sequence
+from typing import Optional
+from urllib.parse import urlsplit
+
+NUM_PERM = 16
+BANDS = 4
+ROWS = NUM_PERM // BANDS
+SIMILARITY_THRESHOLD = 0.7
+MIN_TOKENS = 3
+
+_PRIME = (1 << 61) - 1
+_WORD = re.compile(r"[^\W_]+")
+
+
+def _digest64(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+# Fixed permutations (a * x + b mod p), so signatures are stable across
+# processes and deploys
+_PERMUTATIONS = [
+    (_digest64(f"minhash-a-{i}") % (_PRIME - 1) + 1, _digest64(f"minhash-b-{i}") % _PRIME)
+    for i in range(NUM_PERM)
+]
+
+# URL path words that say nothing about the story itself
+_URL_STOPWORDS = frozenset(
+    {
+        "amp", "article", "articles", "blog", "htm", "html", "index", "news",
+        "php", "post", "posts", "stories", "story", "www",
+    }
+)
+
+
+def text_tokens(text: str) -> list[str]:
+    """Lowercase word tokens."""
+    return _WORD.findall(text.casefold())
+
+
+def url_tokens(url: str) -> list[str]:
+    """Words from a URL path, without numbers (ids, dates) and boilerplate."""
+    return [
+        token
+        for token in text_tokens(urlsplit(url).path)
+        if not token.isdigit() and token not in _URL_STOPWORDS
+    ]
+
+
+def item_tokens(url: str, title: Optional[str] = None) -> list[str]:
+    """Words describing an item: its title when known, else its URL slug."""
+    tokens = text_tokens(title) if title else []
+    return tokens or url_tokens(url)
+
+
+def _hash(token: str) -> int:
+    return _digest64(token) % _PRIME
+
+
+def signature(tokens: Iterable[str]) -> Optional[list[int]]:
+    """MinHash signature of a word set; None below ``MIN_TOKENS`` distinct words.
+
+    A word or two (``/news/weather``) is too weak a signal to call two items
+    duplicates.
+    """
+    hashes = {_hash(token) for token in tokens}
+    if len(hashes) < MIN_TOKENS:
+        return None
+    return [min((a * h + b) % _PRIME for h in hashes) for a, b in _PERMUTATIONS]
+
+
+def similarity(a: Sequence[int], b: Sequence[int]) -> float:
+    """Estimated Jaccard similarity of two signatures."""
+    return sum(x == y for x, y in zip(a, b, strict=True)) / NUM_PERM
+
+
+def band_keys(sig: Sequence[int]) -> list[int]:
+    """One positive 63-bit key per band (fits a Postgres BIGINT)."""
+    keys = []
+    for band in range(BANDS):
+        rows = sig[band * ROWS : (band + 1) * ROWS]
+        keys.append(_digest64(f"{band}:{','.join(map(str, rows))}") >> 1)
+    return keys
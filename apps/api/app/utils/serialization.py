@@ -0,0 +1,118 @@
+"""Fast JSON serialization for list endpoints.
+
+List endpoints select plain column tuples and encode them straight to JSON
+bytes with orjson, instead of building a response model per row and having
+FastAPI validate and re-encode it through ``response_model``. The column sets
+below mirror ``ItemResponse``, ``RunResponse`` and ``SiteResponse`` field for
+field, so the JSON is identical to the model path; ``response_model`` stays
+on the routes for the OpenAPI schema.
+
+List endpoints also take a ``fields=`` projection (see ``select_columns``):
+only the requested columns are selected, so heavy JSON columns such as
+``diagnostics_json`` and ``meta_json`` are neither read from Postgres nor
+serialized unless asked for.
+"""
+
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any, Optional
+
+import orjson
+from fastapi import Response
+from sqlalchemy.orm import InstrumentedAttribute
+
+from app.models import Item, Run, Site
+
+ITEM_COLUMNS: dict[str, InstrumentedAttribute[Any]] = {
+    "id": Item.id,
+    "site_id": Item.site_id,
+    "url": Item.url,
+    "canonical_url": Item.canonical_url,
+    "title": Item.title,
+    "published_at": Item.published_at,
+    "discovered_at": Item.discovered_at,
+    "source": Item.source,
+    "meta_json": Item.meta_json,
+    "matched_keywords": Item.matched_keywords,
+    "duplicate_of": Item.duplicate_of,
+}
+
+RUN_COLUMNS: dict[str, InstrumentedAttribute[Any]] = {
+    "id": Run.id,
+    "site_id": Run.site_id,
+    "status": Run.status,
+    "method": Run.method,
+    "pages_scanned": Run.pages_scanned,
+    "duration_ms": Run.duration_ms,
+    "diagnostics_json": Run.diagnostics_json,
+    "started_at": Run.started_at,
+    "finished_at": Run.finished_at,
+}
+
+SITE_COLUMNS: dict[str, InstrumentedAttribute[Any]] = {
+    "id": Site.id,
+    "tenant_id": Site.tenant_id,
+    "url": Site.url,
+    "profile_key": Site.profile_key,
+    "keywords": Site.keywords,
+    "enabled": Site.enabled,
+    "interval_minutes": Site.interval_minutes,
+    "adaptive": Site.adaptive,
+    "adaptive_interval_minutes": Site.adaptive_interval_minutes,
+    "last_run_at": Site.last_run_at,
+    "next_run_at": Site.next_run_at,
+    "created_at": Site.created_at,
+}
+
+
+def select_columns(
+    columns: dict[str, InstrumentedAttribute[Any]],
+    fields: Optional[str],
+    required: Sequence[str] = ("id",),
+) -> dict[str, InstrumentedAttribute[Any]]:
+    """Subset of ``columns`` named by a comma-separated ``fields`` parameter.
+
+    No ``fields`` selects everything. ``required`` columns (the pagination
+    key) are always included. Column order is kept. Raises ``ValueError`` on
+    unknown field names.
+    """
+    if not fields:
+        return columns
+
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = sorted(requested - columns.keys())
+    if unknown:
+        raise ValueError(
+            f"Unknown field(s): {', '.join(unknown)}. Available: {', '.join(columns)}"
+        )
+
+    requested.update(required)
+    return {name: column for name, column in columns.items() if name in requested}
+
+
+class FastJSONResponse(Response):
+    """JSON response encoded with orjson.
+
+    orjson natively encodes UUIDs, datetimes (ISO 8601, as Pydantic does) and
+    str enums such as ``RunStatus``.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def dumps(content: Any) -> bytes:
+    """Encode content to JSON bytes."""
+    return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def rows_to_dicts(rows: Iterable[Sequence[Any]], fields: Sequence[str]) -> list[dict[str, Any]]:
+    """Zip column tuples with their field names."""
+    return [dict(zip(fields, row, strict=True)) for row in rows]
+
+
+def iter_ndjson(rows: Iterable[Sequence[Any]], fields: Sequence[str]) -> Iterator[bytes]:
+    """Encode column tuples as newline-delimited JSON, one row per line."""
+    for row in rows:
+        yield dumps(dict(zip(fields, row, strict=True))) + b"\n"
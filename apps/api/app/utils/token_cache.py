@@ -0,0 +1,92 @@
+"""Cache of verified JWTs for ``get_current_user``.
+
+A dashboard page makes several API calls with the same token; each would
+verify the JWT and SELECT the user. Entries map a SHA-256 digest of the
+token (raw tokens are never kept) to a snapshot of the user's columns, and
+live until the earlier of ``ttl`` seconds and the token's ``exp``.
+
+Revocation bumps ``users.token_version``: tokens carry the version as their
+``ver`` claim and are rejected on a cache miss when it no longer matches.
+The replica handling the bump drops the user's entries at once; other
+replicas stop serving them within ``ttl``.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from app.config import settings
+
+
+@dataclass(frozen=True)
+class UserSnapshot:
+    """The ``users`` row a token was verified against."""
+
+    id: UUID
+    email: str
+    name: Optional[str]
+    created_at: Optional[datetime]
+    token_version: int
+
+
+def token_digest(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()
+
+
+class VerifiedTokenCache:
+    """Bounded, TTL-respecting LRU of token digest → user snapshot."""
+
+    def __init__(self, max_size: int = 4096, ttl: float = 60.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[bytes, tuple[float, UserSnapshot]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> Optional[UserSnapshot]:
+        key = token_digest(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, snapshot = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return snapshot
+
+    def put(self, token: str, snapshot: UserSnapshot, token_exp: Optional[float]) -> None:
+        """Cache a verified token until ``ttl`` from now, or its ``exp`` if sooner."""
+        expires_at = time.time() + self.ttl
+        if token_exp is not None:
+            expires_at = min(expires_at, token_exp)
+        if self.ttl <= 0 or expires_at <= time.time():
+            return
+        key = token_digest(token)
+        with self._lock:
+            self._entries[key] = (expires_at, snapshot)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate_user(self, user_id: UUID) -> None:
+        with self._lock:
+            for key in [key for key, (_, snapshot) in self._entries.items() if snapshot.id == user_id]:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+token_cache = VerifiedTokenCache(
+    max_size=settings.jwt_cache_size, ttl=settings.jwt_cache_ttl_seconds
+)
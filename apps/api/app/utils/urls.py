@@ -0,0 +1,60 @@
+"""URL helpers."""
+
+import ipaddress
+from urllib.parse import urlsplit
+
+# Public suffixes with more than one label that our customers' sites use.
+# Not the full Public Suffix List: an unknown multi-label suffix groups a
+# little too broadly (e.g. all of ``*.example.ac.xx``), which only makes
+# politeness limits stricter.
+_MULTI_LABEL_SUFFIXES = frozenset(
+    {
+        "ab.ca", "bc.ca", "mb.ca", "nb.ca", "nl.ca", "ns.ca", "on.ca", "qc.ca", "sk.ca",
+        "gc.ca", "ac.uk", "co.uk", "gov.uk", "org.uk", "ltd.uk", "me.uk", "net.uk",
+        "com.au", "net.au", "org.au", "gov.au", "edu.au", "co.nz", "govt.nz", "org.nz",
+        "co.jp", "co.za", "com.br", "com.mx", "co.in", "gov.in",
+        "github.io", "blogspot.com", "wordpress.com", "substack.com", "medium.com",
+    }
+)
+
+
+def hostname(url: str) -> str:
+    """Lowercase host of a URL, without port; empty if there is none."""
+    return (urlsplit(url if "://" in url else f"//{url}").hostname or "").rstrip(".")
+
+
+def registrable_domain(url: str) -> str:
+    """The domain a site owner registered (eTLD+1), e.g. ``news.example.co.uk`` → ``example.co.uk``.
+
+    IP addresses and single-label hosts are returned as they are.
+    """
+    host = hostname(url)
+    try:
+        ipaddress.ip_address(host)
+        return host
+    except ValueError:
+        pass
+
+    labels = host.split(".")
+    if len(labels) <= 2:
+        return host
+    if ".".join(labels[-2:]) in _MULTI_LABEL_SUFFIXES:
+        return ".".join(labels[-3:])
+    return ".".join(labels[-2:])
+
+
+def normalize_url(url: str) -> str:
+    """Normalize a URL for use as a key: lowercase scheme and host, no default port or fragment.
+
+    ``https://Example.com:443`` and ``https://example.com/#top`` both become
+    ``https://example.com/``. The path and query are kept as they are.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    netloc = hostname(url)
+    if ":" in netloc:
+        netloc = f"[{netloc}]"
+    if parts.port and (scheme, parts.port) not in (("http", 80), ("https", 443)):
+        netloc = f"{netloc}:{parts.port}"
+    query = f"?{parts.query}" if parts.query else ""
+    return f"{scheme}://{netloc}{parts.path or '/'}{query}"
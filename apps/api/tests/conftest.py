@@ -14,6 +14,7 @@ from app.database import Base, get_db
 from app.main import app
 from app.models import Role, Tenant, User, UserTenant
 from app.utils.auth import create_jwt_token
+from app.utils.token_cache import token_cache
 
 # Use test database
 TEST_DATABASE_URL = settings.test_database_url
@@ -47,6 +48,7 @@ def client(db: Session) -> TestClient:
             pass
 
     app.dependency_overrides[get_db] = override_get_db
+    token_cache.clear()
     return TestClient(app)
 
 
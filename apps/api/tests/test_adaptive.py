@@ -0,0 +1,27 @@
+"""Tests for adaptive polling intervals."""
+
+import pytest
+
+from app.services.adaptive import HALF_LIFE_HOURS, interval_for_rate, update_rate
+
+
+@pytest.mark.unit
+def test_update_rate_is_time_weighted() -> None:
+    """Test that the EWMA moves further after longer gaps."""
+    assert update_rate(None, 4, 2.0) == 2.0
+    # One half-life of evidence moves the rate halfway
+    assert update_rate(2.0, 0, HALF_LIFE_HOURS) == pytest.approx(1.0)
+    assert update_rate(2.0, 0, 1.0) > update_rate(2.0, 0, 24.0)
+    # Back-to-back runs are floored, not treated as an instant burst
+    assert update_rate(None, 1, 0.0) == 4.0
+
+
+@pytest.mark.unit
+def test_interval_for_rate_within_bounds() -> None:
+    """Test that intervals shrink with the posting rate and respect tenant bounds."""
+    assert interval_for_rate(2.0, 15, 1440) == 21
+    assert interval_for_rate(1.0, 15, 1440) == 30
+    assert interval_for_rate(1 / 24, 15, 1440) == 146
+    assert interval_for_rate(100.0, 15, 1440) == 15
+    assert interval_for_rate(0.0001, 15, 1440) == 1440
+    assert interval_for_rate(None, 15, 1440) == 1440
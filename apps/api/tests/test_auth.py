@@ -1,11 +1,21 @@
 """Tests for auth endpoints."""
 
+from datetime import datetime, timedelta
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
 from app.models import User
-from app.routers.auth import magic_links
+from app.services.magic_links import MemoryMagicLinkStore
+
+
+@pytest.fixture
+def magic_token(monkeypatch: pytest.MonkeyPatch) -> str:
+    """Token the next magic link request will issue."""
+    token = "test-magic-link-token"
+    monkeypatch.setattr("app.routers.auth.create_magic_link_token", lambda: token)
+    return token
 
 
 @pytest.mark.unit
@@ -23,7 +33,7 @@ def test_request_magic_link(client: TestClient) -> None:
 
 
 @pytest.mark.unit
-def test_magic_link_callback_creates_user(client: TestClient, db: Session) -> None:
+def test_magic_link_callback_creates_user(client: TestClient, db: Session, magic_token: str) -> None:
     """Test magic link callback creates new user."""
     # Request magic link first
     response = client.post(
@@ -32,13 +42,10 @@ def test_magic_link_callback_creates_user(client: TestClient, db: Session) -> No
     )
     assert response.status_code == 200
 
-    # Get token from magic_links dict
-    token = list(magic_links.keys())[0]
-
     # Callback with token
     response = client.post(
         "/v1/auth/magic-link/callback",
-        json={"token": token},
+        json={"token": magic_token},
     )
 
     assert response.status_code == 200
@@ -53,7 +60,7 @@ def test_magic_link_callback_creates_user(client: TestClient, db: Session) -> No
 
 @pytest.mark.unit
 def test_magic_link_callback_existing_user(
-    client: TestClient, db: Session, super_admin_user: User
+    client: TestClient, db: Session, super_admin_user: User, magic_token: str
 ) -> None:
     """Test magic link callback with existing user."""
     # Request magic link
@@ -63,13 +70,10 @@ def test_magic_link_callback_existing_user(
     )
     assert response.status_code == 200
 
-    # Get token
-    token = list(magic_links.keys())[0]
-
     # Callback
     response = client.post(
         "/v1/auth/magic-link/callback",
-        json={"token": token},
+        json={"token": magic_token},
     )
 
     assert response.status_code == 200
@@ -77,6 +81,13 @@ def test_magic_link_callback_existing_user(
     assert data["user"]["email"] == super_admin_user.email
     assert str(data["user"]["id"]) == str(super_admin_user.id)
 
+    # Tokens are single use
+    response = client.post(
+        "/v1/auth/magic-link/callback",
+        json={"token": magic_token},
+    )
+    assert response.status_code == 400
+
 
 @pytest.mark.unit
 def test_magic_link_callback_invalid_token(client: TestClient) -> None:
@@ -90,6 +101,23 @@ def test_magic_link_callback_invalid_token(client: TestClient) -> None:
     assert "Invalid or expired token" in response.json()["detail"]
 
 
+@pytest.mark.unit
+def test_memory_store_expiry_and_single_use() -> None:
+    """Memory store tokens are refused once expired or used, and swept."""
+    store = MemoryMagicLinkStore(timedelta(minutes=15))
+    now = datetime(2025, 11, 20, 12, 0)
+    store.put(None, "fresh", "a@example.com", now)
+    store.put(None, "stale", "b@example.com", now - timedelta(minutes=20))
+
+    assert store.consume(None, "stale", now) is None
+    assert store.consume(None, "fresh", now) == "a@example.com"
+    assert store.consume(None, "fresh", now) is None
+
+    store.put(None, "old", "c@example.com", now)
+    assert store.sweep(None, now + timedelta(minutes=15)) == 1
+    assert len(store) == 0
+
+
 @pytest.mark.unit
 def test_get_me(client: TestClient, super_admin_with_tenant: User, auth_headers: dict[str, str]) -> None:
     """Test get current user."""
@@ -109,3 +137,22 @@ def test_get_me_unauthenticated(client: TestClient) -> None:
     assert response.status_code == 401
     assert "Not authenticated" in response.json()["detail"]
 
+
+
+@pytest.mark.integration
+def test_logout_revokes_cached_token(
+    client: TestClient, db: Session, super_admin_with_tenant: User, auth_headers: dict[str, str]
+) -> None:
+    """Logout bumps the token version, so the (cached) token stops working."""
+    assert client.get("/v1/auth/me", headers=auth_headers).status_code == 200
+
+    response = client.post("/v1/auth/logout", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json() == {"success": True}
+
+    response = client.get("/v1/auth/me", headers=auth_headers)
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Token has been revoked"
+
+    db.refresh(super_admin_with_tenant)
+    assert super_admin_with_tenant.token_version == 1
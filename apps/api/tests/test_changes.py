@@ -0,0 +1,73 @@
+"""Tests for the change feed."""
+
+from datetime import datetime
+
+import pytest
+import respx
+from fastapi.testclient import TestClient
+from httpx import Response
+from sqlalchemy.orm import Session
+
+from app.models import Site, User
+
+
+@pytest.mark.integration
+@respx.mock
+def test_list_changes_since(
+    client: TestClient,
+    db: Session,
+    admin_user: User,
+    test_tenant,
+    admin_auth_headers: dict[str, str],
+) -> None:
+    """Test that runs append ordered changes and sync resumes from next_since."""
+    site = Site(tenant_id=test_tenant.id, url="https://example.com", created_at=datetime.utcnow())
+    db.add(site)
+    db.commit()
+    db.refresh(site)
+
+    respx.post("https://your-worker.workers.dev/discover").mock(
+        return_value=Response(
+            200,
+            json={
+                "source": "html",
+                "links": ["https://example.com/a", "https://example.com/b"],
+                "count": 2,
+            },
+        )
+    )
+    assert client.post(f"/v1/sites/{site.id}/run", headers=admin_auth_headers).status_code == 200
+
+    response = client.get(
+        "/v1/changes",
+        params={"tenant_id": str(test_tenant.id), "limit": 2},
+        headers=admin_auth_headers,
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert [change["seq"] for change in data["changes"]] == [1, 2]
+    assert {change["item"]["url"] for change in data["changes"]} == {
+        "https://example.com/a",
+        "https://example.com/b",
+    }
+    assert data["has_more"] is True
+
+    response = client.get(
+        "/v1/changes",
+        params={"tenant_id": str(test_tenant.id), "since": data["next_since"]},
+        headers=admin_auth_headers,
+    )
+    data = response.json()
+    assert [change["kind"] for change in data["changes"]] == ["run"]
+    assert data["changes"][0]["run"]["status"] == "success"
+    assert data["next_since"] == 3
+    assert data["has_more"] is False
+
+    # A second run finds nothing new: only its run entry is appended
+    assert client.post(f"/v1/sites/{site.id}/run", headers=admin_auth_headers).status_code == 200
+    response = client.get(
+        "/v1/changes",
+        params={"tenant_id": str(test_tenant.id), "since": 3},
+        headers=admin_auth_headers,
+    )
+    assert [change["seq"] for change in response.json()["changes"]] == [4]
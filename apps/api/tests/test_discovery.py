@@ -0,0 +1,165 @@
+"""Tests for coalesced Worker discovery calls."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+import respx
+from fastapi.testclient import TestClient
+from httpx import Response
+from sqlalchemy.orm import Session
+
+from app.models import Item, Run, Site
+from app.services.discovery import SingleFlight, discovery_key
+from app.utils.urls import normalize_url
+
+
+@pytest.mark.unit
+def test_discovery_key_normalizes_url() -> None:
+    """Test that equivalent URLs and shared profiles get one key."""
+    assert normalize_url("HTTPS://Example.com:443") == "https://example.com/"
+    assert normalize_url("https://example.com/news?page=2#top") == "https://example.com/news?page=2"
+    assert normalize_url("http://example.com:8080/") == "http://example.com:8080/"
+
+    a = SimpleNamespace(profile_key=None, url="https://Example.com/")
+    b = SimpleNamespace(profile_key=None, url="https://example.com#latest")
+    profile = SimpleNamespace(profile_key="rcmp_fsj", url="https://rcmp.ca/fsj")
+    assert discovery_key(a) == discovery_key(b) == "discover:https://example.com/"
+    assert discovery_key(profile) == "profile:rcmp_fsj"
+
+
+@pytest.mark.unit
+def test_single_flight_shares_one_call() -> None:
+    """Test that concurrent callers with one key share a single call and its error."""
+    flights: SingleFlight[int] = SingleFlight()
+    calls = []
+    release = threading.Event()
+
+    def call() -> int:
+        calls.append(1)
+        release.wait(timeout=5)
+        return 42
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(flights.do, "k", call) for _ in range(4)]
+        time.sleep(0.05)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert len(calls) == 1
+    assert sorted(joined for _, joined in results) == [False, True, True, True]
+    assert {value for value, _ in results} == {42}
+
+    def fail() -> int:
+        raise ValueError("worker down")
+
+    with pytest.raises(ValueError):
+        flights.do("k", fail)
+    # Errors are not remembered
+    assert flights.do("k", lambda: 7) == (7, False)
+
+
+@pytest.mark.integration
+@respx.mock
+def test_sites_with_same_url_share_worker_response(
+    client: TestClient,
+    db: Session,
+    admin_user,
+    test_tenant,
+    admin_auth_headers: dict[str, str],
+) -> None:
+    """Test that a recent response is reused, with a Run and items per site."""
+    sites = [
+        Site(tenant_id=test_tenant.id, url=url, created_at=datetime.utcnow())
+        for url in ("https://example.com", "https://EXAMPLE.com/#news")
+    ]
+    db.add_all(sites)
+    db.commit()
+
+    route = respx.post("https://your-worker.workers.dev/discover").mock(
+        return_value=Response(
+            200,
+            json={"source": "html", "links": ["https://example.com/a"], "count": 1},
+        )
+    )
+
+    for site in sites:
+        response = client.post(f"/v1/sites/{site.id}/run", headers=admin_auth_headers)
+        assert response.status_code == 200
+
+    assert route.call_count == 1
+    for site in sites:
+        assert db.query(Item).filter(Item.site_id == site.id).count() == 1
+    runs = db.query(Run).filter(Run.site_id.in_([site.id for site in sites])).all()
+    assert len(runs) == 2
+    assert sorted(bool((run.diagnostics_json or {}).get("shared_response")) for run in runs) == [
+        False,
+        True,
+    ]
+
+
+@pytest.mark.integration
+def test_response_is_cached_before_waiters_get_the_lock(db: Session) -> None:
+    """Test that a caller blocked on the key's lock in another process reads the cached response."""
+    from app.services.discovery import DiscoveryCoalescer
+    from app.services.worker_client import WorkerResponse
+
+    # Separate coalescers act as separate processes: no in-process single flight
+    leader, follower = DiscoveryCoalescer(ttl=60), DiscoveryCoalescer(ttl=60)
+    response = WorkerResponse(source="html", links=["https://example.com/a"], count=1)
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def slow_call():
+        calls.append("leader")
+        started.set()
+        release.wait(timeout=5)
+        return response, True
+
+    def follower_call():
+        calls.append("follower")
+        return response, True
+
+    bind = db.get_bind()
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        first = pool.submit(leader.fetch, bind, "discover:https://example.com/", slow_call)
+        assert started.wait(timeout=5)
+        second = pool.submit(follower.fetch, bind, "discover:https://example.com/", follower_call)
+        # Let the follower block on the advisory lock before the leader finishes
+        time.sleep(0.2)
+        release.set()
+        assert first.result() == (response, False)
+        assert second.result() == (response, True)
+
+    assert calls == ["leader"]
+
+
+@pytest.mark.integration
+def test_stuck_lock_holder_does_not_block_other_processes(db: Session) -> None:
+    """Test that a caller stops waiting for the key's lock after ``lock_wait`` and calls itself."""
+    from app.services.discovery import DiscoveryCoalescer
+    from app.services.worker_client import WorkerResponse
+
+    leader = DiscoveryCoalescer(ttl=60)
+    follower = DiscoveryCoalescer(ttl=60, lock_wait=0.3)
+    response = WorkerResponse(source="html", links=[], count=0)
+    started, release = threading.Event(), threading.Event()
+
+    def stuck_call():
+        started.set()
+        release.wait(timeout=5)
+        return response, True
+
+    bind = db.get_bind()
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        first = pool.submit(leader.fetch, bind, "profile:rcmp_fsj", stuck_call)
+        assert started.wait(timeout=5)
+        began = time.monotonic()
+        own = WorkerResponse(source="rcmp_fsj", links=[], count=0)
+        assert follower.fetch(bind, "profile:rcmp_fsj", lambda: (own, True)) == (own, False)
+        assert time.monotonic() - began < 2
+        release.set()
+        first.result()
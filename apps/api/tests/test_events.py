@@ -0,0 +1,50 @@
+"""Tests for real-time events."""
+
+import asyncio
+from uuid import uuid4
+
+import orjson
+import pytest
+
+from app.routers.stream import format_event
+from app.services.events import QUEUE_SIZE, EventBroker
+
+
+@pytest.mark.unit
+def test_broker_fans_out_by_tenant(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that events reach only their tenant's subscribers, oldest dropped first."""
+    broker = EventBroker("postgresql://unused")
+    monkeypatch.setattr(broker, "_ensure_started", lambda loop: None)
+    tenant_id, other_id = uuid4(), uuid4()
+
+    async def scenario() -> None:
+        first = broker.subscribe([tenant_id])
+        second = broker.subscribe([tenant_id, other_id])
+        assert broker.subscriber_count() == 2
+
+        for i in range(QUEUE_SIZE + 1):
+            broker.dispatch(orjson.dumps({"type": "run", "tenant_id": tenant_id, "data": {"i": i}}))
+        broker.dispatch(orjson.dumps({"type": "run", "tenant_id": other_id, "data": {}}))
+        broker.dispatch("not json")
+
+        assert first.qsize() == QUEUE_SIZE
+        assert first.get_nowait()["data"] == {"i": 1}
+        assert second.qsize() == QUEUE_SIZE
+
+        broker.unsubscribe(first)
+        broker.unsubscribe(second)
+        assert broker.subscriber_count() == 0
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.unit
+def test_format_event() -> None:
+    """Test SSE message framing."""
+    event = {"type": "items", "tenant_id": "t", "data": {"count": 1}}
+
+    message = format_event(event)
+
+    assert message.startswith(b"event: items\ndata: ")
+    assert message.endswith(b"\n\n")
+    assert orjson.loads(message.split(b"data: ", 1)[1]) == event
@@ -0,0 +1,211 @@
+"""Tests for RSS/Atom feeds."""
+
+import xml.etree.ElementTree as ET
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.models import Item, Site, User
+from app.services.feeds import FeedCache, bump_items_version, render_atom, render_rss
+from app.utils.auth import create_feed_token, verify_feed_token
+
+
+def _item(title=None) -> dict:
+    return {
+        "id": uuid4(),
+        "url": "https://example.com/news/house-fire",
+        "title": title,
+        "published_at": None,
+        "discovered_at": datetime(2025, 11, 5, 9, 30),
+        "matched_keywords": ["fire"],
+    }
+
+
+@pytest.mark.unit
+def test_render_rss_and_atom() -> None:
+    """Test that feeds are well-formed and carry item fields."""
+    items = [_item("Crews battle <house> fire"), _item()]
+
+    channel = ET.fromstring(render_rss("https://example.com", "https://example.com", items))[0]
+    entries = channel.findall("item")
+    assert [entry.findtext("title") for entry in entries] == [
+        "Crews battle <house> fire",
+        "https://example.com/news/house-fire",
+    ]
+    assert entries[0].findtext("pubDate") == "Wed, 05 Nov 2025 09:30:00 GMT"
+    assert entries[0].findtext("category") == "fire"
+
+    ns = {"atom": "http://www.w3.org/2005/Atom"}
+    feed = ET.fromstring(render_atom(uuid4(), "Tenant", "https://app.example.com", items))
+    assert feed.findtext("atom:updated", namespaces=ns) == "2025-11-05T09:30:00Z"
+    assert len(feed.findall("atom:entry", ns)) == 2
+
+
+@pytest.mark.unit
+def test_feed_tokens() -> None:
+    """Test that feed tokens carry their claims and are bound to scope, resource and expiry."""
+    site_id, user_id, tenant_id = str(uuid4()), uuid4(), uuid4()
+    expires_at = datetime(2030, 1, 1)
+    token = create_feed_token("site", site_id, user_id, tenant_id, 3, expires_at)
+
+    claims = verify_feed_token(token, "site", site_id, now=datetime(2029, 12, 31))
+    assert claims == (user_id, tenant_id, expires_at, 3)
+    assert verify_feed_token(token, "site", site_id, now=expires_at) is None
+    assert verify_feed_token(token, "tenant", site_id, now=datetime(2029, 12, 31)) is None
+    assert verify_feed_token(token, "site", str(uuid4()), now=datetime(2029, 12, 31)) is None
+    assert verify_feed_token("forged", "site", site_id) is None
+
+    other_user = create_feed_token("site", site_id, uuid4(), tenant_id, 3, expires_at)
+    assert other_user != token
+    # Editing the claims (character 50 encodes the version) breaks the HMAC
+    tampered = token[:50] + ("B" if token[50] == "A" else "A") + token[51:]
+    assert verify_feed_token(tampered, "site", site_id, now=datetime(2029, 12, 31)) is None
+
+
+@pytest.mark.unit
+def test_feed_cache_renders_once_per_version() -> None:
+    """Test that cached bytes are reused until the version changes."""
+    cache = FeedCache(max_size=1)
+    renders = []
+
+    def render() -> bytes:
+        renders.append(1)
+        return f"v{len(renders)}".encode()
+
+    assert cache.get("a", 1, render) == b"v1"
+    assert cache.get("a", 1, render) == b"v1"
+    assert cache.get("a", 2, render) == b"v2"
+    cache.get("b", 1, render)
+    assert len(cache) == 1
+
+
+@pytest.mark.integration
+def test_site_feed(
+    client: TestClient,
+    db: Session,
+    admin_user: User,
+    test_tenant,
+    admin_auth_headers: dict[str, str],
+) -> None:
+    """Test signed feed links, rendering, ETags and invalidation."""
+    site = Site(tenant_id=test_tenant.id, url="https://example.com", created_at=datetime.utcnow())
+    db.add(site)
+    db.flush()
+    db.add(Item(site_id=site.id, url="https://example.com/a", discovered_at=datetime.utcnow()))
+    db.commit()
+
+    links = client.get(f"/v1/sites/{site.id}/feed-links", headers=admin_auth_headers).json()
+    token = links["token"]
+    assert links["rss_url"].endswith(f"/v1/sites/{site.id}/feed.xml?token={token}")
+
+    response = client.get(f"/v1/sites/{site.id}/feed.xml", params={"token": "forged"})
+    assert response.status_code == 401
+
+    response = client.get(f"/v1/sites/{site.id}/feed.xml", params={"token": token})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/rss+xml")
+    etag = response.headers["etag"]
+
+    response = client.get(
+        f"/v1/sites/{site.id}/feed.xml",
+        params={"token": token},
+        headers={"If-None-Match": etag},
+    )
+    assert response.status_code == 304
+
+    db.add(Item(site_id=site.id, url="https://example.com/b", discovered_at=datetime.utcnow()))
+    bump_items_version(db, site.id, test_tenant.id)
+    db.commit()
+
+    response = client.get(
+        f"/v1/tenants/{test_tenant.id}/feed.atom",
+        params={
+            "token": create_feed_token(
+                "tenant", str(test_tenant.id), admin_user.id, test_tenant.id, 0
+            )
+        },
+    )
+    assert response.status_code == 200
+    assert response.text.count("<entry>") == 2
+
+    response = client.get(
+        f"/v1/sites/{site.id}/feed.xml",
+        params={"token": token},
+        headers={"If-None-Match": etag},
+    )
+    assert response.status_code == 200
+    assert response.text.count("<item>") == 2
+
+
+@pytest.mark.security
+def test_feed_tokens_revoked_by_rotation_and_expiry(
+    client: TestClient,
+    db: Session,
+    admin_user: User,
+    member_user: User,
+    test_tenant,
+    admin_auth_headers: dict[str, str],
+    member_auth_headers: dict[str, str],
+) -> None:
+    """Test that feed URLs stop working after tenant rotation or expiry."""
+    site = Site(tenant_id=test_tenant.id, url="https://example.com", created_at=datetime.utcnow())
+    db.add(site)
+    db.commit()
+    feed = f"/v1/sites/{site.id}/feed.xml"
+
+    links = f"/v1/sites/{site.id}/feed-links"
+    admin_token = client.get(links, headers=admin_auth_headers).json()["token"]
+    member_token = client.get(links, headers=member_auth_headers).json()["token"]
+    assert admin_token != member_token
+    assert client.get(feed, params={"token": member_token}).status_code == 200
+
+    # Tenant-wide feeds and rotation are for admins only
+    response = client.get(f"/v1/tenants/{test_tenant.id}/feed-links", headers=member_auth_headers)
+    assert response.status_code == 403
+    rotate = f"/v1/tenants/{test_tenant.id}/feed-links/rotate"
+    assert client.post(rotate, headers=member_auth_headers).status_code == 403
+
+    response = client.post(rotate, headers=admin_auth_headers)
+    assert response.status_code == 200
+    assert client.get(feed, params={"token": admin_token}).status_code == 401
+    assert client.get(feed, params={"token": member_token}).status_code == 401
+    new_token = client.get(links, headers=admin_auth_headers).json()["token"]
+    assert client.get(feed, params={"token": new_token}).status_code == 200
+
+    past = datetime.utcnow() - timedelta(seconds=1)
+    expired = create_feed_token("site", str(site.id), admin_user.id, test_tenant.id, 1, past)
+    assert client.get(feed, params={"token": expired}).status_code == 401
+    # Signed for this site but with another tenant's claims
+    other_tenant = create_feed_token("site", str(site.id), admin_user.id, uuid4(), 1)
+    assert client.get(feed, params={"token": other_tenant}).status_code == 401
+
+
+@pytest.mark.integration
+def test_feed_requests_skip_auth_tables(
+    client: TestClient, db: Session, test_tenant, admin_auth_headers: dict[str, str]
+) -> None:
+    """Test that serving a feed, 304s included, never queries users or memberships."""
+    site = Site(tenant_id=test_tenant.id, url="https://example.com", created_at=datetime.utcnow())
+    db.add(site)
+    db.commit()
+    links = client.get(f"/v1/sites/{site.id}/feed-links", headers=admin_auth_headers).json()
+    url = links["rss_url"]
+
+    statements = []
+
+    def record(conn, cursor, statement, *args) -> None:
+        statements.append(statement)
+
+    event.listen(db.get_bind(), "before_cursor_execute", record)
+    try:
+        etag = client.get(url).headers["etag"]
+        assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+    finally:
+        event.remove(db.get_bind(), "before_cursor_execute", record)
+
+    assert statements
+    assert not [s for s in statements if "users" in s or "user_tenants" in s]
@@ -0,0 +1,97 @@
+"""Tests for the Worker circuit breaker and cached health checks."""
+
+import time
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.pool import QueuePool
+
+from app.services.health import HealthMonitor
+from app.services.worker_client import CircuitBreaker, WorkerClient, WorkerClientError
+
+
+def _engine(url: str = "sqlite://"):
+    return create_engine(url, poolclass=QueuePool, pool_size=1, max_overflow=0)
+
+
+@pytest.mark.unit
+def test_circuit_opens_then_half_opens() -> None:
+    """Test that the circuit opens after repeated failures and allows one trial call."""
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=0.05)
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+    time.sleep(0.06)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()  # only one trial at a time
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+@pytest.mark.unit
+def test_open_circuit_refuses_worker_calls() -> None:
+    """Test that streamed calls fail fast without a request while the circuit is open."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=60)
+    breaker.record_failure()
+    client = WorkerClient("http://worker.invalid", breaker=breaker)
+
+    with pytest.raises(WorkerClientError, match="circuit open"):
+        with client.stream_discover("https://example.com"):
+            pass
+
+
+@pytest.mark.unit
+def test_health_ok_and_degraded_by_circuit() -> None:
+    """Test that an open Worker circuit degrades health but keeps the replica ready."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=60)
+    monitor = HealthMonitor(_engine(), breaker)
+
+    assert monitor.snapshot().status == "starting"
+    assert not monitor.snapshot().ready
+
+    snapshot = monitor.check()
+    assert (snapshot.status, snapshot.ready, snapshot.database) == ("ok", True, "connected")
+    assert snapshot.pool == {"checked_out": 0, "capacity": 1, "saturation": 0.0}
+
+    breaker.record_failure()
+    snapshot = monitor.check()
+    assert (snapshot.status, snapshot.ready, snapshot.worker_circuit) == ("degraded", True, "open")
+
+
+@pytest.mark.unit
+def test_health_degraded_when_pool_exhausted() -> None:
+    """Test that an exhausted pool is reported without waiting for a connection."""
+    engine = _engine()
+    monitor = HealthMonitor(engine, CircuitBreaker())
+    monitor.check()
+
+    with engine.connect():
+        start = time.perf_counter()
+        snapshot = monitor.check()
+        assert time.perf_counter() - start < 1
+
+    assert (snapshot.status, snapshot.ready, snapshot.database) == ("degraded", False, "connected")
+    assert snapshot.pool["saturation"] == 1.0
+
+
+@pytest.mark.unit
+def test_health_unavailable_when_database_down_or_checks_stall() -> None:
+    """Test that a failed database check, or a stale snapshot, is not ready."""
+    monitor = HealthMonitor(_engine("sqlite:////nonexistent/dir/db.sqlite"), CircuitBreaker())
+    snapshot = monitor.check()
+    assert (snapshot.status, snapshot.ready, snapshot.database) == ("unavailable", False, "disconnected")
+
+    monitor = HealthMonitor(_engine(), CircuitBreaker(), interval=0.01)
+    monitor.check()
+    time.sleep(0.05)
+    assert monitor.snapshot().status == "unavailable"
+    assert not monitor.snapshot().ready
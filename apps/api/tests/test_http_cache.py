@@ -0,0 +1,71 @@
+"""Tests for ETag / Last-Modified conditional requests."""
+
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models import Tenant, User
+from app.utils.http_cache import etag_matches
+
+
+@pytest.mark.unit
+def test_etag_matches() -> None:
+    """If-None-Match uses weak comparison and accepts lists and *."""
+    etag = 'W/"abc"'
+
+    assert etag_matches('W/"abc"', etag)
+    assert etag_matches('"abc"', etag)
+    assert etag_matches('"xyz", W/"abc"', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"xyz"', etag)
+
+
+@pytest.mark.integration
+def test_recent_items_not_modified(
+    client: TestClient,
+    admin_user: User,
+    admin_auth_headers: dict[str, str],
+    test_tenant: Tenant,
+) -> None:
+    """A conditional request with a current ETag returns 304."""
+    url = f"/v1/dashboard/recent-items?tenant_id={test_tenant.id}"
+
+    response = client.get(url, headers=admin_auth_headers)
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    response = client.get(url, headers={**admin_auth_headers, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+
+
+@pytest.mark.integration
+def test_site_mutation_changes_etag(
+    client: TestClient,
+    db: Session,
+    admin_user: User,
+    admin_auth_headers: dict[str, str],
+    test_tenant: Tenant,
+) -> None:
+    """Creating a site bumps the tenant version and invalidates cached lists."""
+    response = client.get("/v1/sites", headers=admin_auth_headers)
+    etag = response.headers["etag"]
+
+    response = client.post(
+        "/v1/sites",
+        json={"url": "https://example.com"},
+        headers=admin_auth_headers,
+    )
+    assert response.status_code == 200
+
+    response = client.get("/v1/sites", headers={**admin_auth_headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.json()["total"] == 1
+
+    db.refresh(test_tenant)
+    assert test_tenant.data_version == 1
+    assert test_tenant.data_changed_at <= datetime.utcnow()
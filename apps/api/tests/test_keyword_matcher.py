@@ -0,0 +1,41 @@
+"""Tests for the keyword matcher."""
+
+import pytest
+
+from app.utils.keyword_matcher import KeywordMatcher, MatcherCache
+
+
+@pytest.mark.unit
+def test_matches_whole_words_in_urls_and_titles() -> None:
+    """Test whole-word, case-insensitive matching across texts."""
+    matcher = KeywordMatcher(["Fire", "city council", "RCMP", "fire"])
+
+    assert matcher.match("https://example.com/news/city-council-fire-update") == [
+        "Fire",
+        "city council",
+    ]
+    assert matcher.match("https://example.com/firefly", "RCMP release") == ["RCMP"]
+    assert matcher.match(None, "") == []
+    assert not KeywordMatcher(["", "  "])
+
+
+@pytest.mark.unit
+def test_overlapping_keywords() -> None:
+    """Test keywords that share prefixes and suffixes."""
+    matcher = KeywordMatcher(["he", "she", "his", "hers", "she sells"])
+
+    assert matcher.match("she sells hers") == ["she", "hers", "she sells"]
+
+
+@pytest.mark.unit
+def test_cache_rebuilds_on_keyword_change() -> None:
+    """Test that cached matchers are reused until keywords change."""
+    cache = MatcherCache(max_size=2)
+
+    first = cache.get("site-1", ["fire"])
+    assert cache.get("site-1", ["fire"]) is first
+    assert cache.get("site-1", ["fire", "flood"]) is not first
+
+    cache.get("site-2", ["a"])
+    cache.get("site-3", ["b"])
+    assert len(cache) == 2
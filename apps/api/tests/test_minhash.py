@@ -0,0 +1,51 @@
+"""Tests for MinHash near-duplicate fingerprints."""
+
+from uuid import uuid4
+
+import pytest
+
+from app.services.near_duplicates import _Fingerprinted, find_duplicate
+from app.utils.minhash import BANDS, band_keys, item_tokens, signature, similarity
+
+
+@pytest.mark.unit
+def test_item_tokens_prefer_title_and_skip_url_noise() -> None:
+    """Test tokenization of titles and URL slugs."""
+    assert item_tokens("https://example.com/news/2025/10/house-fire.html") == ["house", "fire"]
+    assert item_tokens("https://example.com/a", "City Council, Tonight") == [
+        "city",
+        "council",
+        "tonight",
+    ]
+
+
+@pytest.mark.unit
+def test_signature_similarity() -> None:
+    """Test that reworded URLs score high and unrelated ones low."""
+    a = signature(item_tokens("https://example.com/news/council-approves-new-library-budget"))
+    b = signature(item_tokens("https://other.com/story/991/council-approves-new-library-budget"))
+    c = signature(item_tokens("https://example.com/news/house-fire-on-main-street"))
+
+    assert a is not None and b is not None and c is not None
+    assert similarity(a, b) == 1.0
+    assert similarity(a, c) < 0.3
+    assert signature(["weather", "weather"]) is None
+
+    keys = band_keys(a)
+    assert len(keys) == BANDS
+    assert all(0 <= key < 2**63 for key in keys)
+
+
+@pytest.mark.unit
+def test_find_duplicate_returns_group() -> None:
+    """Test that a match resolves to the first item of its group."""
+    sig = signature(["council", "approves", "library", "budget"])
+    assert sig is not None
+    keys = band_keys(sig)
+    first_id, second_id = uuid4(), uuid4()
+    candidates = {keys[0]: [_Fingerprinted(second_id, first_id, sig)]}
+
+    match = find_duplicate(sig, keys, candidates)
+
+    assert match is not None and match.group_id == first_id
+    assert find_duplicate(sig, keys, {}) is None
@@ -0,0 +1,39 @@
+"""Tests for monthly partition helpers."""
+
+from datetime import date, datetime
+
+import pytest
+
+from app.services.partitions import (
+    MonthPartition,
+    add_months,
+    months_between,
+    parse_partition_name,
+)
+
+
+@pytest.mark.unit
+def test_month_arithmetic() -> None:
+    """Test month shifting and ranges across year boundaries."""
+    assert add_months(date(2025, 11, 1), 3) == date(2026, 2, 1)
+    assert add_months(date(2025, 1, 1), -1) == date(2024, 12, 1)
+    assert months_between(datetime(2025, 11, 20, 8), date(2026, 1, 3)) == [
+        date(2025, 11, 1),
+        date(2025, 12, 1),
+        date(2026, 1, 1),
+    ]
+
+
+@pytest.mark.unit
+def test_partition_names() -> None:
+    """Test partition naming, parsing and DDL."""
+    partition = MonthPartition("items", date(2025, 12, 1))
+
+    assert partition.name == "items_p2025_12"
+    assert parse_partition_name("items_p2025_12") == partition
+    assert parse_partition_name("items_default") is None
+    assert parse_partition_name("sites_p2025_12") is None
+    assert partition.create_sql() == (
+        "CREATE TABLE IF NOT EXISTS items_p2025_12 PARTITION OF items "
+        "FOR VALUES FROM ('2025-12-01') TO ('2026-01-01')"
+    )
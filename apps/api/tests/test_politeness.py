@@ -0,0 +1,139 @@
+"""Tests for per-host politeness limits."""
+
+from contextlib import contextmanager, nullcontext
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.exc import OperationalError, TimeoutError
+
+from app.services import scheduler
+from app.services.politeness import slot_key
+from app.services.scheduler import Dispatcher, DueRun
+from app.utils.urls import registrable_domain
+
+
+@pytest.mark.unit
+def test_registrable_domain_groups_subdomains() -> None:
+    """Test that sites on one registered domain share a politeness budget."""
+    assert registrable_domain("https://news.example.com/feed") == "example.com"
+    assert registrable_domain("https://WWW.Example.com:8443/") == "example.com"
+    assert registrable_domain("https://www.bbc.co.uk/news") == "bbc.co.uk"
+    assert registrable_domain("https://alberta.ab.ca/") == "alberta.ab.ca"
+    assert registrable_domain("https://10.0.0.5/news") == "10.0.0.5"
+    assert registrable_domain("localhost:8000") == "localhost"
+
+
+@pytest.mark.unit
+def test_slot_keys_are_stable_and_distinct() -> None:
+    """Test that slot keys fit a signed bigint and differ per host and slot."""
+    keys = {slot_key(host, slot) for host in ("a.com", "b.com") for slot in range(4)}
+    assert len(keys) == 8
+    assert all(-(2**63) <= key < 2**63 for key in keys)
+    assert slot_key("a.com", 0) == slot_key("a.com", 0)
+
+
+class _FakeSession:
+    def __init__(self, sites):
+        self.sites = sites
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def get(self, model, site_id):
+        return self.sites.get(site_id)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+
+class _FakeEngine:
+    def connect(self):
+        return nullcontext(object())
+
+
+class _BusyHostLimiter:
+    """Grants ``free`` slots for ``busy.com``; every other host is idle."""
+
+    def __init__(self, free: int):
+        self.free = free
+
+    @contextmanager
+    def slot(self, conn, url, wait=0.0):
+        if "busy.com" not in url:
+            yield True
+        elif self.free > 0:
+            self.free -= 1
+            yield True
+        else:
+            yield False
+
+
+@pytest.mark.unit
+def test_dispatcher_defers_busy_host_without_blocking_others(monkeypatch) -> None:
+    """Test that runs against a busy host are deferred while other hosts run."""
+    tenant = uuid4()
+    sites = {uuid4(): SimpleNamespace(url="https://busy.com/a", enabled=True) for _ in range(3)}
+    sites.update({uuid4(): SimpleNamespace(url=f"https://site{i}.org/", enabled=True) for i in range(3)})
+    monkeypatch.setattr(
+        scheduler, "due_runs", lambda db, now: [DueRun(site_id, tenant, "pro") for site_id in sites]
+    )
+    executed = []
+
+    dispatcher = Dispatcher(
+        max_concurrency=2,
+        session_factory=lambda bind=None: _FakeSession(sites),
+        execute=lambda db, site: executed.append(site.url),
+        limiter=_BusyHostLimiter(free=1),
+        max_deferrals=3,
+        bind=_FakeEngine(),
+    )
+    report = dispatcher.run_once()
+
+    assert report.dispatched == 6
+    assert (report.succeeded, report.failed, report.deferred) == (4, 0, 2)
+    assert executed.count("https://busy.com/a") == 1
+    assert sum(url.endswith(".org/") for url in executed) == 3
+
+
+class _FailingLimiter:
+    """Pool timeout for ``busy.com``, a database error for ``down.com``."""
+
+    @contextmanager
+    def slot(self, conn, url, wait=0.0):
+        if "busy.com" in url:
+            raise TimeoutError("QueuePool limit reached")
+        if "down.com" in url:
+            raise OperationalError("SELECT pg_try_advisory_lock", {}, Exception("gone"))
+        yield True
+
+
+@pytest.mark.unit
+def test_dispatcher_reports_limiter_errors_per_run(monkeypatch) -> None:
+    """Test that a limiter error fails or defers its run instead of aborting the pass."""
+    tenant = uuid4()
+    sites = {
+        uuid4(): SimpleNamespace(url=url, enabled=True)
+        for url in ("https://busy.com/", "https://down.com/", "https://ok.org/")
+    }
+    monkeypatch.setattr(
+        scheduler, "due_runs", lambda db, now: [DueRun(site_id, tenant, "pro") for site_id in sites]
+    )
+    executed = []
+
+    report = Dispatcher(
+        session_factory=lambda bind=None: _FakeSession(sites),
+        execute=lambda db, site: executed.append(site.url),
+        limiter=_FailingLimiter(),
+        max_deferrals=2,
+        bind=_FakeEngine(),
+    ).run_once()
+
+    assert executed == ["https://ok.org/"]
+    assert (report.succeeded, report.failed, report.deferred) == (1, 1, 1)
@@ -0,0 +1,100 @@
+"""Tests for run retention."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.models import Run, RunDailySummary, RunStatus, Site
+from app.services.retention import (
+    PLAN_POLICIES,
+    RetentionEngine,
+    RetentionPolicy,
+    policy_for_plan,
+)
+
+
+@pytest.mark.unit
+def test_policy_for_plan() -> None:
+    """Test plan policy lookup."""
+    assert policy_for_plan("pro") == PLAN_POLICIES["pro"]
+    assert policy_for_plan(None) == PLAN_POLICIES["free"]
+    assert policy_for_plan("legacy-plan") == PLAN_POLICIES["free"]
+
+
+@pytest.mark.integration
+def test_retention_prunes_and_summarizes(db: Session, test_tenant) -> None:
+    """Test that runs beyond the policy are summarized, then deleted."""
+    now = datetime.utcnow()
+    site = Site(tenant_id=test_tenant.id, url="https://example.com", created_at=now)
+    db.add(site)
+    db.flush()
+    db.add_all(
+        [
+            Run(
+                site_id=site.id,
+                status=RunStatus.SUCCESS if i % 2 else RunStatus.ERROR,
+                pages_scanned=1,
+                duration_ms=100,
+                diagnostics_json={"log": "x" * 100},
+                started_at=now - timedelta(days=i + 1),
+            )
+            for i in range(5)
+        ]
+    )
+    db.commit()
+
+    policies = {"free": RetentionPolicy(keep_runs=2, diagnostics_days=1)}
+    engine = db.get_bind()
+
+    dry_run = RetentionEngine(engine, pause_seconds=0, dry_run=True, policies=policies).run(now=now)
+    assert dry_run.runs_pruned == 3
+    assert dry_run.bytes_reclaimed > 0
+    assert db.query(Run).count() == 5
+
+    report = RetentionEngine(engine, batch_size=2, pause_seconds=0, policies=policies).run(now=now)
+    db.expire_all()
+
+    assert report.runs_pruned == 3
+    assert report.diagnostics_cleared == 1
+    assert db.query(Run).count() == 2
+    summaries = db.query(RunDailySummary).filter(RunDailySummary.site_id == site.id).all()
+    assert sum(s.runs_total for s in summaries) == 3
+    assert sum(s.runs_error for s in summaries) == 2
+
+
+@pytest.mark.integration
+def test_retention_dry_run_matches_real_run(db: Session, test_tenant) -> None:
+    """Test that a dry run reports what the real run then does (pruned runs counted once)."""
+    now = datetime.utcnow()
+    site = Site(tenant_id=test_tenant.id, url="https://example.com", created_at=now)
+    db.add(site)
+    db.flush()
+    db.add_all(
+        [
+            Run(
+                site_id=site.id,
+                status=RunStatus.SUCCESS,
+                pages_scanned=1,
+                duration_ms=100,
+                diagnostics_json={"log": "x" * 100},
+                started_at=now - timedelta(days=i + 1),
+            )
+            for i in range(6)
+        ]
+    )
+    db.commit()
+
+    # Runs 3-6 days old are pruned; 2 days old only loses its diagnostics
+    policies = {"free": RetentionPolicy(keep_runs=2, diagnostics_days=1)}
+    engine = db.get_bind()
+
+    dry_run = RetentionEngine(engine, pause_seconds=0, dry_run=True, policies=policies).run(now=now)
+    report = RetentionEngine(engine, pause_seconds=0, policies=policies).run(now=now)
+
+    assert (dry_run.runs_pruned, dry_run.diagnostics_cleared) == (4, 1)
+    assert (dry_run.runs_pruned, dry_run.diagnostics_cleared, dry_run.bytes_reclaimed) == (
+        report.runs_pruned,
+        report.diagnostics_cleared,
+        report.bytes_reclaimed,
+    )
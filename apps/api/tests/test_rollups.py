@@ -0,0 +1,86 @@
+"""Tests for daily rollups and time-series endpoints."""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+import respx
+from fastapi.testclient import TestClient
+from httpx import Response
+from sqlalchemy.orm import Session
+
+from app.models import Site, SiteDailyStats, User
+from app.services.rollups import DailyPoint, backfill
+
+
+@pytest.mark.unit
+def test_daily_point_rates() -> None:
+    """Test derived metrics on a daily point."""
+    point = DailyPoint(date(2025, 10, 1), runs_total=4, runs_success=3, duration_ms_total=1000)
+
+    assert point.success_rate == 0.75
+    assert point.avg_duration_ms == 250
+    assert DailyPoint(date(2025, 10, 2)).success_rate is None
+
+
+@pytest.mark.integration
+@respx.mock
+def test_run_updates_rollup_and_backfill_matches(
+    client: TestClient,
+    db: Session,
+    admin_user: User,
+    test_tenant,
+    admin_auth_headers: dict[str, str],
+) -> None:
+    """Test that runs update the rollup incrementally, consistent with backfill."""
+    site = Site(
+        tenant_id=test_tenant.id,
+        url="https://example.com",
+        created_at=datetime.utcnow(),
+    )
+    db.add(site)
+    db.commit()
+    db.refresh(site)
+
+    respx.post("https://your-worker.workers.dev/discover").mock(
+        return_value=Response(
+            200,
+            json={
+                "source": "html",
+                "links": ["https://example.com/post1", "https://example.com/post2"],
+                "count": 2,
+            },
+        )
+    )
+    response = client.post(f"/v1/sites/{site.id}/run", headers=admin_auth_headers)
+    assert response.status_code == 200
+
+    response = client.get(
+        f"/v1/sites/{site.id}/stats/daily",
+        params={"days": 7},
+        headers=admin_auth_headers,
+    )
+
+    assert response.status_code == 200
+    points = response.json()["points"]
+    assert len(points) == 7
+    assert points[-1]["runs_total"] == 1
+    assert points[-1]["items_new"] == 2
+    assert points[-1]["success_rate"] == 1.0
+
+    today = datetime.utcnow().date()
+    incremental = db.query(SiteDailyStats).filter(SiteDailyStats.site_id == site.id).one()
+    incremental = (incremental.runs_total, incremental.items_new, incremental.pages_scanned)
+
+    with db.get_bind().begin() as conn:
+        backfill(conn, today, today + timedelta(days=1), site_id=site.id)
+    db.expire_all()
+
+    rebuilt = db.query(SiteDailyStats).filter(SiteDailyStats.site_id == site.id).one()
+    assert (rebuilt.runs_total, rebuilt.items_new, rebuilt.pages_scanned) == incremental
+
+    response = client.get(
+        "/v1/dashboard/timeseries",
+        params={"tenant_id": str(test_tenant.id), "days": 400},
+        headers=admin_auth_headers,
+    )
+    assert response.status_code == 400
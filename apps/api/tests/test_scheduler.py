@@ -0,0 +1,107 @@
+"""Tests for fair run dispatch."""
+
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.services import scheduler
+from app.services.runs import RunInProgress
+from app.services.scheduler import DeficitRoundRobin, Dispatcher, DueRun, weight_for_plan
+
+
+@pytest.mark.unit
+def test_deficit_round_robin_interleaves_by_weight() -> None:
+    """Test that heavier keys get proportionally more turns, FIFO within a key."""
+    queues: DeficitRoundRobin[str] = DeficitRoundRobin()
+    for i in range(6):
+        queues.push("big", f"big{i}", weight=2)
+    for i in range(2):
+        queues.push("small", f"small{i}", weight=1)
+
+    assert queues.drain() == ["big0", "big1", "small0", "big2", "big3", "small1", "big4", "big5"]
+    with pytest.raises(IndexError):
+        queues.pop()
+    with pytest.raises(ValueError):
+        queues.push("x", "x", weight=0)
+
+
+@pytest.mark.unit
+def test_dispatch_order_bounds_small_tenant_wait() -> None:
+    """Test that a small tenant is not queued behind a large tenant's backlog."""
+    large, small = uuid4(), uuid4()
+    due = [DueRun(uuid4(), large, "enterprise") for _ in range(500)]
+    due += [DueRun(uuid4(), small, "free") for _ in range(3)]
+
+    order = Dispatcher().order(due)
+
+    positions = [i for i, run in enumerate(order) if run.tenant_id == small]
+    assert positions == [8, 17, 26]
+    assert weight_for_plan(None) == weight_for_plan("unknown") == 1
+
+
+@pytest.mark.unit
+def test_dispatcher_skips_sites_with_run_in_progress(monkeypatch) -> None:
+    """Test that a site leased by another run is skipped, not counted as failed."""
+    leased, free = uuid4(), uuid4()
+    tenant = uuid4()
+    monkeypatch.setattr(
+        scheduler, "due_runs", lambda db, now: [DueRun(leased, tenant, "free"), DueRun(free, tenant, "free")]
+    )
+
+    class Session:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def get(self, model, site_id):
+            return SimpleNamespace(id=site_id, url="https://example.com", enabled=True)
+
+    def execute(db, site):
+        if site.id == leased:
+            raise RunInProgress(uuid4())
+
+    report = Dispatcher(session_factory=Session, execute=execute).run_once()
+
+    assert (report.succeeded, report.failed, report.skipped) == (1, 0, 1)
+
+
+@pytest.mark.unit
+def test_dispatcher_refills_queues_mid_pass(monkeypatch) -> None:
+    """Test that a site due mid-pass starts within a round, not after the backlog."""
+    large, small = uuid4(), uuid4()
+    backlog = [DueRun(uuid4(), large, "free") for _ in range(20)]
+    late = DueRun(uuid4(), small, "free")
+    calls = []
+
+    def due_runs(db, now):
+        calls.append(now)
+        # Every site stays due; only the late one is new after the first read
+        return backlog if len(calls) == 1 else backlog + [late]
+
+    monkeypatch.setattr(scheduler, "due_runs", due_runs)
+
+    class Session:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def get(self, model, site_id):
+            return SimpleNamespace(id=site_id, url="https://example.com", enabled=True)
+
+    started = []
+    report = Dispatcher(
+        max_concurrency=1,
+        session_factory=Session,
+        execute=lambda db, site: started.append(site.id),
+        refill_seconds=0,
+    ).run_once()
+
+    assert started.index(late.site_id) == 2
+    assert len(started) == len(set(started)) == 21
+    assert (report.dispatched, report.succeeded) == (21, 21)
+    assert report.per_tenant[small] == 1
@@ -0,0 +1,79 @@
+"""Tests for item search."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models import Item, Site, User
+
+
+@pytest.mark.integration
+def test_search_items(
+    client: TestClient,
+    db: Session,
+    admin_user: User,
+    test_tenant,
+    admin_auth_headers: dict[str, str],
+) -> None:
+    """Test ranked search with snippets and keyset pagination."""
+    site = Site(tenant_id=test_tenant.id, url="https://example.com", created_at=datetime.utcnow())
+    db.add(site)
+    db.flush()
+    now = datetime.utcnow()
+    for i, (url, title) in enumerate(
+        [
+            ("https://example.com/news/house-fire-downtown", "Crews battle downtown house fire"),
+            ("https://example.com/news/fire-hall-open-house", None),
+            ("https://example.com/news/city-council-budget", "Council passes budget"),
+        ]
+    ):
+        db.add(
+            Item(
+                site_id=site.id,
+                url=url,
+                canonical_url=url,
+                title=title,
+                discovered_at=now - timedelta(minutes=i),
+            )
+        )
+    db.commit()
+
+    response = client.get(
+        "/v1/search",
+        params={"q": "fires", "tenant_id": str(test_tenant.id), "limit": 1},
+        headers=admin_auth_headers,
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["results"]) == 1
+    first = data["results"][0]
+    assert first["title"] == "Crews battle downtown house fire"
+    assert "<mark>fire</mark>" in first["snippet"]
+    assert data["next_cursor"]
+
+    response = client.get(
+        "/v1/search",
+        params={"q": "fires", "site_id": str(site.id), "cursor": data["next_cursor"]},
+        headers=admin_auth_headers,
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [r["url"] for r in data["results"]] == ["https://example.com/news/fire-hall-open-house"]
+    assert data["next_cursor"] is None
+
+
+@pytest.mark.integration
+def test_search_requires_scope(
+    client: TestClient,
+    db: Session,
+    admin_user: User,
+    admin_auth_headers: dict[str, str],
+) -> None:
+    """Test that search must be scoped to a tenant or site."""
+    response = client.get("/v1/search", params={"q": "fire"}, headers=admin_auth_headers)
+
+    assert response.status_code == 400
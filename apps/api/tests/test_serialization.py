@@ -0,0 +1,92 @@
+"""Tests for the fast JSON serialization path."""
+
+import json
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from app.models import RunStatus
+from app.schemas import ItemListResponse, ItemResponse, RunListResponse, RunResponse
+from app.utils.serialization import (
+    ITEM_COLUMNS,
+    RUN_COLUMNS,
+    FastJSONResponse,
+    iter_ndjson,
+    rows_to_dicts,
+    select_columns,
+)
+
+
+def _item_row() -> tuple:
+    now = datetime(2025, 10, 5, 12, 30, 15, 123456)
+    return (
+        uuid4(),
+        uuid4(),
+        "https://example.com/post1",
+        "https://example.com/post1",
+        "Post 1",
+        None,
+        now,
+        "feed",
+        {"author": "someone", "tags": ["a", "b"]},
+        ["fire"],
+        uuid4(),
+    )
+
+
+def _run_row() -> tuple:
+    now = datetime(2025, 10, 5, 12, 30, 15)
+    return (uuid4(), uuid4(), RunStatus.ERROR, "discover", 0, 120, {"error": "boom"}, now, None)
+
+
+@pytest.mark.unit
+def test_item_list_matches_response_model() -> None:
+    """Fast path produces the same JSON as ItemListResponse."""
+    rows = [_item_row(), _item_row()]
+    fields = list(ITEM_COLUMNS)
+
+    fast = FastJSONResponse({"items": rows_to_dicts(rows, fields), "next_cursor": None})
+    model = ItemListResponse(
+        items=[ItemResponse(**dict(zip(fields, row, strict=True))) for row in rows],
+        next_cursor=None,
+    )
+
+    assert json.loads(fast.body) == json.loads(model.model_dump_json())
+    assert fast.media_type == "application/json"
+
+
+@pytest.mark.unit
+def test_run_list_matches_response_model() -> None:
+    """Fast path encodes RunStatus as its value, like RunResponse."""
+    rows = [_run_row()]
+    fields = list(RUN_COLUMNS)
+
+    fast = FastJSONResponse({"runs": rows_to_dicts(rows, fields), "total": 1})
+    model = RunListResponse(
+        runs=[RunResponse(**{**dict(zip(fields, row, strict=True)), "status": row[2].value}) for row in rows],
+        total=1,
+    )
+
+    assert json.loads(fast.body) == json.loads(model.model_dump_json())
+
+
+@pytest.mark.unit
+def test_iter_ndjson() -> None:
+    """NDJSON export emits one JSON object per line."""
+    rows = [_item_row(), _item_row()]
+
+    lines = b"".join(iter_ndjson(rows, list(ITEM_COLUMNS))).splitlines()
+
+    assert len(lines) == 2
+    assert json.loads(lines[0])["url"] == "https://example.com/post1"
+
+
+@pytest.mark.unit
+def test_select_columns() -> None:
+    """Test fields= projection of list columns."""
+    assert select_columns(RUN_COLUMNS, None) is RUN_COLUMNS
+    assert list(select_columns(RUN_COLUMNS, "started_at, status")) == ["id", "status", "started_at"]
+
+    with pytest.raises(ValueError, match="Unknown field"):
+        select_columns(ITEM_COLUMNS, "url,password")
@@ -0,0 +1,200 @@
+"""Tests for bulk site import."""
+
+import io
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models import Site, Tenant, User
+from app.services.site_import import (
+    _COPY_STAGING,
+    ImportFileError,
+    ImportReport,
+    _copy_staging,
+    read_csv,
+    read_ndjson,
+    stage_rows,
+)
+
+CSV = """url,profile_key,interval_minutes,keywords,adaptive
+https://Example.com:443/news,,30,fire; flood,true
+https://example.com/news#latest,,,,
+ftp://example.com/files,,,,
+https://other.example.org,,not-a-number,,
+https://known.example.net/,,,,
+,,,,
+https://third.example.org/blog?page=1,rcmp_fsj,120,,false
+"""
+
+
+def _stage(rows, existing=None):
+    report = ImportReport()
+    buffer = stage_rows(rows, set(existing or ()), report)
+    return report, [line.split(",") for line in buffer.read().splitlines()]
+
+
+@pytest.mark.unit
+def test_stage_csv_validates_normalizes_and_dedupes() -> None:
+    """Test that CSV rows are validated, normalized and deduped against the file and tenant."""
+    report, staged = _stage(read_csv(io.StringIO(CSV)), {"https://known.example.net/"})
+
+    assert [row[1:3] for row in staged] == [
+        ["2", "https://example.com/news"],
+        ["8", "https://third.example.org/blog?page=1"],
+    ]
+    assert staged[0][4:] == ["30", "fire\x1fflood", "true"]
+    assert staged[1][3] == "rcmp_fsj"
+
+    assert (report.rows, report.duplicates, report.invalid) == (6, 2, 2)
+    assert [error["line"] for error in report.errors] == [3, 4, 5, 6]
+    assert report.errors[0]["error"] == "duplicate of line 2"
+    assert report.errors[1]["error"] == "url: must be an http(s) URL"
+    assert report.errors[2]["error"].startswith("interval_minutes:")
+    assert report.errors[3]["error"] == "site already exists"
+
+
+@pytest.mark.unit
+def test_stage_ndjson_reports_bad_lines() -> None:
+    """Test that unparseable and non-object NDJSON lines are reported by line."""
+    body = '{"url": "https://a.example.com"}\n\nnot json\n[1, 2]\n{"url": "https://b.example.com", "keywords": ["x"]}\n'
+    report, staged = _stage(read_ndjson(io.StringIO(body)))
+
+    assert [row[1:3] for row in staged] == [
+        ["1", "https://a.example.com/"],
+        ["5", "https://b.example.com/"],
+    ]
+    assert [(error["line"], error["error"]) for error in report.errors] == [
+        (3, "not valid JSON"),
+        (4, "row must be an object"),
+    ]
+
+
+@pytest.mark.unit
+def test_csv_without_url_column_is_rejected() -> None:
+    """Test that a CSV without a url header fails as a whole."""
+    with pytest.raises(ImportFileError):
+        _stage(read_csv(io.StringIO("address\nhttps://example.com\n")))
+
+
+@pytest.mark.unit
+def test_reported_errors_are_capped(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the error list is truncated but every rejected row is counted."""
+    monkeypatch.setattr("app.services.site_import.MAX_REPORTED_ERRORS", 2)
+    report, _ = _stage(read_ndjson(io.StringIO("{}\n" * 5)))
+
+    assert report.invalid == 5
+    assert len(report.errors) == 2
+    assert report.errors_truncated
+
+
+@pytest.mark.integration
+def test_import_sites(
+    client: TestClient,
+    db: Session,
+    admin_user: User,
+    test_tenant: Tenant,
+    admin_auth_headers: dict[str, str],
+) -> None:
+    """Test importing sites from CSV skips existing sites and reports rows."""
+    db.add(Site(tenant_id=test_tenant.id, url="https://known.example.net"))
+    db.commit()
+
+    response = client.post(
+        "/v1/sites/import",
+        content=CSV.encode(),
+        headers={**admin_auth_headers, "Content-Type": "text/csv"},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert (data["rows"], data["imported"], data["duplicates"], data["invalid"]) == (6, 2, 2, 2)
+    urls = {site.url for site in db.query(Site).filter(Site.tenant_id == test_tenant.id)}
+    assert urls == {
+        "https://known.example.net",
+        "https://example.com/news",
+        "https://third.example.org/blog?page=1",
+    }
+
+
+@pytest.mark.integration
+def test_import_drops_sites_added_while_parsing(db: Session, test_tenant: Tenant) -> None:
+    """Test that a site created by another import during parsing is reported, not duplicated."""
+    from app.services.site_import import import_sites
+
+    def rows():
+        yield "url\n"
+        # Another import commits this site after the existing URLs were read
+        with Session(bind=db.get_bind()) as other:
+            other.add(Site(tenant_id=test_tenant.id, url="https://racing.example.com/"))
+            other.commit()
+        yield "https://RACING.example.com\n"
+        yield "https://fresh.example.com\n"
+
+    # Lines are read lazily, after import_sites has read the tenant's sites
+    report = import_sites(db, test_tenant.id, rows(), "csv")
+    db.commit()
+
+    assert (report.imported, report.duplicates) == (1, 1)
+    assert report.errors == [
+        {"line": 2, "url": "https://racing.example.com/", "error": "site already exists"}
+    ]
+    assert db.query(Site).filter(Site.tenant_id == test_tenant.id).count() == 2
+
+
+@pytest.mark.security
+def test_import_sites_as_member_forbidden(
+    client: TestClient, member_user: User, member_auth_headers: dict[str, str]
+) -> None:
+    """Test that members cannot import sites."""
+    response = client.post(
+        "/v1/sites/import?format=ndjson",
+        content=b'{"url": "https://example.com"}\n',
+        headers=member_auth_headers,
+    )
+
+    assert response.status_code == 403
+
+
+class _Psycopg3Cursor:
+    def __init__(self):
+        self.copied = []
+        self.closed = False
+
+    @contextmanager
+    def copy(self, statement):
+        chunks = []
+        yield SimpleNamespace(write=chunks.append)
+        self.copied.append((statement, "".join(chunks)))
+
+    def close(self):
+        self.closed = True
+
+
+class _Psycopg2Cursor:
+    def __init__(self):
+        self.copied = []
+        self.closed = False
+
+    def copy_expert(self, statement, file):
+        self.copied.append((statement, file.read()))
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("cursor_class", [_Psycopg3Cursor, _Psycopg2Cursor])
+def test_copy_staging_supports_both_drivers(cursor_class) -> None:
+    """Test that staged rows are copied with psycopg 3's copy() or psycopg2's copy_expert()."""
+    cursor = cursor_class()
+    db = SimpleNamespace(
+        connection=lambda: SimpleNamespace(connection=SimpleNamespace(cursor=lambda: cursor))
+    )
+
+    _copy_staging(db, io.StringIO("a,1\nb,2\n"))
+
+    assert cursor.copied == [(_COPY_STAGING, "a,1\nb,2\n")]
+    assert cursor.closed
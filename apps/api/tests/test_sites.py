@@ -1,6 +1,6 @@
 """Tests for sites endpoints."""
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from unittest.mock import Mock, patch
 
 import pytest
@@ -234,3 +234,318 @@ def test_access_other_tenant_site_forbidden(
     assert response.status_code == 403
     assert "Access to this tenant not allowed" in response.json()["detail"]
 
+
+
+@pytest.mark.integration
+def test_list_and_export_items(
+    client: TestClient,
+    db: Session,
+    admin_user: User,
+    test_tenant,
+    admin_auth_headers: dict[str, str],
+) -> None:
+    """Test listing and exporting items."""
+    from app.models import Item
+
+    site = Site(
+        tenant_id=test_tenant.id,
+        url="https://example.com",
+        created_at=datetime.utcnow(),
+    )
+    db.add(site)
+    db.flush()
+    db.add_all(
+        [
+            Item(
+                site_id=site.id,
+                url=f"https://example.com/post{i}",
+                canonical_url=f"https://example.com/post{i}",
+                discovered_at=datetime.utcnow(),
+                source="html",
+            )
+            for i in range(3)
+        ]
+    )
+    db.commit()
+
+    response = client.get(f"/v1/sites/{site.id}/items", headers=admin_auth_headers)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["items"]) == 3
+    assert data["items"][0]["site_id"] == str(site.id)
+    assert data["next_cursor"] is None
+
+    response = client.get(f"/v1/sites/{site.id}/items/export", headers=admin_auth_headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert len(response.text.splitlines()) == 3
+
+
+@pytest.mark.integration
+@respx.mock
+def test_trigger_run_skips_known_items(
+    client: TestClient,
+    db: Session,
+    admin_user: User,
+    test_tenant,
+    admin_auth_headers: dict[str, str],
+) -> None:
+    """Test that repeated runs don't duplicate items."""
+    from app.models import Item, ItemKey
+
+    site = Site(
+        tenant_id=test_tenant.id,
+        url="https://example.com",
+        created_at=datetime.utcnow(),
+    )
+    db.add(site)
+    db.commit()
+    db.refresh(site)
+
+    respx.post("https://your-worker.workers.dev/discover").mock(
+        return_value=Response(
+            200,
+            json={
+                "source": "html",
+                "links": [
+                    "https://example.com/post1",
+                    "https://example.com/post2",
+                    "https://example.com/post1",
+                ],
+                "count": 3,
+            },
+        )
+    )
+
+    for _ in range(2):
+        response = client.post(f"/v1/sites/{site.id}/run", headers=admin_auth_headers)
+        assert response.status_code == 200
+
+    assert db.query(Item).filter(Item.site_id == site.id).count() == 2
+    assert db.query(ItemKey).filter(ItemKey.site_id == site.id).count() == 2
+
+
+@pytest.mark.integration
+def test_list_runs_fields_projection(
+    client: TestClient,
+    db: Session,
+    admin_user: User,
+    test_tenant,
+    admin_auth_headers: dict[str, str],
+) -> None:
+    """Test selecting run columns with fields=."""
+    from app.models import Run, RunStatus
+
+    site = Site(
+        tenant_id=test_tenant.id,
+        url="https://example.com",
+        created_at=datetime.utcnow(),
+    )
+    db.add(site)
+    db.flush()
+    db.add(
+        Run(
+            site_id=site.id,
+            status=RunStatus.SUCCESS,
+            diagnostics_json={"log": "x" * 1000},
+            started_at=datetime.utcnow(),
+        )
+    )
+    db.commit()
+
+    response = client.get(
+        f"/v1/sites/{site.id}/runs",
+        params={"fields": "status,started_at"},
+        headers=admin_auth_headers,
+    )
+
+    assert response.status_code == 200
+    run = response.json()["runs"][0]
+    assert set(run) == {"id", "status", "started_at"}
+
+    response = client.get(
+        f"/v1/sites/{site.id}/runs",
+        params={"fields": "status,secret"},
+        headers=admin_auth_headers,
+    )
+
+    assert response.status_code == 400
+    assert "secret" in response.json()["detail"]
+
+
+@pytest.mark.integration
+@respx.mock
+def test_trigger_run_matches_keywords(
+    client: TestClient,
+    db: Session,
+    admin_user: User,
+    test_tenant,
+    admin_auth_headers: dict[str, str],
+) -> None:
+    """Test that ingested items are matched against site keywords."""
+    site = Site(
+        tenant_id=test_tenant.id,
+        url="https://example.com",
+        keywords=["fire", "city council"],
+        created_at=datetime.utcnow(),
+    )
+    db.add(site)
+    db.commit()
+    db.refresh(site)
+
+    respx.post("https://your-worker.workers.dev/discover").mock(
+        return_value=Response(
+            200,
+            json={
+                "source": "html",
+                "links": [
+                    "https://example.com/news/house-fire-downtown",
+                    "https://example.com/news/city-council-meeting",
+                    "https://example.com/news/firefly-festival",
+                ],
+                "count": 3,
+            },
+        )
+    )
+
+    response = client.post(f"/v1/sites/{site.id}/run", headers=admin_auth_headers)
+    assert response.status_code == 200
+
+    response = client.get(
+        f"/v1/sites/{site.id}/items",
+        params={"keyword": "fire"},
+        headers=admin_auth_headers,
+    )
+
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert [item["url"] for item in items] == ["https://example.com/news/house-fire-downtown"]
+    assert items[0]["matched_keywords"] == ["fire"]
+
+
+@pytest.mark.integration
+@respx.mock
+def test_trigger_run_flags_near_duplicates(
+    client: TestClient,
+    db: Session,
+    admin_user: User,
+    test_tenant,
+    admin_auth_headers: dict[str, str],
+) -> None:
+    """Test that near-duplicate items point at the first item and can be collapsed."""
+    site = Site(
+        tenant_id=test_tenant.id,
+        url="https://example.com",
+        created_at=datetime.utcnow(),
+    )
+    db.add(site)
+    db.commit()
+    db.refresh(site)
+
+    respx.post("https://your-worker.workers.dev/discover").mock(
+        return_value=Response(
+            200,
+            json={
+                "source": "html",
+                "links": [
+                    "https://example.com/news/council-approves-new-downtown-library-budget",
+                    "https://example.com/story/12345/council-approves-new-downtown-library-budget",
+                    "https://example.com/news/house-fire-on-main-street",
+                ],
+                "count": 3,
+            },
+        )
+    )
+
+    response = client.post(f"/v1/sites/{site.id}/run", headers=admin_auth_headers)
+    assert response.status_code == 200
+
+    items = client.get(f"/v1/sites/{site.id}/items", headers=admin_auth_headers).json()["items"]
+    by_url = {item["url"]: item for item in items}
+    original = by_url["https://example.com/news/council-approves-new-downtown-library-budget"]
+    duplicate = by_url["https://example.com/story/12345/council-approves-new-downtown-library-budget"]
+    assert original["duplicate_of"] is None
+    assert duplicate["duplicate_of"] == original["id"]
+    assert by_url["https://example.com/news/house-fire-on-main-street"]["duplicate_of"] is None
+
+    response = client.get(
+        f"/v1/sites/{site.id}/items",
+        params={"collapse": "true"},
+        headers=admin_auth_headers,
+    )
+    assert len(response.json()["items"]) == 2
+
+
+@pytest.mark.integration
+@respx.mock
+def test_trigger_run_returns_run_in_progress(
+    client: TestClient,
+    db: Session,
+    admin_user: User,
+    test_tenant,
+    admin_auth_headers: dict[str, str],
+) -> None:
+    """Test that an overlapping trigger returns the leased run, and an expired lease is taken over."""
+    from uuid import uuid4
+
+    from app.models import Run
+
+    in_progress = uuid4()
+    site = Site(
+        tenant_id=test_tenant.id,
+        url="https://example.com",
+        lease_run_id=in_progress,
+        lease_expires_at=datetime.utcnow() + timedelta(minutes=5),
+        created_at=datetime.utcnow(),
+    )
+    db.add(site)
+    db.commit()
+    db.refresh(site)
+
+    route = respx.post("https://your-worker.workers.dev/discover").mock(
+        return_value=Response(200, json={"source": "html", "links": [], "count": 0})
+    )
+
+    response = client.post(f"/v1/sites/{site.id}/run", headers=admin_auth_headers)
+    assert response.status_code == 200
+    assert response.json() == {"run_id": str(in_progress), "status": "running"}
+    assert route.call_count == 0
+    assert db.query(Run).filter(Run.site_id == site.id).count() == 0
+
+    site.lease_expires_at = datetime.utcnow() - timedelta(seconds=1)
+    db.commit()
+
+    response = client.post(f"/v1/sites/{site.id}/run", headers=admin_auth_headers)
+    assert response.json()["status"] == "success"
+    assert route.call_count == 1
+    db.refresh(site)
+    assert site.lease_run_id is None and site.lease_expires_at is None
+
+
+@pytest.mark.integration
+def test_renew_lease_only_extends_the_holders_lease(db: Session, test_tenant) -> None:
+    """Test that a run renews its own lease and cannot renew another run's."""
+    from types import SimpleNamespace
+    from uuid import uuid4
+
+    from app.services.runs import renew_lease
+
+    holder = uuid4()
+    expires_at = datetime.utcnow() + timedelta(seconds=5)
+    site = Site(
+        tenant_id=test_tenant.id,
+        url="https://example.com",
+        lease_run_id=holder,
+        lease_expires_at=expires_at,
+        created_at=datetime.utcnow(),
+    )
+    db.add(site)
+    db.commit()
+
+    assert renew_lease(db.get_bind(), site, SimpleNamespace(id=holder))
+    assert not renew_lease(db.get_bind(), site, SimpleNamespace(id=uuid4()))
+    db.refresh(site)
+    assert site.lease_run_id == holder
+    assert site.lease_expires_at > expires_at + timedelta(seconds=60)
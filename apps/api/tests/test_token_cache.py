@@ -0,0 +1,72 @@
+"""Tests for the verified JWT cache."""
+
+import time
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from app.utils.token_cache import UserSnapshot, VerifiedTokenCache
+
+
+def _snapshot(user_id=None) -> UserSnapshot:
+    return UserSnapshot(user_id or uuid4(), "user@example.com", None, datetime(2025, 1, 1), 0)
+
+
+@pytest.mark.unit
+def test_hit_and_miss() -> None:
+    cache = VerifiedTokenCache(ttl=60)
+    snapshot = _snapshot()
+    cache.put("token-a", snapshot, time.time() + 3600)
+
+    assert cache.get("token-a") == snapshot
+    assert cache.get("token-b") is None
+
+
+@pytest.mark.unit
+def test_expiry_capped_at_token_exp() -> None:
+    cache = VerifiedTokenCache(ttl=60)
+    cache.put("expiring", _snapshot(), time.time() + 0.05)
+    cache.put("expired", _snapshot(), time.time() - 1)
+
+    assert cache.get("expiring") is not None
+    assert cache.get("expired") is None
+    time.sleep(0.1)
+    assert cache.get("expiring") is None
+    assert len(cache) == 0
+
+
+@pytest.mark.unit
+def test_disabled_with_zero_ttl() -> None:
+    cache = VerifiedTokenCache(ttl=0)
+    cache.put("token", _snapshot(), time.time() + 3600)
+    assert cache.get("token") is None
+
+
+@pytest.mark.unit
+def test_evicts_least_recently_used() -> None:
+    cache = VerifiedTokenCache(max_size=2, ttl=60)
+    exp = time.time() + 3600
+    cache.put("a", _snapshot(), exp)
+    cache.put("b", _snapshot(), exp)
+    cache.get("a")
+    cache.put("c", _snapshot(), exp)
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+
+
+@pytest.mark.unit
+def test_invalidate_user() -> None:
+    cache = VerifiedTokenCache(ttl=60)
+    user_id = uuid4()
+    exp = time.time() + 3600
+    cache.put("laptop", _snapshot(user_id), exp)
+    cache.put("phone", _snapshot(user_id), exp)
+    cache.put("other", _snapshot(), exp)
+
+    cache.invalidate_user(user_id)
+
+    assert cache.get("laptop") is None and cache.get("phone") is None
+    assert cache.get("other") is not None
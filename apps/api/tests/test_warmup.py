@@ -0,0 +1,46 @@
+"""Tests for cold-start pre-warming and timing."""
+
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.services import warmup
+from app.services.warmup import FirstResponseTimer, prewarm
+
+
+@pytest.mark.unit
+def test_prewarm_records_steps_and_survives_failures(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a failing step is recorded as None and the others still run."""
+
+    def down() -> None:
+        raise ConnectionError("db down")
+
+    monkeypatch.setattr(warmup, "PREWARM_STEPS", {"database": down, "worker_client": lambda: None})
+    timings: dict = {}
+
+    prewarm(timings)
+
+    assert timings["prewarm_database_ms"] is None
+    assert timings["prewarm_worker_client_ms"] >= 0
+
+
+@pytest.mark.unit
+def test_first_response_timer_records_once() -> None:
+    """Test that only the first completed response is timed."""
+    app = FastAPI()
+
+    @app.get("/")
+    def root() -> dict[str, str]:
+        return {"ok": "yes"}
+
+    timings: dict = {}
+    app.add_middleware(FirstResponseTimer, started=time.perf_counter(), timings=timings)
+    client = TestClient(app)
+
+    assert client.get("/").status_code == 200
+    first = timings["first_response_ms"]
+    assert first > 0
+    client.get("/")
+    assert timings["first_response_ms"] == first
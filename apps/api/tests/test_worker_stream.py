@@ -0,0 +1,86 @@
+"""Tests for streamed Worker responses."""
+
+import json
+
+import pytest
+
+from app.services.worker_client import WorkerClientError, WorkerStream
+from app.utils.json_stream import iter_members
+
+
+def _chunks(text: str, size: int) -> list[str]:
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("size", [1, 3, 16, 4096])
+def test_iter_members_streams_arrays_across_chunk_boundaries(size: int) -> None:
+    """Test that members and array elements parse the same however chunks split."""
+    body = json.dumps(
+        {"source": "sitemap", "links": ["https://a.com/1", "https://a.com/é"], "count": 12345, "x": []}
+    )
+
+    members = list(iter_members(_chunks(body, size), stream=("links", "x")))
+
+    assert members == [
+        ("source", "sitemap"),
+        ("links", "https://a.com/1"),
+        ("links", "https://a.com/é"),
+        ("count", 12345),
+    ]
+    with pytest.raises(ValueError):
+        list(iter_members(_chunks(body[:-1], size)))
+
+
+@pytest.mark.unit
+def test_worker_stream_reads_source_before_links() -> None:
+    """Test that links sent before the source are held until it arrives."""
+    body = json.dumps({"links": ["a", "b"], "count": 2, "source": "html", "diagnostics": {"ms": 5}})
+    stream = WorkerStream(_chunks(body, 5))
+
+    assert stream.read_source() == "html"
+    assert list(stream.links()) == ["a", "b"]
+    assert (stream.count, stream.diagnostics) == (2, {"ms": 5})
+
+    truncated = WorkerStream(_chunks('{"source": "html", "links": ["a", "b', 4))
+    with pytest.raises(WorkerClientError):
+        list(truncated.links())
+
+    no_source = WorkerStream(['{"links": [], "count": 0}'])
+    with pytest.raises(WorkerClientError):
+        no_source.read_source()
+
+
+@pytest.mark.unit
+def test_worker_stream_bounds_links_held_before_source(monkeypatch) -> None:
+    """Test that a response with too many links before its source fails instead of buffering."""
+    monkeypatch.setattr(WorkerStream, "MAX_HELD_LINKS", 3)
+    held = json.dumps({"links": ["a", "b", "c"], "source": "html"})
+    assert list(WorkerStream([held]).links()) == ["a", "b", "c"]
+
+    body = json.dumps({"links": ["a", "b", "c", "d"], "source": "html"})
+    with pytest.raises(WorkerClientError, match="before its source"):
+        WorkerStream(_chunks(body, 8)).read_source()
+
+
+@pytest.mark.unit
+def test_iter_members_decodes_large_values_in_linear_time(monkeypatch) -> None:
+    """Test that a value split over many chunks is not re-decoded on every chunk."""
+    from app.utils import json_stream
+
+    decoder = json_stream._decoder
+    calls = []
+
+    class CountingDecoder:
+        def raw_decode(self, s, idx=0):
+            calls.append(len(s) - idx)
+            return decoder.raw_decode(s, idx)
+
+    monkeypatch.setattr(json_stream, "_decoder", CountingDecoder())
+    body = json.dumps({"source": "x" * 100_000, "count": 1})
+
+    members = list(iter_members(_chunks(body, 10)))
+
+    assert members == [("source", "x" * 100_000), ("count", 1)]
+    # Characters scanned stay within a small multiple of the body, not O(n²)
+    assert sum(calls) < 5 * len(body)
@@ -0,0 +1,100 @@
+"""Benchmark: API cold start.
+
+Runs fresh interpreters and reports
+- import time per module for ``import app.main`` (``python -X importtime``),
+  the slowest ``--top`` by cumulative time;
+- time to first response: from the first import in a fresh interpreter
+  to the first ``GET /`` completing, median of ``--runs``, with the app's
+  own ``startup_timings`` (import, first response, pre-warm steps) from
+  the last run.
+
+No database needed (the database pre-warm step fails fast and is reported
+as null). Save with ``--output`` to track cold starts over time.
+
+    python bench_cold_start.py --runs 5 --top 15
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Optional
+
+API_DIR = Path(__file__).parent.parent.parent / "apps" / "api"
+
+FIRST_RESPONSE = """
+import json, time
+started = time.perf_counter()
+from fastapi.testclient import TestClient
+import app.main
+with TestClient(app.main.app) as client:
+    client.get("/")
+    elapsed = time.perf_counter() - started
+    time.sleep(0.5)  # let the background pre-warm finish
+print(json.dumps({"first_response_s": elapsed, "app": app.main.startup_timings}))
+"""
+
+
+def import_profile(top: int) -> list[dict[str, Any]]:
+    """Slowest modules by cumulative import time (ms)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        cwd=API_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = []
+    for line in result.stderr.splitlines():
+        fields = line.removeprefix("import time:").split("|")
+        if len(fields) != 3:
+            continue
+        self_us, cumulative_us, name = (field.strip() for field in fields)
+        if not self_us.isdigit():
+            continue
+        modules.append(
+            {
+                "module": name,
+                "self_ms": round(int(self_us) / 1000, 1),
+                "cumulative_ms": round(int(cumulative_us) / 1000, 1),
+            }
+        )
+    return sorted(modules, key=lambda module: module["cumulative_ms"], reverse=True)[:top]
+
+
+def first_response() -> dict[str, Any]:
+    result = subprocess.run(
+        [sys.executable, "-c", FIRST_RESPONSE],
+        cwd=API_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark API cold start.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args(argv)
+
+    runs = [first_response() for _ in range(args.runs)]
+    report = {
+        "first_response_ms_median": round(
+            statistics.median(run["first_response_s"] for run in runs) * 1000, 1
+        ),
+        "app_startup_timings": runs[-1]["app"],
+        "slowest_imports": import_profile(args.top),
+    }
+
+    print(json.dumps(report, indent=2))
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
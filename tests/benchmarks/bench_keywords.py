@@ -0,0 +1,83 @@
+"""Micro-benchmark: per-item cost of keyword matching.
+
+Compares one compiled Aho-Corasick automaton (``KeywordMatcher``) against a
+loop of per-keyword regex searches, for growing keyword lists. No database
+needed.
+
+    python bench_keywords.py --keywords 10,100,1000 --items 5000
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+# Add apps/api to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "apps" / "api"))
+
+from app.utils.keyword_matcher import KeywordMatcher  # noqa: E402
+
+WORDS = (
+    "city council fire police budget school flood road closure election mayor "
+    "hospital wildfire rcmp arrest festival weather storm highway bridge water"
+).split()
+
+
+def make_urls(count: int, rng: random.Random) -> list[str]:
+    return [
+        f"https://example.com/news/2025/10/{'-'.join(rng.choices(WORDS, k=rng.randint(4, 9)))}-{i}"
+        for i in range(count)
+    ]
+
+
+def make_keywords(count: int, rng: random.Random) -> list[str]:
+    keywords = list(WORDS)
+    while len(keywords) < count:
+        keywords.append(f"{rng.choice(WORDS)} {rng.choice(WORDS)}{len(keywords)}")
+    return keywords[:count]
+
+
+def regex_loop(keywords: list[str]) -> Callable[[str], list[str]]:
+    patterns = [(k, re.compile(rf"\b{re.escape(k)}\b", re.IGNORECASE)) for k in keywords]
+
+    def match(text: str) -> list[str]:
+        text = text.replace("-", " ")
+        return [keyword for keyword, pattern in patterns if pattern.search(text)]
+
+    return match
+
+
+def per_item_us(match: Callable[[str], list[str]], urls: list[str]) -> float:
+    start = time.perf_counter()
+    for url in urls:
+        match(url)
+    return (time.perf_counter() - start) / len(urls) * 1e6
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark keyword matching per item.")
+    parser.add_argument("--keywords", default="10,100,1000")
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    urls = make_urls(args.items, rng)
+
+    print(f"{'keywords':>9} {'compile ms':>11} {'automaton us':>13} {'regex loop us':>14}")
+    for count in (int(n) for n in args.keywords.split(",")):
+        keywords = make_keywords(count, rng)
+        start = time.perf_counter()
+        matcher = KeywordMatcher(keywords)
+        compile_ms = (time.perf_counter() - start) * 1000
+        print(
+            f"{count:>9} {compile_ms:>11.2f} {per_item_us(matcher.match, urls):>13.2f} "
+            f"{per_item_us(regex_loop(keywords), urls):>14.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
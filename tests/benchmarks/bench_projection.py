@@ -0,0 +1,101 @@
+"""Benchmark: bytes read from Postgres and sent to clients with ``fields=``.
+
+Runs the list endpoint queries against a database loaded by ``datagen.py``,
+once with every column and once with a typical dashboard projection, and
+reports the row bytes Postgres returns (``pg_column_size`` of each result
+row) and the JSON bytes the API would send.
+
+    python bench_projection.py --sites 20 --limit 50
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Any, Optional
+
+# Add apps/api to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "apps" / "api"))
+
+from sqlalchemy import desc, func, select  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.database import engine  # noqa: E402
+from app.models import Item, Run  # noqa: E402
+from app.utils.serialization import (  # noqa: E402
+    ITEM_COLUMNS,
+    RUN_COLUMNS,
+    dumps,
+    rows_to_dicts,
+    select_columns,
+)
+
+PROJECTIONS = {
+    "runs": (Run, RUN_COLUMNS, Run.started_at, "status,started_at,finished_at,duration_ms"),
+    "items": (Item, ITEM_COLUMNS, Item.discovered_at, "url,title,discovered_at"),
+}
+
+
+def measure(
+    db: Session,
+    model: Any,
+    columns: dict[str, Any],
+    order_by: Any,
+    site_ids: list[Any],
+    limit: int,
+) -> tuple[int, int]:
+    """Postgres row bytes and JSON bytes for one page per site."""
+    db_bytes = json_bytes = 0
+    for site_id in site_ids:
+        query = (
+            select(*columns.values())
+            .where(model.site_id == site_id)
+            .order_by(desc(order_by))
+            .limit(limit)
+        )
+        page = query.subquery()
+        db_bytes += db.execute(
+            select(func.coalesce(func.sum(func.pg_column_size(page.table_valued())), 0))
+        ).scalar_one()
+        rows = db.execute(query).all()
+        json_bytes += len(dumps(rows_to_dicts(rows, list(columns))))
+    return db_bytes, json_bytes
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Measure fields= projection savings.")
+    parser.add_argument("--sites", type=int, default=20, help="Busiest sites to sample")
+    parser.add_argument("--limit", type=int, default=50, help="Page size")
+    args = parser.parse_args(argv)
+
+    with Session(engine) as db:
+        for name, (model, columns, order_by, fields) in PROJECTIONS.items():
+            site_ids = (
+                db.execute(
+                    select(model.site_id)
+                    .group_by(model.site_id)
+                    .order_by(desc(func.count()))
+                    .limit(args.sites)
+                )
+                .scalars()
+                .all()
+            )
+            if not site_ids:
+                print(f"{name}: no rows, load a dataset with datagen.py first")
+                continue
+
+            full = measure(db, model, columns, order_by, site_ids, args.limit)
+            projected = measure(
+                db, model, select_columns(columns, fields), order_by, site_ids, args.limit
+            )
+
+            print(f"{name} ({len(site_ids)} sites x {args.limit} rows, fields={fields})")
+            for label, before, after in (
+                ("postgres", full[0], projected[0]),
+                ("json", full[1], projected[1]),
+            ):
+                saved = 100 * (1 - after / before) if before else 0.0
+                print(f"  {label:<9} {before:>12,} B -> {after:>12,} B  ({saved:.1f}% less)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Micro-benchmark: peak memory parsing a large Worker response.
+
+Compares the buffered path (``response.json()`` then ``WorkerResponse``)
+against ``WorkerStream``, which parses links as chunks arrive and hands
+them on ``BATCH_SIZE`` at a time the way ingestion consumes them. Peak
+memory is measured with tracemalloc over the parse only; the response text
+itself is excluded. No database or Worker needed.
+
+    python bench_worker_stream.py --links 200000
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from itertools import islice
+from pathlib import Path
+from typing import Optional
+
+# Add apps/api to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "apps" / "api"))
+
+from app.services.ingestion import BATCH_SIZE  # noqa: E402
+from app.services.worker_client import WorkerResponse, WorkerStream  # noqa: E402
+
+CHUNK_SIZE = 64 * 1024  # roughly what httpx yields per read
+
+
+def make_body(count: int) -> str:
+    return json.dumps(
+        {
+            "source": "sitemap",
+            "links": [f"https://example.com/news/2025/11/story-number-{i}" for i in range(count)],
+            "count": count,
+            "diagnostics": {"sitemaps": 12},
+        }
+    )
+
+
+def chunks(body: str) -> Iterator[str]:
+    return (body[i : i + CHUNK_SIZE] for i in range(0, len(body), CHUNK_SIZE))
+
+
+def buffered(body: str) -> int:
+    response = WorkerResponse(**json.loads("".join(chunks(body))))
+    links = response.links or []
+    return sum(len(links[i : i + BATCH_SIZE]) for i in range(0, len(links), BATCH_SIZE))
+
+
+def streamed(body: str) -> int:
+    stream = WorkerStream(chunks(body))
+    stream.read_source()
+    links = stream.links()
+    total = 0
+    while batch := list(islice(links, BATCH_SIZE)):
+        total += len(batch)
+    return total
+
+
+def measure(fn: Callable[[str], int], body: str) -> tuple[float, float]:
+    """Peak MiB and seconds for one parse."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn(body)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 2**20, elapsed
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark Worker response parsing memory.")
+    parser.add_argument("--links", type=int, default=200_000)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args(argv)
+
+    body = make_body(args.links)
+    assert buffered(body) == streamed(body) == args.links
+
+    before_mib, before_s = measure(buffered, body)
+    after_mib, after_s = measure(streamed, body)
+    report = {
+        "links": args.links,
+        "body_mib": round(len(body) / 2**20, 1),
+        "peak_mib": {"buffered": round(before_mib, 1), "streamed": round(after_mib, 1)},
+        "seconds": {"buffered": round(before_s, 2), "streamed": round(after_s, 2)},
+    }
+
+    print(json.dumps(report, indent=2))
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
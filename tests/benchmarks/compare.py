@@ -0,0 +1,94 @@
+"""Compare two benchmark result files and flag regressions.
+
+    python compare.py baseline.json candidate.json --threshold 0.10
+
+Exits with status 1 if any scenario's p95/p99 latency grew, or its
+throughput dropped, by more than the threshold.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Optional
+
+# (path into the scenario summary, True if higher is better)
+METRICS: list[tuple[tuple[str, ...], bool]] = [
+    (("latency_ms", "p50"), False),
+    (("latency_ms", "p95"), False),
+    (("latency_ms", "p99"), False),
+    (("throughput_rps",), True),
+    (("error_rate",), False),
+]
+
+GATED = {("latency_ms", "p95"), ("latency_ms", "p99"), ("throughput_rps",)}
+
+
+def _get(summary: dict[str, Any], path: tuple[str, ...]) -> Optional[float]:
+    value: Any = summary
+    for key in path:
+        if not isinstance(value, dict) or key not in value:
+            return None
+        value = value[key]
+    return value
+
+
+def compare(
+    baseline: dict[str, Any], candidate: dict[str, Any], threshold: float
+) -> tuple[list[str], list[str]]:
+    """Return (report lines, regressions)."""
+    lines: list[str] = []
+    regressions: list[str] = []
+
+    for scenario, base_summary in baseline["results"].items():
+        cand_summary = candidate["results"].get(scenario)
+        if cand_summary is None:
+            lines.append(f"{scenario}: missing from candidate")
+            continue
+
+        lines.append(scenario)
+        for path, higher_is_better in METRICS:
+            before, after = _get(base_summary, path), _get(cand_summary, path)
+            name = ".".join(path)
+            if before is None or after is None:
+                lines.append(f"  {name:<16} {before!s:>10} -> {after!s:>10}")
+                continue
+
+            change = (after - before) / before if before else 0.0
+            worse = -change if higher_is_better else change
+            flag = ""
+            if path in GATED and worse > threshold:
+                flag = "  ❌ REGRESSION"
+                regressions.append(f"{scenario} {name}: {before} -> {after} ({change:+.1%})")
+            lines.append(f"  {name:<16} {before:>10} -> {after:>10} ({change:+.1%}){flag}")
+
+    return lines, regressions
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files.")
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=0.10)
+    args = parser.parse_args(argv)
+
+    baseline = json.loads(Path(args.baseline).read_text())
+    candidate = json.loads(Path(args.candidate).read_text())
+
+    if baseline.get("meta", {}).get("dataset") != candidate.get("meta", {}).get("dataset"):
+        print("⚠️  Datasets differ; results may not be comparable\n")
+
+    lines, regressions = compare(baseline, candidate, args.threshold)
+    print("\n".join(lines))
+
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) above {args.threshold:.0%}:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+
+    print("\n✅ No regressions")
+
+
+if __name__ == "__main__":
+    main()
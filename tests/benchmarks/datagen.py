@@ -0,0 +1,420 @@
+"""Synthetic multi-tenant dataset generator for API benchmarks.
+
+Loads tenants, users, memberships, sites, runs, items and invites with
+``COPY ... FROM STDIN`` so that tens of millions of rows load in minutes
+instead of hours of ORM inserts. Row generation is deterministic for a given
+``--seed`` and streamed straight into COPY, so memory stays flat regardless
+of dataset size.
+
+    python datagen.py --tenants 1000 --sites 100000 --items 50000000 --runs 5000000
+
+Writes a manifest (tenant/user/site ids and unused invite tokens) that
+``run.py`` uses to drive the endpoints.
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import sys
+import time
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Optional
+from uuid import UUID
+
+# Add apps/api to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "apps" / "api"))
+
+from app.database import engine  # noqa: E402
+from app.services.partitions import ensure_partitions  # noqa: E402
+from app.services.rollups import backfill  # noqa: E402
+
+BENCH_EMAIL_DOMAIN = "bench.sitewatcher.test"
+PLANS = ("free", "starter", "pro", "enterprise")
+SOURCES = ("feed", "html", "sitemap")
+
+
+class RowStream:
+    """File-like object that feeds generated COPY rows to ``copy_expert``."""
+
+    def __init__(self, rows: Iterator[tuple[Any, ...]]):
+        self.rows = rows
+        self.buffer = bytearray()
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self.buffer) < size:
+            try:
+                row = next(self.rows)
+            except StopIteration:
+                break
+            self.buffer += ("\t".join(_copy_value(v) for v in row) + "\n").encode()
+
+        if size < 0:
+            size = len(self.buffer)
+        chunk = bytes(self.buffer[:size])
+        del self.buffer[:size]
+        return chunk
+
+
+def _copy_value(value: Any) -> str:
+    """Format a value for COPY text format."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ")
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value)
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def _uuid(rng: random.Random) -> UUID:
+    return UUID(int=rng.getrandbits(128), version=4)
+
+
+def invite_token(seed: int, index: int) -> str:
+    """Deterministic invite token, reproducible from the manifest seed."""
+    return hashlib.sha256(f"bench-invite:{seed}:{index}".encode()).hexdigest()
+
+
+class DatasetGenerator:
+    """Generates a skewed multi-tenant dataset.
+
+    Site counts per tenant follow a Zipf-like distribution controlled by
+    ``skew`` so that a few tenants own most sites, like production. Items and
+    runs are spread over sites the same way, with timestamps over ``days``.
+    """
+
+    def __init__(
+        self,
+        tenants: int,
+        sites: int,
+        items: int,
+        runs: int,
+        members_per_tenant: int = 2,
+        invites: int = 1000,
+        days: int = 365,
+        skew: float = 1.1,
+        seed: int = 42,
+    ):
+        self.tenants = tenants
+        self.sites = sites
+        self.items = items
+        self.runs = runs
+        self.members_per_tenant = members_per_tenant
+        self.invites = invites
+        self.days = days
+        self.skew = skew
+        self.seed = seed
+        self.now = datetime.utcnow().replace(microsecond=0)
+
+        rng = random.Random(seed)
+        self.tenant_ids = [_uuid(rng) for _ in range(tenants)]
+        self.admin_ids = [_uuid(rng) for _ in range(tenants)]
+
+        # Distribute sites over tenants (Zipf-like, at least one site each)
+        weights = [1 / (rank + 1) ** skew for rank in range(tenants)]
+        self.sites_per_tenant = _distribute(sites, weights, minimum=1 if sites >= tenants else 0)
+
+        self.site_ids: list[UUID] = []
+        self.site_tenant: list[int] = []
+        for tenant_index, count in enumerate(self.sites_per_tenant):
+            for _ in range(count):
+                self.site_ids.append(_uuid(rng))
+                self.site_tenant.append(tenant_index)
+
+    def _timestamp(self, rng: random.Random) -> datetime:
+        # Skew towards recent timestamps
+        age = rng.random() ** 2 * self.days * 86400
+        return self.now - timedelta(seconds=int(age))
+
+    def tenant_rows(self) -> Iterator[tuple[Any, ...]]:
+        rng = random.Random(self.seed + 1)
+        for index, tenant_id in enumerate(self.tenant_ids):
+            yield (tenant_id, f"Bench Tenant {index}", rng.choice(PLANS), self.now)
+
+    def user_rows(self) -> Iterator[tuple[Any, ...]]:
+        rng = random.Random(self.seed + 2)
+        for index, admin_id in enumerate(self.admin_ids):
+            yield (admin_id, f"admin-{index}@{BENCH_EMAIL_DOMAIN}", f"Bench Admin {index}", self.now)
+            for member in range(self.members_per_tenant):
+                yield (
+                    _uuid(rng),
+                    f"member-{index}-{member}@{BENCH_EMAIL_DOMAIN}",
+                    f"Bench Member {index}.{member}",
+                    self.now,
+                )
+
+    def user_tenant_rows(self) -> Iterator[tuple[Any, ...]]:
+        rng = random.Random(self.seed + 2)
+        for tenant_id, admin_id in zip(self.tenant_ids, self.admin_ids):
+            yield (admin_id, tenant_id, "admin")
+            # Replays the same RNG sequence as user_rows to recover member ids
+            for _ in range(self.members_per_tenant):
+                yield (_uuid(rng), tenant_id, "member")
+
+    def site_rows(self) -> Iterator[tuple[Any, ...]]:
+        rng = random.Random(self.seed + 3)
+        for index, (site_id, tenant_index) in enumerate(zip(self.site_ids, self.site_tenant)):
+            profile_key = "rcmp_fsj" if rng.random() < 0.01 else None
+            yield (
+                site_id,
+                self.tenant_ids[tenant_index],
+                f"https://site-{index}.example.com",
+                profile_key,
+                rng.random() < 0.9,
+                rng.choice((15, 30, 60, 360, 1440)),
+                self._timestamp(rng),
+                self.now - timedelta(days=self.days),
+            )
+
+    def _site_indexes(self, count: int, rng: random.Random) -> Iterator[int]:
+        """Yield site indexes for ``count`` rows, skewed like the site distribution."""
+        if not self.site_ids:
+            return
+        site_weights = [1 / (rank + 1) ** (self.skew / 2) for rank in range(len(self.site_ids))]
+        per_site = _distribute(count, site_weights)
+        order = list(range(len(self.site_ids)))
+        rng.shuffle(order)
+        for site_index, n in zip(order, per_site):
+            for _ in range(n):
+                yield site_index
+
+    def item_rows(self) -> Iterator[tuple[Any, ...]]:
+        rng = random.Random(self.seed + 4)
+        for seq, site_index in enumerate(self._site_indexes(self.items, rng)):
+            url = f"https://site-{site_index}.example.com/posts/{seq}"
+            discovered_at = self._timestamp(rng)
+            yield (
+                _uuid(rng),
+                self.site_ids[site_index],
+                url,
+                url,
+                f"Synthetic post {seq} about topic {rng.randrange(1000)}",
+                discovered_at - timedelta(minutes=rng.randrange(600)),
+                discovered_at,
+                rng.choice(SOURCES),
+                None,
+            )
+
+    def item_key_rows(self) -> Iterator[tuple[Any, ...]]:
+        # Replays item_rows so every item has its dedup key
+        for item_id, site_id, _, canonical_url, _, _, discovered_at, _, _ in self.item_rows():
+            yield (site_id, canonical_url, item_id, discovered_at)
+
+    def run_rows(self) -> Iterator[tuple[Any, ...]]:
+        rng = random.Random(self.seed + 5)
+        for site_index in self._site_indexes(self.runs, rng):
+            started_at = self._timestamp(rng)
+            duration_ms = int(rng.lognormvariate(7, 0.6))
+            failed = rng.random() < 0.05
+            diagnostics = (
+                {"error": "Worker request failed: 502", "status_code": 502}
+                if failed
+                else {"fetched": rng.randrange(1, 50), "parser": "synthetic", "bytes": rng.randrange(10**6)}
+            )
+            yield (
+                _uuid(rng),
+                self.site_ids[site_index],
+                "error" if failed else "success",
+                "discover",
+                0 if failed else rng.randrange(1, 50),
+                duration_ms,
+                diagnostics,
+                started_at,
+                started_at + timedelta(milliseconds=duration_ms),
+            )
+
+    def invite_rows(self) -> Iterator[tuple[Any, ...]]:
+        rng = random.Random(self.seed + 6)
+        for index in range(self.invites):
+            yield (
+                _uuid(rng),
+                f"invitee-{index}@{BENCH_EMAIL_DOMAIN}",
+                self.tenant_ids[index % len(self.tenant_ids)],
+                "member",
+                hashlib.sha256(invite_token(self.seed, index).encode()).hexdigest(),
+                self.now + timedelta(days=7),
+                None,
+                self.now,
+            )
+
+    def manifest(self, sample_sites: int = 20) -> dict[str, Any]:
+        """Ids the benchmark driver needs, without the full dataset."""
+        sites_by_tenant: dict[int, list[str]] = {}
+        for site_id, tenant_index in zip(self.site_ids, self.site_tenant):
+            bucket = sites_by_tenant.setdefault(tenant_index, [])
+            if len(bucket) < sample_sites:
+                bucket.append(str(site_id))
+
+        return {
+            "seed": self.seed,
+            "generated_at": self.now.isoformat(),
+            "counts": {
+                "tenants": self.tenants,
+                "sites": len(self.site_ids),
+                "items": self.items,
+                "runs": self.runs,
+                "invites": self.invites,
+            },
+            "tenants": [
+                {
+                    "tenant_id": str(tenant_id),
+                    "admin_user_id": str(admin_id),
+                    "site_count": self.sites_per_tenant[index],
+                    "site_ids": sites_by_tenant.get(index, []),
+                }
+                for index, (tenant_id, admin_id) in enumerate(zip(self.tenant_ids, self.admin_ids))
+            ],
+            "invite_tokens": [invite_token(self.seed, index) for index in range(self.invites)],
+        }
+
+
+def _distribute(total: int, weights: list[float], minimum: int = 0) -> list[int]:
+    """Split ``total`` into integer parts proportional to ``weights``."""
+    if not weights:
+        return []
+    remaining = total - minimum * len(weights)
+    weight_sum = sum(weights)
+    parts = [minimum + int(remaining * w / weight_sum) for w in weights]
+    # Hand out the rounding remainder to the heaviest buckets
+    for index in range(total - sum(parts)):
+        parts[index % len(parts)] += 1
+    return parts
+
+
+TABLES: list[tuple[str, str, str]] = [
+    ("tenants", "id, name, plan, created_at", "tenant_rows"),
+    ("users", "id, email, name, created_at", "user_rows"),
+    ("user_tenants", "user_id, tenant_id, role", "user_tenant_rows"),
+    (
+        "sites",
+        "id, tenant_id, url, profile_key, enabled, interval_minutes, last_run_at, created_at",
+        "site_rows",
+    ),
+    (
+        "items",
+        "id, site_id, url, canonical_url, title, published_at, discovered_at, source, meta_json",
+        "item_rows",
+    ),
+    ("item_keys", "site_id, canonical_url, item_id, discovered_at", "item_key_rows"),
+    (
+        "runs",
+        "id, site_id, status, method, pages_scanned, duration_ms, diagnostics_json, started_at, finished_at",
+        "run_rows",
+    ),
+    (
+        "invites",
+        "id, email, tenant_id, role, token_hash, expires_at, accepted_at, created_at",
+        "invite_rows",
+    ),
+]
+
+
+def clear_bench_data(cursor: Any) -> None:
+    """Delete previously generated benchmark tenants and everything under them."""
+    tenant_filter = "SELECT id FROM tenants WHERE name LIKE 'Bench Tenant %'"
+    site_filter = f"SELECT id FROM sites WHERE tenant_id IN ({tenant_filter})"
+    cursor.execute(f"DELETE FROM site_daily_stats WHERE site_id IN ({site_filter})")
+    cursor.execute(f"DELETE FROM run_daily_summaries WHERE site_id IN ({site_filter})")
+    cursor.execute(f"DELETE FROM item_keys WHERE site_id IN ({site_filter})")
+    cursor.execute(f"DELETE FROM items WHERE site_id IN ({site_filter})")
+    cursor.execute(f"DELETE FROM runs WHERE site_id IN ({site_filter})")
+    cursor.execute(f"DELETE FROM sites WHERE tenant_id IN ({tenant_filter})")
+    cursor.execute(f"DELETE FROM invites WHERE tenant_id IN ({tenant_filter})")
+    cursor.execute(f"DELETE FROM user_tenants WHERE tenant_id IN ({tenant_filter})")
+    cursor.execute(f"DELETE FROM users WHERE email LIKE '%@{BENCH_EMAIL_DOMAIN}'")
+    cursor.execute("DELETE FROM tenants WHERE name LIKE 'Bench Tenant %'")
+
+
+def load(generator: DatasetGenerator, clear: bool = False, analyze: bool = True) -> dict[str, float]:
+    """COPY every table and return seconds spent per table."""
+    timings: dict[str, float] = {}
+
+    # Monthly partitions covering the generated time range (no-op if unpartitioned)
+    with engine.begin() as sa_conn:
+        ensure_partitions(sa_conn, start=generator.now - timedelta(days=generator.days))
+
+    conn = engine.raw_connection()
+    try:
+        cursor = conn.cursor()
+        if clear:
+            print("🧹 Clearing previous benchmark data...")
+            clear_bench_data(cursor)
+            conn.commit()
+
+        for table, columns, method in TABLES:
+            start = time.perf_counter()
+            stream = RowStream(getattr(generator, method)())
+            cursor.copy_expert(f"COPY {table} ({columns}) FROM STDIN", stream, size=1 << 16)
+            conn.commit()
+            timings[table] = round(time.perf_counter() - start, 3)
+            print(f"✓ {table}: {timings[table]}s")
+
+        # Daily rollups for the generated history (what time-series endpoints read)
+        start = time.perf_counter()
+        with engine.begin() as sa_conn:
+            backfill(
+                sa_conn,
+                (generator.now - timedelta(days=generator.days)).date(),
+                generator.now.date() + timedelta(days=1),
+            )
+        timings["site_daily_stats"] = round(time.perf_counter() - start, 3)
+        print(f"✓ site_daily_stats: {timings['site_daily_stats']}s")
+
+        if analyze:
+            for table, _, _ in TABLES:
+                cursor.execute(f"ANALYZE {table}")
+            conn.commit()
+    finally:
+        conn.close()
+    return timings
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Generate a synthetic benchmark dataset via COPY.")
+    parser.add_argument("--tenants", type=int, default=100)
+    parser.add_argument("--sites", type=int, default=5000)
+    parser.add_argument("--items", type=int, default=500000)
+    parser.add_argument("--runs", type=int, default=50000)
+    parser.add_argument("--members-per-tenant", type=int, default=2)
+    parser.add_argument("--invites", type=int, default=1000)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--skew", type=float, default=1.1)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--clear", action="store_true", help="Delete previous benchmark data first")
+    parser.add_argument("--manifest", default="bench_manifest.json")
+    args = parser.parse_args(argv)
+
+    generator = DatasetGenerator(
+        tenants=args.tenants,
+        sites=args.sites,
+        items=args.items,
+        runs=args.runs,
+        members_per_tenant=args.members_per_tenant,
+        invites=args.invites,
+        days=args.days,
+        skew=args.skew,
+        seed=args.seed,
+    )
+
+    print("🌱 Generating benchmark dataset...")
+    timings = load(generator, clear=args.clear)
+
+    manifest = generator.manifest()
+    manifest["load_seconds"] = timings
+    Path(args.manifest).write_text(json.dumps(manifest, indent=2))
+    print(f"\n✅ Dataset loaded, manifest written to {args.manifest}")
+
+
+if __name__ == "__main__":
+    main()
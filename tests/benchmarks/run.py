@@ -0,0 +1,265 @@
+"""End-to-end API benchmark driver.
+
+Drives API endpoints with concurrent clients against a dataset produced by
+``datagen.py`` and reports latency percentiles and throughput as JSON, so
+results from different releases can be compared with ``compare.py``.
+
+    python run.py --base-url http://localhost:8000 --concurrency 32 --duration 30 \\
+        --scenarios list_items,dashboard_stats --output results.json
+
+``trigger_run`` needs the API pointed at a Worker; use the fake Worker
+(``make fake-worker``) so runs don't hit the real one.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import platform
+import random
+import subprocess
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Optional
+
+import httpx
+
+# Add apps/api to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "apps" / "api"))
+
+from app.utils.auth import create_jwt_token  # noqa: E402
+
+RESULT_FORMAT_VERSION = 1
+
+
+@dataclass
+class ScenarioResult:
+    """Latency samples and error counts for one scenario."""
+
+    latencies_ms: list[float] = field(default_factory=list)
+    errors: int = 0
+    status_codes: dict[str, int] = field(default_factory=dict)
+    duration_s: float = 0.0
+
+    def record(self, status_code: int, elapsed_ms: float) -> None:
+        key = str(status_code)
+        self.status_codes[key] = self.status_codes.get(key, 0) + 1
+        if status_code >= 400:
+            self.errors += 1
+        else:
+            self.latencies_ms.append(elapsed_ms)
+
+    def summary(self) -> dict[str, Any]:
+        latencies = sorted(self.latencies_ms)
+        requests = len(latencies) + self.errors
+        return {
+            "requests": requests,
+            "errors": self.errors,
+            "error_rate": round(self.errors / requests, 4) if requests else 0.0,
+            "status_codes": self.status_codes,
+            "duration_s": round(self.duration_s, 3),
+            "throughput_rps": round(len(latencies) / self.duration_s, 2) if self.duration_s else 0.0,
+            "latency_ms": {
+                "p50": percentile(latencies, 50),
+                "p95": percentile(latencies, 95),
+                "p99": percentile(latencies, 99),
+                "mean": round(sum(latencies) / len(latencies), 3) if latencies else None,
+                "max": round(latencies[-1], 3) if latencies else None,
+            },
+        }
+
+
+def percentile(sorted_values: list[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(math.ceil(pct / 100 * len(sorted_values)) - 1, 0)
+    return round(sorted_values[min(rank, len(sorted_values) - 1)], 3)
+
+
+class Workload:
+    """Builds requests for each scenario from the dataset manifest."""
+
+    def __init__(self, manifest: dict[str, Any], tenant_pick: str = "weighted", seed: int = 0):
+        self.rng = random.Random(seed)
+        self.tenants = [t for t in manifest["tenants"] if t["site_ids"]]
+        self.weights = [t["site_count"] if tenant_pick == "weighted" else 1 for t in self.tenants]
+        self.invite_tokens = list(manifest.get("invite_tokens", []))
+        self.tokens: dict[str, str] = {}
+
+    def pick_tenant(self) -> dict[str, Any]:
+        return self.rng.choices(self.tenants, weights=self.weights)[0]
+
+    def headers(self, tenant: dict[str, Any]) -> dict[str, str]:
+        user_id = tenant["admin_user_id"]
+        if user_id not in self.tokens:
+            self.tokens[user_id] = create_jwt_token(user_id, expires_delta=timedelta(hours=6))
+        return {"Authorization": f"Bearer {self.tokens[user_id]}"}
+
+    async def list_items(self, client: httpx.AsyncClient) -> Optional[httpx.Response]:
+        tenant = self.pick_tenant()
+        site_id = self.rng.choice(tenant["site_ids"])
+        return await client.get(
+            f"/v1/sites/{site_id}/items",
+            params={"limit": 20},
+            headers=self.headers(tenant),
+        )
+
+    async def dashboard_stats(self, client: httpx.AsyncClient) -> Optional[httpx.Response]:
+        tenant = self.pick_tenant()
+        return await client.get(
+            "/v1/dashboard/stats",
+            params={"tenant_id": tenant["tenant_id"]},
+            headers=self.headers(tenant),
+        )
+
+    async def search(self, client: httpx.AsyncClient) -> Optional[httpx.Response]:
+        # datagen titles read "Synthetic post N about topic M"
+        tenant = self.pick_tenant()
+        return await client.get(
+            "/v1/search",
+            params={"q": f"topic {self.rng.randrange(1000)}", "tenant_id": tenant["tenant_id"]},
+            headers=self.headers(tenant),
+        )
+
+    async def trigger_run(self, client: httpx.AsyncClient) -> Optional[httpx.Response]:
+        tenant = self.pick_tenant()
+        site_id = self.rng.choice(tenant["site_ids"])
+        return await client.post(f"/v1/sites/{site_id}/run", headers=self.headers(tenant))
+
+    async def accept_invite(self, client: httpx.AsyncClient) -> Optional[httpx.Response]:
+        # Invite tokens are single-use; the scenario ends when they run out
+        if not self.invite_tokens:
+            return None
+        token = self.invite_tokens.pop()
+        return await client.post("/v1/invites/accept", json={"token": token, "name": "Bench"})
+
+
+SCENARIOS = ("list_items", "dashboard_stats", "search", "trigger_run", "accept_invite")
+
+
+async def run_scenario(
+    base_url: str,
+    request: Callable[[httpx.AsyncClient], Awaitable[Optional[httpx.Response]]],
+    concurrency: int,
+    duration: float,
+    warmup: float,
+    max_requests: Optional[int],
+    timeout: float,
+) -> ScenarioResult:
+    """Run one scenario with ``concurrency`` clients for ``duration`` seconds."""
+    result = ScenarioResult()
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    sent = 0
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=limits) as client:
+        warmup_end = time.perf_counter() + warmup
+        end = warmup_end + duration
+
+        async def client_loop() -> None:
+            nonlocal sent
+            while time.perf_counter() < end:
+                if max_requests is not None and sent >= max_requests:
+                    return
+                sent += 1
+                start = time.perf_counter()
+                try:
+                    response = await request(client)
+                except httpx.HTTPError:
+                    if start >= warmup_end:
+                        result.record(599, 0.0)
+                    continue
+                if response is None:
+                    return
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                if start >= warmup_end:
+                    result.record(response.status_code, elapsed_ms)
+
+        await asyncio.gather(*(client_loop() for _ in range(concurrency)))
+        result.duration_s = max(time.perf_counter() - warmup_end, 0.0)
+
+    return result
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return (
+            subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL)
+            .decode()
+            .strip()
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run_benchmarks(args: argparse.Namespace) -> dict[str, Any]:
+    manifest = json.loads(Path(args.manifest).read_text())
+    workload = Workload(manifest, tenant_pick=args.tenant_pick, seed=args.seed)
+    scenarios = [s.strip() for s in args.scenarios.split(",") if s.strip()]
+
+    results: dict[str, Any] = {}
+    for name in scenarios:
+        if name not in SCENARIOS:
+            raise SystemExit(f"Unknown scenario: {name} (expected one of {', '.join(SCENARIOS)})")
+        print(f"▶ {name}: {args.concurrency} clients for {args.duration}s...")
+        result = await run_scenario(
+            args.base_url,
+            getattr(workload, name),
+            concurrency=args.concurrency,
+            duration=args.duration,
+            warmup=args.warmup,
+            max_requests=args.max_requests,
+            timeout=args.timeout,
+        )
+        results[name] = result.summary()
+        latency = results[name]["latency_ms"]
+        print(
+            f"  {results[name]['throughput_rps']} req/s, "
+            f"p50={latency['p50']}ms p95={latency['p95']}ms p99={latency['p99']}ms, "
+            f"errors={results[name]['errors']}"
+        )
+
+    return {
+        "format_version": RESULT_FORMAT_VERSION,
+        "meta": {
+            "timestamp": datetime.utcnow().isoformat(),
+            "git_revision": _git_revision(),
+            "python": platform.python_version(),
+            "base_url": args.base_url,
+            "concurrency": args.concurrency,
+            "duration_s": args.duration,
+            "warmup_s": args.warmup,
+            "tenant_pick": args.tenant_pick,
+            "dataset": manifest.get("counts", {}),
+            "dataset_seed": manifest.get("seed"),
+        },
+        "results": results,
+    }
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Run API benchmarks against a synthetic dataset.")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--manifest", default="bench_manifest.json")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS))
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--warmup", type=float, default=3.0)
+    parser.add_argument("--max-requests", type=int, default=None)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--tenant-pick", choices=("weighted", "uniform"), default="weighted")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="bench_results.json")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(run_benchmarks(args))
+    Path(args.output).write_text(json.dumps(report, indent=2))
+    print(f"\n✅ Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
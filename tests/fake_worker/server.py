@@ -0,0 +1,294 @@
+"""Local stand-in for the Cloudflare discovery Worker.
+
+Implements ``/discover`` and ``/profiles/rcmp-fsj`` with the same response
+shape as the real Worker (``source``, ``links``, ``feeds``, ``count``,
+``diagnostics``) so API benchmarks and scheduler load tests can run offline.
+
+Behavior is configurable through ``FAKE_WORKER_*`` environment variables,
+command line flags, or at runtime via ``POST /_config``:
+
+    python server.py --port 8787 --latency-dist lognormal --latency-ms 250 \\
+        --links 40 --overlap 0.9 --error-rate 0.02
+
+Point the API at it with ``WORKER_BASE_URL=http://localhost:8787``.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+from collections.abc import AsyncIterator
+from dataclasses import asdict, dataclass, fields
+from typing import Any, Optional
+from urllib.parse import urlparse
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "normal", "lognormal", "exponential")
+
+RCMP_FSJ_HOST = "bc-cb.rcmp-grc.gc.ca"
+
+
+@dataclass
+class FakeWorkerConfig:
+    """Fake Worker behavior."""
+
+    # Latency applied before the response starts
+    latency_dist: str = "fixed"
+    latency_ms: float = 50.0
+    latency_jitter_ms: float = 0.0
+
+    # Links returned per response
+    links: int = 20
+    links_jitter: int = 0
+
+    # Fraction of links carried over from the previous response for the same target
+    overlap: float = 0.8
+
+    # Failure injection
+    error_rate: float = 0.0
+    error_status: int = 502
+    timeout_rate: float = 0.0
+    timeout_ms: float = 60000.0
+
+    # Slow body: stream the JSON in chunks with a delay between them
+    slow_body_rate: float = 0.0
+    slow_body_chunk_bytes: int = 256
+    slow_body_delay_ms: float = 100.0
+
+    # RNG seed for reproducible runs (None = random)
+    seed: Optional[int] = None
+
+    @classmethod
+    def from_env(cls) -> "FakeWorkerConfig":
+        """Build config from FAKE_WORKER_* environment variables."""
+        config = cls()
+        config.update(
+            {
+                f.name: os.environ[f"FAKE_WORKER_{f.name.upper()}"]
+                for f in fields(cls)
+                if f"FAKE_WORKER_{f.name.upper()}" in os.environ
+            }
+        )
+        return config
+
+    def update(self, values: dict[str, Any]) -> None:
+        """Update config in place, coercing values to the field types."""
+        names = {f.name for f in fields(self)}
+        for name, value in values.items():
+            if name not in names:
+                raise ValueError(f"Unknown config field: {name}")
+            if value is None or value == "":
+                setattr(self, name, None if name == "seed" else getattr(type(self)(), name))
+                continue
+            if name == "latency_dist":
+                if value not in LATENCY_DISTRIBUTIONS:
+                    raise ValueError(f"latency_dist must be one of {LATENCY_DISTRIBUTIONS}")
+                setattr(self, name, value)
+            elif name in ("links", "links_jitter", "error_status", "slow_body_chunk_bytes", "seed"):
+                setattr(self, name, int(value))
+            else:
+                setattr(self, name, float(value))
+
+
+class FakeWorker:
+    """Generates Worker responses and tracks per-target state."""
+
+    def __init__(self, config: FakeWorkerConfig):
+        self.config = config
+        self.rng = random.Random(config.seed)
+        self.previous_links: dict[str, list[str]] = {}
+        self.sequence = 0
+        self.stats: dict[str, int] = {
+            "requests": 0,
+            "errors": 0,
+            "timeouts": 0,
+            "slow_bodies": 0,
+        }
+
+    def reconfigure(self, values: dict[str, Any]) -> None:
+        """Apply a partial config update and reset the RNG if seeded."""
+        self.config.update(values)
+        if "seed" in values:
+            self.rng = random.Random(self.config.seed)
+
+    def reset(self) -> None:
+        """Forget previous responses and counters."""
+        self.previous_links.clear()
+        self.sequence = 0
+        for key in self.stats:
+            self.stats[key] = 0
+
+    def sample_latency(self) -> float:
+        """Sample a latency in seconds from the configured distribution."""
+        mean = self.config.latency_ms
+        jitter = self.config.latency_jitter_ms
+        dist = self.config.latency_dist
+
+        if dist == "uniform":
+            value = self.rng.uniform(mean - jitter, mean + jitter)
+        elif dist == "normal":
+            value = self.rng.gauss(mean, jitter)
+        elif dist == "lognormal":
+            # Parameterized so that the median is latency_ms and jitter widens the tail
+            sigma = jitter / mean if mean > 0 else 0.0
+            value = mean * self.rng.lognormvariate(0.0, sigma)
+        elif dist == "exponential":
+            value = self.rng.expovariate(1.0 / mean) if mean > 0 else 0.0
+        else:
+            value = mean
+
+        return max(value, 0.0) / 1000
+
+    def build_links(self, key: str, host: str) -> list[str]:
+        """Build a link list, reusing a fraction of the previous response for this key."""
+        jitter = self.config.links_jitter
+        count = max(self.config.links + self.rng.randint(-jitter, jitter), 0)
+
+        previous = self.previous_links.get(key, [])
+        kept_count = min(int(round(count * self.config.overlap)), len(previous))
+        kept = self.rng.sample(previous, kept_count) if kept_count else []
+
+        fresh = []
+        for _ in range(count - kept_count):
+            self.sequence += 1
+            fresh.append(f"https://{host}/posts/{self.sequence}")
+
+        links = fresh + kept
+        self.previous_links[key] = links
+        return links
+
+    def build_response(self, source: str, key: str, host: str) -> dict[str, Any]:
+        """Build a WorkerResponse-shaped payload."""
+        links = self.build_links(key, host)
+        return {
+            "source": source,
+            "links": links,
+            "feeds": [],
+            "count": len(links),
+            "diagnostics": {
+                "fake": True,
+                "target": key,
+                "sequence": self.sequence,
+            },
+        }
+
+    async def respond(self, source: str, key: str, host: str) -> Response:
+        """Apply latency and failure injection, then return the payload."""
+        self.stats["requests"] += 1
+        await asyncio.sleep(self.sample_latency())
+
+        roll = self.rng.random()
+        if roll < self.config.timeout_rate:
+            self.stats["timeouts"] += 1
+            await asyncio.sleep(self.config.timeout_ms / 1000)
+            return JSONResponse({"error": "fake timeout"}, status_code=504)
+
+        if roll < self.config.timeout_rate + self.config.error_rate:
+            self.stats["errors"] += 1
+            return JSONResponse(
+                {"error": "fake worker error"},
+                status_code=self.config.error_status,
+            )
+
+        payload = self.build_response(source, key, host)
+
+        if self.rng.random() < self.config.slow_body_rate:
+            self.stats["slow_bodies"] += 1
+            return StreamingResponse(
+                self._slow_body(json.dumps(payload).encode()),
+                media_type="application/json",
+            )
+
+        return JSONResponse(payload)
+
+    async def _slow_body(self, body: bytes) -> AsyncIterator[bytes]:
+        """Yield the body in chunks with a delay between them."""
+        size = max(self.config.slow_body_chunk_bytes, 1)
+        for offset in range(0, len(body), size):
+            if offset:
+                await asyncio.sleep(self.config.slow_body_delay_ms / 1000)
+            yield body[offset : offset + size]
+
+
+async def _request_params(request: Request) -> dict[str, Any]:
+    """Merge query params with an optional JSON body (the Worker accepts both)."""
+    params: dict[str, Any] = dict(request.query_params)
+    if request.method == "POST":
+        body = await request.body()
+        if body:
+            try:
+                data = json.loads(body)
+            except ValueError:
+                data = None
+            if isinstance(data, dict):
+                params.update(data)
+    return params
+
+
+def create_app(config: Optional[FakeWorkerConfig] = None) -> FastAPI:
+    """Create the fake Worker application."""
+    worker = FakeWorker(config or FakeWorkerConfig.from_env())
+    app = FastAPI(title="Fake SiteWatcher Worker")
+    app.state.worker = worker
+
+    @app.api_route("/discover", methods=["GET", "POST"])
+    async def discover(request: Request) -> Response:
+        params = await _request_params(request)
+        url = params.get("url")
+        if not url:
+            return JSONResponse({"error": "url is required"}, status_code=400)
+        host = urlparse(url).netloc or "example.com"
+        return await worker.respond("html", f"discover:{url}", host)
+
+    @app.api_route("/profiles/rcmp-fsj", methods=["GET", "POST"])
+    async def rcmp_fsj(request: Request) -> Response:
+        params = await _request_params(request)
+        months_back = params.get("monthsBack", "")
+        return await worker.respond("rcmp_fsj", f"rcmp-fsj:{months_back}", RCMP_FSJ_HOST)
+
+    @app.get("/_config")
+    def get_config() -> dict[str, Any]:
+        return asdict(worker.config)
+
+    @app.post("/_config")
+    async def update_config(request: Request) -> Response:
+        try:
+            worker.reconfigure(await request.json())
+        except (ValueError, TypeError) as e:
+            return JSONResponse({"error": str(e)}, status_code=400)
+        return JSONResponse(asdict(worker.config))
+
+    @app.get("/_stats")
+    def get_stats() -> dict[str, int]:
+        return dict(worker.stats)
+
+    @app.post("/_reset")
+    def reset() -> dict[str, bool]:
+        worker.reset()
+        return {"success": True}
+
+    return app
+
+
+def main() -> None:
+    """Run the fake Worker with uvicorn."""
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    for f in fields(FakeWorkerConfig):
+        parser.add_argument(f"--{f.name.replace('_', '-')}", dest=f.name, default=None)
+    args = vars(parser.parse_args())
+
+    config = FakeWorkerConfig.from_env()
+    config.update({f.name: args[f.name] for f in fields(config) if args[f.name] is not None})
+
+    uvicorn.run(create_app(config), host=args["host"], port=args["port"], log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
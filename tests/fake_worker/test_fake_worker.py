@@ -0,0 +1,81 @@
+"""Tests for the fake Worker server."""
+
+from typing import Any, Dict
+
+import pytest
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from server import FakeWorkerConfig, create_app
+
+
+class WorkerResponse(BaseModel):
+    """Worker response schema (mirrors tests/contracts)."""
+
+    source: str
+    links: list[str] | None = None
+    feeds: list[str] | None = None
+    count: int
+    diagnostics: Dict[str, Any] | None = None
+
+
+@pytest.fixture
+def client() -> TestClient:
+    """Fake Worker with no latency and a fixed seed."""
+    config = FakeWorkerConfig(latency_ms=0, links=10, overlap=0.5, seed=1)
+    return TestClient(create_app(config))
+
+
+def test_discover_matches_worker_schema(client: TestClient) -> None:
+    """GET and POST /discover return the Worker response shape."""
+    response = client.get("/discover", params={"url": "https://example.com"})
+    assert response.status_code == 200
+    data = WorkerResponse(**response.json())
+    assert data.source == "html"
+    assert data.count == 10
+    assert all(link.startswith("https://example.com/") for link in data.links)
+
+    response = client.post("/discover", json={"url": "https://example.com"})
+    assert response.status_code == 200
+    WorkerResponse(**response.json())
+
+
+def test_rcmp_fsj_matches_worker_schema(client: TestClient) -> None:
+    """/profiles/rcmp-fsj returns the Worker response shape."""
+    response = client.post("/profiles/rcmp-fsj", params={"monthsBack": 2})
+    assert response.status_code == 200
+    data = WorkerResponse(**response.json())
+    assert data.source == "rcmp_fsj"
+
+
+def test_overlap_with_previous_response(client: TestClient) -> None:
+    """A configured fraction of links repeats across responses for the same URL."""
+    first = client.get("/discover", params={"url": "https://example.com"}).json()["links"]
+    second = client.get("/discover", params={"url": "https://example.com"}).json()["links"]
+
+    assert len(set(first) & set(second)) == 5
+
+
+def test_error_injection(client: TestClient) -> None:
+    """error_rate=1 makes every request fail with the configured status."""
+    client.post("/_config", json={"error_rate": 1, "error_status": 503})
+
+    response = client.get("/discover", params={"url": "https://example.com"})
+    assert response.status_code == 503
+    assert client.get("/_stats").json()["errors"] == 1
+
+
+def test_slow_body_is_valid_json(client: TestClient) -> None:
+    """Slow bodies are streamed in chunks but still decode to a full response."""
+    client.post("/_config", json={"slow_body_rate": 1, "slow_body_delay_ms": 0})
+
+    response = client.get("/discover", params={"url": "https://example.com"})
+    assert response.status_code == 200
+    WorkerResponse(**response.json())
+    assert client.get("/_stats").json()["slow_bodies"] == 1
+
+
+def test_invalid_config_rejected(client: TestClient) -> None:
+    """Unknown fields and distributions are rejected."""
+    assert client.post("/_config", json={"nope": 1}).status_code == 400
+    assert client.post("/_config", json={"latency_dist": "pareto"}).status_code == 400